@@ -1,6 +1,6 @@
 """Core package initialization."""
 from .mod import Mod, ModStatus
-from .portal import FactorioPortalAPI
+from .portal import FactorioPortalAPI, get_portal
 from .downloader import ModDownloader
 from .checker import ModChecker
 from .mod_list import ModListStore
@@ -32,6 +32,7 @@ __all__ = [
     "Mod",
     "ModStatus",
     "FactorioPortalAPI",
+    "get_portal",
     "ModDownloader",
     "ModChecker",
     "ModListStore",
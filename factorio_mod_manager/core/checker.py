@@ -1,11 +1,12 @@
 """Mod checker and updater."""
 import shutil
+from collections import Counter
 from pathlib import Path
 from typing import Callable, Dict, List, Optional
 from datetime import datetime
 from concurrent.futures import ThreadPoolExecutor, as_completed
 from .mod import Mod, ModStatus
-from .portal import FactorioPortalAPI, PortalAPIError
+from .portal import PortalAPIError, get_portal
 from .downloader import ModDownloader
 from ..utils import parse_mod_info, format_file_size
 
@@ -28,19 +29,31 @@ class ModChecker:
             token: Factorio API token
         """
         self.mods_folder = Path(mods_folder)
-        self.portal = FactorioPortalAPI()
+        self.portal = get_portal()
         self.downloader = ModDownloader(str(self.mods_folder))
         self.mods: Dict[str, Mod] = {}
         self.last_update_check: Optional[datetime] = None
         
         # Callback for progress updates
         self.progress_callback: Optional[Callable] = None
+        # Called with each Mod as scan_mods() finishes resolving it
+        self.mod_ready_callback: Optional[Callable[[Mod], None]] = None
 
     def set_progress_callback(self, callback: Callable) -> None:
         """Set callback for progress updates."""
         self.progress_callback = callback
         self.downloader.set_progress_callback(callback)
 
+    def set_mod_ready_callback(self, callback: Optional[Callable[[Mod], None]]) -> None:
+        """Set callback receiving each mod as soon as scan_mods() has resolved it."""
+        self.mod_ready_callback = callback
+
+    def _mod_ready(self, mod_name: str, mod: Mod) -> None:
+        """Record a resolved mod and hand it to the mod-ready callback."""
+        self.mods[mod_name] = mod
+        if self.mod_ready_callback:
+            self.mod_ready_callback(mod)
+
     def _log_progress(self, message: str) -> None:
         """Log progress message."""
         if self.progress_callback:
@@ -109,9 +122,29 @@ class ModChecker:
             except Exception as e:
                 self._log_progress(f"  ✗ Error parsing {mod_file.name}: {e}")
         
-        # Second pass: fetch portal data in parallel
+        # Overlay mod-list.json enabled states onto Mod objects.
+        # mod-list.json is the canonical source of truth; ZIP extension is used
+        # as the initial fallback when an entry is absent from mod-list.json.
+        try:
+            from .mod_list import ModListStore
+            mod_list_states = ModListStore(self.mods_folder).load()
+            for mod_name, mod in local_mods.items():
+                if mod_name in mod_list_states:
+                    stored = mod_list_states[mod_name]
+                    # Never resurrect a mod whose archive is still a .zip.bak
+                    if stored and getattr(mod, "file_path", None) and str(mod.file_path).endswith(".zip.bak"):
+                        stored = False
+                    mod.enabled = stored
+                # If not in mod-list.json, keep the value derived from the ZIP extension.
+        except Exception as _ml_exc:
+            self._log_progress(f"  ⚠ Could not overlay mod-list.json: {_ml_exc}")
+
+        # Second pass: fetch portal data in parallel; each mod is published
+        # through the mod-ready callback as soon as its fetch completes
         self._log_progress(f"Fetching portal data for {len(local_mods)} mods (parallel)...")
         
+        # An explicit scan/refresh must see the portal's current releases
+        self.portal.clear_mod_cache()
         with ThreadPoolExecutor(max_workers=4) as executor:
             # Submit all portal fetch tasks
             future_to_name = {
@@ -141,8 +174,9 @@ class ModChecker:
                     else:
                         mod.status = ModStatus.UNKNOWN
                     
-                    self.mods[mod_name] = mod
-                    self._log_progress(f"  ✓ {mod} (Downloads: {mod.downloads:,})")
+                    mod.refresh_display()
+                    self._log_progress(f"  ✓ {mod} (Downloads: {mod.downloads_str or 0})")
+                    self._mod_ready(mod_name, mod)
                 
                 except PortalAPIError as e:
                     # Handle specific API errors with user-friendly messages
@@ -158,32 +192,15 @@ class ModChecker:
                         self._log_progress(f"  ✗ {mod_name}: {e.message}")
                     
                     mod.status = ModStatus.UNKNOWN
-                    self.mods[mod_name] = mod
+                    self._mod_ready(mod_name, mod)
                 except Exception as e:
                     self._log_progress(f"  ✗ Error fetching {mod_name}: {e}")
                     mod.status = ModStatus.UNKNOWN
-                    self.mods[mod_name] = mod
+                    self._mod_ready(mod_name, mod)
         
         # Record when we last checked
         self.last_update_check = datetime.now()
 
-        # Final pass: overlay mod-list.json enabled states onto Mod objects.
-        # mod-list.json is the canonical source of truth; ZIP extension is used
-        # as the initial fallback when an entry is absent from mod-list.json.
-        try:
-            from .mod_list import ModListStore
-            mod_list_states = ModListStore(self.mods_folder).load()
-            for mod_name, mod in self.mods.items():
-                if mod_name in mod_list_states:
-                    stored = mod_list_states[mod_name]
-                    # Never resurrect a mod whose archive is still a .zip.bak
-                    if stored and getattr(mod, "file_path", None) and str(mod.file_path).endswith(".zip.bak"):
-                        stored = False
-                    mod.enabled = stored
-                # If not in mod-list.json, keep the value derived from the ZIP extension.
-        except Exception as _ml_exc:
-            self._log_progress(f"  ⚠ Could not overlay mod-list.json: {_ml_exc}")
-
         return self.mods
 
     def check_updates(self, force_refresh: bool = False) -> tuple[Dict[str, Mod], bool]:
@@ -234,6 +251,8 @@ class ModChecker:
         self._log_progress("\nChecking for updates (refreshing from portal)...")
         was_refreshed = True
         
+        # An explicit scan/refresh must see the portal's current releases
+        self.portal.clear_mod_cache()
         # Fetch portal data in parallel
         with ThreadPoolExecutor(max_workers=4) as executor:
             # Submit all portal fetch tasks
@@ -277,6 +296,8 @@ class ModChecker:
                 except Exception as e:
                     mod.status = ModStatus.ERROR
                     self._log_progress(f"  ✗ Error checking {mod_name}: {e}")
+                finally:
+                    mod.refresh_display()
         
         # Update timestamp and report
         self.last_update_check = datetime.now()
@@ -347,6 +368,7 @@ class ModChecker:
             
             mod.file_path = str(self.mods_folder / f"{mod_name}_{mod.latest_version}.zip")
             mod.status = ModStatus.UP_TO_DATE
+            mod.refresh_display()
         else:
             self._log_progress(f"  [{current}/{total}] ✗ Failed to download {mod.name}")
         
@@ -525,10 +547,11 @@ class ModChecker:
         Returns:
             Dictionary with counts
         """
+        counts = Counter(m.status for m in self.mods.values())
         return {
             "total": len(self.mods),
-            "up_to_date": sum(1 for m in self.mods.values() if m.status == ModStatus.UP_TO_DATE),
-            "outdated": sum(1 for m in self.mods.values() if m.status == ModStatus.OUTDATED),
-            "unknown": sum(1 for m in self.mods.values() if m.status == ModStatus.UNKNOWN),
-            "errors": sum(1 for m in self.mods.values() if m.status == ModStatus.ERROR),
+            "up_to_date": counts[ModStatus.UP_TO_DATE],
+            "outdated": counts[ModStatus.OUTDATED],
+            "unknown": counts[ModStatus.UNKNOWN],
+            "errors": counts[ModStatus.ERROR],
         }
\ No newline at end of file
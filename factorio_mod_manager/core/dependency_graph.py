@@ -9,16 +9,20 @@ build_dep_graph()  — recursive graph builder (cycle-safe, depth-capped)
 """
 from __future__ import annotations
 
+from concurrent.futures import Future, ThreadPoolExecutor
 from dataclasses import dataclass, field
 from enum import Enum
 from typing import TYPE_CHECKING, Optional
 
-from .mod import Mod, FACTORIO_EXPANSIONS
+from .mod import Mod, FACTORIO_EXPANSIONS, DEP_STRING_RE
 from .portal import PortalAPIError  # runtime import for except clauses
 
 if TYPE_CHECKING:
     from .portal import FactorioPortalAPI  # type annotation only
 
+# Concurrent portal existence checks per graph node
+_PROBE_WORKERS = 8
+
 
 # ---------------------------------------------------------------------------
 # Enumerations
@@ -59,6 +63,12 @@ class DepNode:
 # Internal helpers
 # ---------------------------------------------------------------------------
 
+_PREFIX_TYPES = {
+    "!": DepType.INCOMPATIBLE,
+    "(?)": DepType.OPTIONAL,
+    "?": DepType.OPTIONAL,
+}
+
 
 def _parse_raw_dep(raw: str) -> tuple[str, DepType, str]:
     """Parse a raw Factorio dep string into (name, DepType, version_constraint).
@@ -73,46 +83,12 @@ def _parse_raw_dep(raw: str) -> tuple[str, DepType, str]:
 
     Returns ("", DepType.REQUIRED, "") for empty/skip strings.
     """
-    raw = raw.strip()
-    if not raw:
-        return ("", DepType.REQUIRED, "")
-
-    dep_type = DepType.REQUIRED
-
-    # Strip prefix markers
-    if raw.startswith("!"):
-        dep_type = DepType.INCOMPATIBLE
-        raw = raw[1:].strip()
-    elif raw.startswith("(?)"):
-        dep_type = DepType.OPTIONAL
-        raw = raw[3:].strip()
-    elif raw.startswith("?"):
-        dep_type = DepType.OPTIONAL
-        raw = raw[1:].strip()
-
-    # Split name from version constraint
-    # Name is the first token; everything after is the version constraint
-    parts = raw.split(None, 1)  # split on first whitespace
-    if not parts:
-        return ("", DepType.REQUIRED, "")
-
-    name = parts[0]
-    # Further strip in case name still has version characters attached
-    # (shouldn't happen with proper raw strings but guard defensively)
-    for sep in (">=", "<=", ">", "<", "=", "!="):
-        if sep in name:
-            idx = name.index(sep)
-            constraint_prefix = name[idx:]
-            name = name[:idx].strip()
-            extra = parts[1] if len(parts) > 1 else ""
-            version_constraint = (constraint_prefix + " " + extra).strip()
-            break
-    else:
-        version_constraint = parts[1].strip() if len(parts) > 1 else ""
-
+    prefix, name, version_constraint = DEP_STRING_RE.match(raw.strip()).groups()
     if not name or name == "base":
         return ("", DepType.REQUIRED, "")
 
+    dep_type = _PREFIX_TYPES.get(prefix, DepType.REQUIRED)
+
     # Override to EXPANSION if name is a known Factorio expansion
     if dep_type == DepType.REQUIRED and name in FACTORIO_EXPANSIONS:
         dep_type = DepType.EXPANSION
@@ -189,11 +165,24 @@ def build_dep_graph(
     # Mark root as visited BEFORE processing its children (cycle detection)
     _visited.add(root_name)
 
-    raw_strings = _get_dep_strings(root_name, installed_mods, portal)
+    parsed = [_parse_raw_dep(raw) for raw in _get_dep_strings(root_name, installed_mods, portal)]
     nodes: list[DepNode] = []
 
-    for raw in raw_strings:
-        name, dep_type, version_constraint = _parse_raw_dep(raw)
+    # Portal existence checks for not-installed deps are started together up
+    # front, so a node with many of them costs one round-trip instead of one each
+    probes: dict[str, Future] = {}
+    if full and _depth < 2:
+        to_probe = [
+            name for name, dep_type, _ in parsed
+            if name and name != "base" and name not in installed_mods
+            and name not in _visited
+            and dep_type not in (DepType.EXPANSION, DepType.INCOMPATIBLE)
+        ]
+        if to_probe:
+            with ThreadPoolExecutor(max_workers=min(_PROBE_WORKERS, len(to_probe))) as pool:
+                probes = {name: pool.submit(portal.get_mod, name) for name in dict.fromkeys(to_probe)}
+
+    for name, dep_type, version_constraint in parsed:
         if not name or name == "base":
             continue
 
@@ -246,9 +235,9 @@ def build_dep_graph(
                 state = DepState.PORTAL_ONLY
                 children = []
             else:
-                # Try portal to confirm existence
+                # Portal probe (started above) confirms existence
                 try:
-                    portal.get_mod(name)
+                    probes[name].result()
                     state = DepState.PORTAL_ONLY
                     children = []
                 except PortalAPIError as exc:
@@ -7,9 +7,16 @@ from typing import Callable, Dict, List, Optional, Set
 from concurrent.futures import ThreadPoolExecutor, as_completed
 import requests
 from .mod import Mod
-from .portal import FactorioPortalAPI
+from .portal import get_portal
 from ..utils import format_file_size
 
+# Concurrent portal lookups per dependency-tree level
+_RESOLVE_WORKERS = 8
+
+# Read size for mod downloads. Pause/cancel are checked once per chunk, so this
+# stays small enough (~5ms on a fast link) to keep them responsive.
+_DOWNLOAD_CHUNK_SIZE = 256 * 1024
+
 
 class ModDownloader:
     """Download mods with automatic dependency resolution."""
@@ -32,7 +39,7 @@ class ModDownloader:
         """
         self.mods_folder = Path(mods_folder)
         self.mods_folder.mkdir(parents=True, exist_ok=True)
-        self.portal = FactorioPortalAPI()
+        self.portal = get_portal()
         self.max_workers = max_workers
         self.session = requests.Session()
 
@@ -123,7 +130,11 @@ class ModDownloader:
         visited: Optional[Set[str]] = None,
     ) -> tuple[Dict[str, Mod], List[str], List[str]]:
         """
-        Recursively resolve all dependencies for a mod.
+        Resolve all dependencies for a mod, transitively.
+
+        The tree is walked one level at a time and each level's portal lookups
+        run concurrently, so resolving N mods costs roughly one round-trip per
+        tree level rather than one per mod.
         
         Args:
             mod_name: Name of the mod
@@ -143,43 +154,44 @@ class ModDownloader:
         dependencies = {}
         incompatibilities = []
         expansions = []
-        
-        self._log_progress(f"Resolving dependencies for {mod_name}...")
-        
-        try:
-            mod = self.portal.parse_mod_from_portal(mod_name)
-            if not mod:
-                self._log_progress(f"Error: Could not find mod {mod_name}")
-                return {}, [], []
-            
-            dependencies[mod_name] = mod
-            
-            # Add incompatible mods to warning list
-            if mod.incompatible_dependencies:
-                incompatibilities.extend(mod.incompatible_dependencies)
-            
-            # Add expansion requirements
-            if mod.expansion_dependencies:
-                expansions.extend(mod.expansion_dependencies)
-            
-            # Get dependencies to resolve
-            all_deps = mod.dependencies.copy()
-            if include_optional:
-                all_deps.extend(mod.optional_dependencies)
-            
-            # Recursively resolve each dependency
-            for dep_name in all_deps:
-                dep_mods, dep_incompats, dep_expansions = self.resolve_dependencies(
-                    dep_name,
-                    include_optional=include_optional,
-                    visited=visited,
-                )
-                dependencies.update(dep_mods)
-                incompatibilities.extend(dep_incompats)
-                expansions.extend(dep_expansions)
-        
-        except Exception as e:
-            self._log_progress(f"Error resolving dependencies for {mod_name}: {e}")
+
+        level = [mod_name]
+        with ThreadPoolExecutor(max_workers=_RESOLVE_WORKERS) as executor:
+            while level:
+                for name in level:
+                    self._log_progress(f"Resolving dependencies for {name}...")
+                futures = [executor.submit(self.portal.parse_mod_from_portal, name) for name in level]
+
+                next_level = []
+                for name, future in zip(level, futures):
+                    try:
+                        mod = future.result()
+                    except Exception as e:
+                        self._log_progress(f"Error resolving dependencies for {name}: {e}")
+                        continue
+                    if not mod:
+                        self._log_progress(f"Error: Could not find mod {name}")
+                        continue
+
+                    dependencies[name] = mod
+
+                    # Add incompatible mods to warning list
+                    if mod.incompatible_dependencies:
+                        incompatibilities.extend(mod.incompatible_dependencies)
+
+                    # Add expansion requirements
+                    if mod.expansion_dependencies:
+                        expansions.extend(mod.expansion_dependencies)
+
+                    # Queue dependencies not seen yet for the next level
+                    all_deps = mod.dependencies.copy()
+                    if include_optional:
+                        all_deps.extend(mod.optional_dependencies)
+                    for dep_name in all_deps:
+                        if dep_name not in visited:
+                            visited.add(dep_name)
+                            next_level.append(dep_name)
+                level = next_level
         
         return dependencies, incompatibilities, expansions
 
@@ -240,7 +252,7 @@ class ModDownloader:
             self._log_progress(f"  Downloading from mirror: {mirror_url}")
             
             # Download with streaming to handle large files
-            response = requests.get(mirror_url, timeout=60, stream=True)
+            response = self.session.get(mirror_url, timeout=60, stream=True)
             
             if response.status_code == 404:
                 self._log_progress("  ✗ Mod not found on mirror (404)")
@@ -257,10 +269,10 @@ class ModDownloader:
             
             # Download to output path
             downloaded_size = 0
-            chunk_size = 8192
+            next_log_pct = 25
             _cancelled = False
             with open(output_path, 'wb') as f:
-                for chunk in response.iter_content(chunk_size=chunk_size):
+                for chunk in response.iter_content(chunk_size=_DOWNLOAD_CHUNK_SIZE):
                     # Cooperative pause: block until resumed
                     while self._pause_event.is_set():
                         if self._cancel_event.is_set():
@@ -278,10 +290,12 @@ class ModDownloader:
                         if self.file_progress_callback and total_size > 0:
                             self.file_progress_callback(downloaded_size, total_size)
 
-                        # Log progress for large files
-                        if total_size > 0 and downloaded_size % (chunk_size * 100) == 0:
+                        # Log progress at quarter boundaries only
+                        if total_size > 0 and next_log_pct < 100:
                             progress_pct = (downloaded_size / total_size) * 100
-                            self._log_progress(f"    Progress: {progress_pct:.1f}%")
+                            if progress_pct >= next_log_pct:
+                                self._log_progress(f"    Progress: {progress_pct:.1f}%")
+                                next_log_pct = (int(progress_pct) // 25 + 1) * 25
 
             if _cancelled:
                 self._log_progress("  ⚠ Download cancelled")
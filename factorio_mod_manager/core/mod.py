@@ -1,4 +1,5 @@
 """Mod data model."""
+import re
 from dataclasses import dataclass, field
 from datetime import datetime
 from typing import List, Optional, Dict, Any
@@ -22,6 +23,11 @@ FACTORIO_EXPANSIONS = {
     "elevated-rails",
 }
 
+# A raw info.json dependency string ("? name >= 1.2") read in one pass as
+# (prefix marker, mod name, version constraint). The name ends at the first
+# whitespace or comparison character, so "name>=1.0" splits off too.
+DEP_STRING_RE = re.compile(r"(!|\(\?\)|\?)?\s*([^\s<>=!]*)\s*(.*)", re.DOTALL)
+
 
 @dataclass
 class Mod:
@@ -48,10 +54,28 @@ class Mod:
     enabled: bool = True
     raw_data: Dict[str, Any] = field(default_factory=dict)
 
+    # Display strings cached by refresh_display() so list refreshes don't reformat
+    downloads_str: str = field(default="", init=False, repr=False, compare=False)
+    version_str: str = field(default="", init=False, repr=False, compare=False)
+    display_title: str = field(default="", init=False, repr=False, compare=False)
+    zip_name: str = field(default="", init=False, repr=False, compare=False)
+
     def __post_init__(self):
         """Post initialization."""
         if not self.url and self.name:
             self.url = f"https://mods.factorio.com/mod/{self.name}"
+        self.display_title = self.title or self.name
+        self.refresh_display()
+
+    def refresh_display(self) -> None:
+        """Recompute cached display strings and zip_name after version/status/downloads change."""
+        self.downloads_str = f"{self.downloads:,}" if self.downloads else ""
+        self.zip_name = f"{self.name}_{self.version}.zip"
+        installed = self.version or "?"
+        if self.status == ModStatus.OUTDATED:
+            self.version_str = f"{installed} → {self.latest_version or '?'}"
+        else:
+            self.version_str = installed
 
     @property
     def is_outdated(self) -> bool:
@@ -1,9 +1,32 @@
 """Factorio Mod Portal API integration."""
 import re
+import threading
+import time
+from collections import OrderedDict
 from typing import Dict, List, Optional, Any, Tuple
 import requests # type: ignore
-from bs4 import BeautifulSoup # type: ignore
-from .mod import Mod, FACTORIO_EXPANSIONS
+from requests.adapters import HTTPAdapter # type: ignore
+from bs4 import BeautifulSoup, SoupStrainer # type: ignore
+from .mod import Mod, FACTORIO_EXPANSIONS, DEP_STRING_RE
+
+
+# Changelog pages are parsed for <pre> blocks only; the strainer makes the
+# parser skip building nodes for the rest of the page. It matches on the tag
+# name alone: a class_ filter here compares the whole class attribute, so a
+# block with an extra class would be dropped. find_all() filters the class.
+_CHANGELOG_STRAINER = SoupStrainer('pre')
+_CHANGELOG_VERSION_RE = re.compile(r'^\s*Version:\s*(\d+\.\d+\.\d+)')
+
+# Keep-alive connections held per host. The shared client is used by the
+# checker's and downloader's thread pools at once, and requests' default of 10
+# would drop (and later re-handshake) connections beyond that.
+_POOL_MAXSIZE = 32
+
+# get_mod responses are reused for this long; the checker clears the cache
+# whenever the user scans or force-checks for updates.
+_MOD_CACHE_TTL_S = 300.0
+_MOD_CACHE_MAX = 512
+_monotonic = time.monotonic  # cache clock; tests patch this, not time itself
 
 
 class PortalAPIError(Exception):
@@ -33,10 +56,43 @@ class FactorioPortalAPI:
     def __init__(self):
         """Initialize portal API client."""
         self.session = requests.Session()
+        adapter = HTTPAdapter(pool_maxsize=_POOL_MAXSIZE)
+        self.session.mount("https://", adapter)
+        self.session.mount("http://", adapter)
+        self._mod_cache: "OrderedDict[str, Tuple[float, Dict[str, Any]]]" = OrderedDict()
+        self._mod_cache_lock = threading.Lock()
+
+    def clear_mod_cache(self) -> None:
+        """Forget every cached get_mod response."""
+        with self._mod_cache_lock:
+            self._mod_cache.clear()
+
+    def _cached_mod(self, mod_name: str) -> Optional[Dict[str, Any]]:
+        """Return the cached response for *mod_name*, or None if missing/expired."""
+        with self._mod_cache_lock:
+            entry = self._mod_cache.get(mod_name)
+            if entry is None:
+                return None
+            if _monotonic() - entry[0] >= _MOD_CACHE_TTL_S:
+                del self._mod_cache[mod_name]
+                return None
+            self._mod_cache.move_to_end(mod_name)
+            return entry[1]
+
+    def _store_mod(self, mod_name: str, data: Dict[str, Any]) -> None:
+        """Cache *data* for *mod_name*, evicting the least recently used entries."""
+        with self._mod_cache_lock:
+            self._mod_cache[mod_name] = (_monotonic(), data)
+            self._mod_cache.move_to_end(mod_name)
+            while len(self._mod_cache) > _MOD_CACHE_MAX:
+                self._mod_cache.popitem(last=False)
 
     def get_mod(self, mod_name: str) -> Optional[Dict[str, Any]]:
         """
         Get mod information from the portal.
+
+        Successful responses are cached for a few minutes, so resolving the
+        same mod again (e.g. as a shared dependency) costs no round-trip.
         
         Args:
             mod_name: Name of the mod
@@ -47,6 +103,9 @@ class FactorioPortalAPI:
         Raises:
             PortalAPIError: With specific error type (offline, not_found, server_error, timeout)
         """
+        cached = self._cached_mod(mod_name)
+        if cached is not None:
+            return cached
         try:
             # Use /full endpoint to get complete info including full info_json with dependencies
             response = self.session.get(
@@ -54,7 +113,9 @@ class FactorioPortalAPI:
                 timeout=10
             )
             if response.status_code == 200:
-                return response.json()
+                data = response.json()
+                self._store_mod(mod_name, data)
+                return data
             elif response.status_code == 404:
                 raise PortalAPIError(
                     f"Mod '{mod_name}' not found on the portal",
@@ -158,35 +219,18 @@ class FactorioPortalAPI:
                 
                 # Dependencies are in info_json.dependencies as strings
                 for dep in info_json.get("dependencies", []):
-                    dep = dep.strip()
-                    
-                    if not dep or dep == "base" or dep.startswith("base "):
+                    prefix, dep_name, _constraint = DEP_STRING_RE.match(dep.strip()).groups()
+                    if not dep_name or dep_name == "base":
                         continue
-                    
-                    # Parse dependency format
-                    if dep.startswith("!"):
-                        # Incompatible dependency
-                        dep_name = dep[1:].strip()
+
+                    if prefix == "!":
                         incompatible_dependencies.append(dep_name)
-                    elif dep.startswith("(?)") or dep.startswith("?"):
-                        # Optional dependency - remove prefix and constraints
-                        dep_name = dep.replace("(?)", "").replace("?", "").strip()
-                        # Extract just the mod name (before version constraint)
-                        dep_name = dep_name.split()[0] if " " in dep_name else dep_name.split(">")[0].split("=")[0].split("<")[0].split("!")[0].strip()
-                        # Check if it's an expansion
-                        if dep_name in FACTORIO_EXPANSIONS:
-                            expansion_dependencies.append(dep_name)
-                        elif dep_name:
-                            optional_dependencies.append(dep_name)
+                    elif dep_name in FACTORIO_EXPANSIONS:
+                        expansion_dependencies.append(dep_name)
+                    elif prefix:
+                        optional_dependencies.append(dep_name)
                     else:
-                        # Required dependency - extract mod name
-                        dep_name = dep.split()[0] if " " in dep else dep.split(">")[0].split("=")[0].split("<")[0].strip()
-                        if dep_name and dep_name != "base":
-                            # Check if it's an expansion
-                            if dep_name in FACTORIO_EXPANSIONS:
-                                expansion_dependencies.append(dep_name)
-                            else:
-                                dependencies.append(dep_name)
+                        dependencies.append(dep_name)
             
             return dependencies, optional_dependencies, incompatible_dependencies, expansion_dependencies
         except PortalAPIError:
@@ -406,7 +450,9 @@ class FactorioPortalAPI:
                     f"Failed to fetch changelog for {mod_name}: HTTP {response.status_code}"
                 )
 
-            soup = BeautifulSoup(response.text, 'html.parser')
+            soup = BeautifulSoup(
+                response.text, 'html.parser', parse_only=_CHANGELOG_STRAINER
+            )
             changelog_data = {}
 
             # Find all pre tags with class 'panel-hole-combined'
@@ -419,7 +465,7 @@ class FactorioPortalAPI:
                 # Extract version number from first line
                 # Format: "Version: X.Y.Z"
                 first_line = changelog_text.split('\n')[0]
-                version_match = re.match(r'^\s*Version:\s*(\d+\.\d+\.\d+)', first_line)
+                version_match = _CHANGELOG_VERSION_RE.match(first_line)
 
                 if version_match:
                     version = version_match.group(1)
@@ -433,4 +479,26 @@ class FactorioPortalAPI:
         except PortalAPIError:
             raise
         except Exception as e:
-            raise PortalAPIError(f"Error fetching changelog for {mod_name}: {e}") from e
\ No newline at end of file
+            raise PortalAPIError(f"Error fetching changelog for {mod_name}: {e}") from e
+
+
+_portal_instance: Optional[FactorioPortalAPI] = None
+_portal_lock = threading.Lock()
+
+
+def get_portal() -> FactorioPortalAPI:
+    """
+    Return the process-wide shared portal client.
+
+    Reusing one instance keeps a single requests.Session, so HTTP keep-alive
+    connections to the portal survive across dialogs and workers.
+
+    Returns:
+        The lazily created FactorioPortalAPI singleton
+    """
+    global _portal_instance
+    if _portal_instance is None:
+        with _portal_lock:
+            if _portal_instance is None:
+                _portal_instance = FactorioPortalAPI()
+    return _portal_instance
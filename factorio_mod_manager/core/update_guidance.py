@@ -41,16 +41,6 @@ class GuidanceResult:
 _TOKEN_RE = re.compile(r"[\s>=<!]")
 
 
-def _extract_name(raw_dep: str) -> str:
-    """Extract the mod name from a raw dep string, stripping prefix markers."""
-    s = raw_dep.strip().lstrip("!?()")
-    s = s.strip()
-    m = _TOKEN_RE.search(s)
-    if m:
-        return s[: m.start()]
-    return s
-
-
 def _parse_classifier_deps(
     dep_strings: list[str],
 ) -> tuple[dict[str, str], dict[str, str], set[str], set[str]]:
@@ -1,8 +1,26 @@
 """Business logic for checker tab - thread operations separated from UI."""
-from typing import Callable, List, Dict
+import os
+import stat
+import sys
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import Callable, List, Dict, Optional
 from ..core import ModChecker, Mod
 from ..core.update_guidance import UpdateGuidanceClassifier, GuidanceResult, UpdateClassification
 
+# Upper bound on concurrent unlinks/copies for bulk delete and backup
+_MAX_FILE_OP_WORKERS = 8
+
+
+def _file_op_workers(count: int) -> int:
+    """Worker count for *count* file operations (at least one)."""
+    return max(1, min(_MAX_FILE_OP_WORKERS, count))
+
+
+def _retry_writable(func: Callable, path: str, _exc) -> None:
+    """rmtree error hook: clear a read-only bit (Windows) and retry once."""
+    os.chmod(path, stat.S_IWRITE)
+    func(path)
+
 
 class CheckerLogic:
     """Encapsulates all checker business logic and thread operations."""
@@ -18,8 +36,12 @@ class CheckerLogic:
         self.checker = checker
         self.logger = logger
 
-    def scan_mods(self) -> Dict[str, Mod]:
-        """Scan mods folder and fetch portal data."""
+    def scan_mods(self, on_mod_ready: Optional[Callable[[Mod], None]] = None) -> Dict[str, Mod]:
+        """Scan mods folder and fetch portal data.
+
+        *on_mod_ready*, if given, receives each mod as soon as it is resolved.
+        """
+        self.checker.set_mod_ready_callback(on_mod_ready)
         try:
             mods = self.checker.scan_mods()
             self.logger(f"[SCAN] ✓ Complete! Found {len(mods)} mod(s)", "success")
@@ -27,6 +49,8 @@ class CheckerLogic:
         except Exception as e:
             self.logger(f"[SCAN] ✗ Error: {e}", "error")
             raise
+        finally:
+            self.checker.set_mod_ready_callback(None)
 
     def check_updates(self, force_refresh: bool = False) -> tuple[Dict[str, Mod], bool]:
         """
@@ -106,35 +130,45 @@ class CheckerLogic:
         """
         Delete multiple mods by removing their zip files.
 
+        Unlinks run concurrently (file deletion is IO-bound); progress is
+        logged from this thread as each one finishes.
+
         Returns:
             Tuple of (deleted_list, failed_list)
         """
-        from pathlib import Path
+        def _delete_one(mod_name: str) -> Optional[str]:
+            """Delete one mod's zip; returns a failure reason, or None on success."""
+            mod = self.checker.mods.get(mod_name)
+            if not mod:
+                return "not found"
+            mod_file = os.path.join(mods_folder, mod.zip_name)
+            if not os.path.isfile(mod_file):
+                return "file not found"
+            os.unlink(mod_file)
+            return None
 
         try:
             deleted = []
             failed = []
-
-            for i, mod_name in enumerate(mod_names, 1):
-                try:
-                    mod = self.checker.mods.get(mod_name)
-                    if not mod:
-                        failed.append(f"{mod_name} (not found)")
+            total = len(mod_names)
+
+            with ThreadPoolExecutor(max_workers=_file_op_workers(total)) as pool:
+                futures = {pool.submit(_delete_one, name): name for name in mod_names}
+                for i, future in enumerate(as_completed(futures), 1):
+                    mod_name = futures[future]
+                    try:
+                        reason = future.result()
+                    except Exception as e:
+                        failed.append(f"{mod_name} ({str(e)})")
+                        self.logger(f"  [{i}/{total}] ✗ Error: {mod_name} - {e}", "error")
                         continue
-
-                    mod_file = Path(mods_folder) / f"{mod.name}_{mod.version}.zip"
-
-                    if mod_file.exists():
-                        mod_file.unlink()
+                    if reason is None:
                         deleted.append(mod_name)
-                        self.logger(f"  [{i}/{len(mod_names)}] ✓ Deleted {mod_name}", "success")
+                        self.logger(f"  [{i}/{total}] ✓ Deleted {mod_name}", "success")
                     else:
-                        failed.append(f"{mod_name} (file not found)")
-                        self.logger(f"  [{i}/{len(mod_names)}] ✗ File not found: {mod_name}", "error")
-
-                except Exception as e:
-                    failed.append(f"{mod_name} ({str(e)})")
-                    self.logger(f"  [{i}/{len(mod_names)}] ✗ Error: {mod_name} - {e}", "error")
+                        failed.append(f"{mod_name} ({reason})")
+                        if reason == "file not found":
+                            self.logger(f"  [{i}/{total}] ✗ File not found: {mod_name}", "error")
 
             # Remove from checker's mods dict
             for name in deleted:
@@ -150,6 +184,66 @@ class CheckerLogic:
             self.logger(f"[DELETE] ✗ Error: {e}", "error")
             raise
 
+    def backup_mods(self, mod_names: List[str], mods_folder: str) -> tuple[List[str], List[str]]:
+        """
+        Copy mods' zip files into the mods folder's backup/ subfolder.
+
+        Copies run concurrently, like delete_mods(). Backups are named
+        ``<zip stem>_<timestamp>.zip``, matching the automatic pre-update
+        backups.
+
+        Returns:
+            Tuple of (backed_up_list, failed_list)
+        """
+        from pathlib import Path
+        from datetime import datetime
+        import shutil
+
+        backup_folder = Path(mods_folder) / "backup"
+        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+
+        def _backup_one(mod_name: str) -> Optional[str]:
+            """Copy one mod's zip; returns a failure reason, or None on success."""
+            mod = self.checker.mods.get(mod_name)
+            if not mod or not mod.file_path:
+                return "not found"
+            source = Path(mod.file_path)
+            if not source.exists():
+                return "file not found"
+            shutil.copy2(source, backup_folder / f"{source.stem}_{timestamp}.zip")
+            return None
+
+        try:
+            backup_folder.mkdir(exist_ok=True)
+            backed_up = []
+            failed = []
+            total = len(mod_names)
+
+            with ThreadPoolExecutor(max_workers=_file_op_workers(total)) as pool:
+                futures = {pool.submit(_backup_one, name): name for name in mod_names}
+                for i, future in enumerate(as_completed(futures), 1):
+                    mod_name = futures[future]
+                    try:
+                        reason = future.result()
+                    except Exception as e:
+                        reason = str(e)
+                    if reason is None:
+                        backed_up.append(mod_name)
+                        self.logger(f"  [{i}/{total}] ✓ Backed up {mod_name}", "success")
+                    else:
+                        failed.append(f"{mod_name} ({reason})")
+                        self.logger(f"  [{i}/{total}] ✗ {mod_name} - {reason}", "error")
+
+            self.logger(f"[BACKUP] ✓ Complete! Backed up {len(backed_up)} mod(s)", "success")
+            if failed:
+                self.logger(f"[BACKUP] ✗ Failed: {len(failed)} mod(s)", "error")
+
+            return backed_up, failed
+
+        except Exception as e:
+            self.logger(f"[BACKUP] ✗ Error: {e}", "error")
+            raise
+
     def enable_mod(self, mod_name: str) -> None:
         """Re-enable a mod by renaming .zip.bak -> .zip and marking enabled in mod-list.json."""
         from pathlib import Path
@@ -198,15 +292,20 @@ class CheckerLogic:
         mod.enabled = False
         self.logger(f"[DISABLE] {mod_name} disabled (renamed to .zip.bak)", "info")
 
-    def clean_backups(self, backup_folder: str) -> float:
+    def clean_backups(self, backup_folder: str, folder_size: Optional[int] = None) -> float:
         """
         Delete backup folder and return freed space in MB.
 
+        Args:
+            backup_folder: The backup folder to remove
+            folder_size: Its size in bytes, if the caller already measured it
+
         Returns:
             Size freed in MB
         """
         from pathlib import Path
         import shutil
+        from ..utils import dir_size
 
         try:
             backup_path = Path(backup_folder)
@@ -216,11 +315,15 @@ class CheckerLogic:
                 return 0.0
 
             # Calculate folder size before deletion
-            folder_size = sum(f.stat().st_size for f in backup_path.rglob("*") if f.is_file())
+            if folder_size is None:
+                folder_size = dir_size(backup_path)
             folder_size_mb = folder_size / (1024 * 1024)
 
-            # Delete folder and contents
-            shutil.rmtree(backup_path)
+            # Delete folder and contents; read-only files are made writable and retried
+            if sys.version_info >= (3, 12):
+                shutil.rmtree(backup_path, onexc=_retry_writable)
+            else:
+                shutil.rmtree(backup_path, onerror=_retry_writable)
 
             self.logger(f"[CLEANUP] ✓ Complete! Deleted backup folder, freed {folder_size_mb:.2f} MB", "success")
 
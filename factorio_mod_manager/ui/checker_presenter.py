@@ -1,7 +1,14 @@
 """Data presentation and filtering for checker tab - separated from UI logic."""
-from typing import Dict, List
+import re
+from collections import Counter
+from datetime import datetime
+from operator import itemgetter
+from typing import Dict, List, Optional
 from ..core import Mod, ModStatus
 
+# Index of each non-name sort field within a filter_row() tuple
+_SORT_FIELDS = {"version": 3, "downloads": 4, "date": 5}
+
 
 class CheckerPresenter:
     """Handles data filtering, sorting, and formatting for display."""
@@ -19,71 +26,108 @@ class CheckerPresenter:
         """Get display text and color for a mod status."""
         return CheckerPresenter.STATUS_COLORS.get(status, ("❓ Unknown", "#b0b0b0"))
     
+    @staticmethod
+    def search_text(mod: Mod) -> str:
+        """Lowercased name/title/author haystack matched by the text search."""
+        return f"{mod.name}\x00{mod.title or ''}\x00{mod.author}".lower()
+
+    @staticmethod
+    def filter_row(mod_name: str, mod: Mod) -> tuple:
+        """Flat (name, haystack, status, version, downloads, date) row for filter_mods."""
+        return (
+            mod_name,
+            CheckerPresenter.search_text(mod),
+            mod.status,
+            mod.version,
+            mod.downloads or 0,
+            mod.release_date or datetime.min,
+        )
+
+    @staticmethod
+    def build_filter_rows(mods: Dict[str, Mod], ordered_names: List[str]) -> List[tuple]:
+        """Precompute filter rows in ordered_names order; rebuild whenever mod data changes."""
+        filter_row = CheckerPresenter.filter_row
+        return [filter_row(name, mods[name]) for name in ordered_names if name in mods]
+
     @staticmethod
     def filter_mods(
         mods: Dict[str, Mod],
         search_query: str,
         filter_mode: str,
         selected_mods: set,
-        sort_by: str
+        sort_by: str,
+        filter_rows: Optional[List[tuple]] = None,
     ) -> List[tuple[str, Mod]]:
         """
         Filter and sort mods based on criteria.
         
         Args:
             mods: Dictionary of all mods
-            search_query: Text search (mod name, title, author)
+            search_query: Text search (mod name, title, author); whitespace-separated
+                tokens must all match, in any order
             filter_mode: "all", "outdated", "up_to_date", or "selected"
             selected_mods: Set of selected mod names
             sort_by: "name", "version", "downloads", or "date"
+            filter_rows: Optional rows from build_filter_rows(), already in
+                case-insensitive name order; built on the fly when omitted
         
         Returns:
             List of (mod_name, mod) tuples, filtered and sorted
         """
-        query = search_query.lower()
-        filtered = []
+        if filter_rows is None:
+            filter_rows = CheckerPresenter.build_filter_rows(
+                mods, sorted(mods, key=str.lower)
+            )
+        # One token is a plain substring test; several must each appear, in
+        # any order, which one compiled lookahead pattern checks per mod. Each
+        # lookahead scans the whole string (DOTALL), so it is anchored with
+        # match(); search() would retry every offset of a non-matching row.
+        tokens = search_query.lower().split()
+        query = tokens[0] if len(tokens) == 1 else ""
+        pattern = None
+        if len(tokens) > 1:
+            pattern = re.compile(
+                "".join(f"(?=.*{re.escape(tok)})" for tok in tokens), re.DOTALL
+            )
+        matched = []
         
-        for mod_name, mod in mods.items():
-            # Text search filter
-            if query and not (
-                query in mod.name.lower() 
-                or query in (mod.title or "").lower() 
-                or query in mod.author.lower()
-            ):
-                continue
-            
-            # Status filter
-            if filter_mode == "outdated" and mod.status != ModStatus.OUTDATED:
+        # Status filter, picked once per call rather than re-tested per mod
+        status_pred = {
+            "outdated": lambda name, status: status == ModStatus.OUTDATED,
+            "up_to_date": lambda name, status: status == ModStatus.UP_TO_DATE,
+            "selected": lambda name, status: name in selected_mods,
+        }.get(filter_mode)
+        
+        for row in filter_rows:
+            mod_name, haystack, status, _version, _downloads, _date = row
+            # Text search filter (one substring test over the combined haystack;
+            # the NUL separators keep a query from matching across fields)
+            if query and query not in haystack:
                 continue
-            elif filter_mode == "up_to_date" and mod.status != ModStatus.UP_TO_DATE:
+            if pattern is not None and not pattern.match(haystack):
                 continue
-            elif filter_mode == "selected" and mod_name not in selected_mods:
+            if status_pred is not None and not status_pred(mod_name, status):
                 continue
-            
-            filtered.append((mod_name, mod))
+            matched.append(row)
         
-        # Sort mods
-        if sort_by == "name":
-            filtered.sort(key=lambda x: x[0].lower())
-        elif sort_by == "version":
-            filtered.sort(key=lambda x: x[1].version, reverse=True)
-        elif sort_by == "downloads":
-            filtered.sort(key=lambda x: x[1].downloads or 0, reverse=True)
-        elif sort_by == "date":
-            from datetime import datetime
-            filtered.sort(key=lambda x: x[1].release_date or datetime.min, reverse=True)
+        # Rows are already in name order; other sorts are newest/largest first
+        field = _SORT_FIELDS.get(sort_by)
+        if field is not None:
+            matched.sort(key=itemgetter(field), reverse=True)
         
-        return filtered
+        return [(row[0], mods[row[0]]) for row in matched]
     
     @staticmethod
     def get_statistics(mods: Dict[str, Mod]) -> Dict[str, int]:
-        """Get statistics about installed mods."""
+        """Get statistics about installed mods (status counts and total downloads)."""
+        counts = Counter(m.status for m in mods.values())
         return {
             "total": len(mods),
-            "up_to_date": sum(1 for m in mods.values() if m.status == ModStatus.UP_TO_DATE),
-            "outdated": sum(1 for m in mods.values() if m.status == ModStatus.OUTDATED),
-            "unknown": sum(1 for m in mods.values() if m.status == ModStatus.UNKNOWN),
-            "errors": sum(1 for m in mods.values() if m.status == ModStatus.ERROR),
+            "up_to_date": counts[ModStatus.UP_TO_DATE],
+            "outdated": counts[ModStatus.OUTDATED],
+            "unknown": counts[ModStatus.UNKNOWN],
+            "errors": counts[ModStatus.ERROR],
+            "downloads": sum(m.downloads for m in mods.values() if m.downloads),
         }
     
     @staticmethod
@@ -1,15 +1,18 @@
 """Checker tab UI — Qt implementation."""
 from __future__ import annotations
 
-import html as html_lib
+import bisect
 import logging
+import queue
+import threading
+import time
+from collections import Counter
 from pathlib import Path
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, Tuple
 
 from PySide6.QtCore import QThread, QTimer, Qt, Signal, Slot
-from PySide6.QtGui import QColor, QFont
+from PySide6.QtGui import QFont
 from PySide6.QtWidgets import (
-    QCheckBox,
     QDialog,
     QFileDialog,
     QGroupBox,
@@ -19,8 +22,7 @@ from PySide6.QtWidgets import (
     QLineEdit,
     QPushButton,
     QSplitter,
-    QTableWidget,
-    QTableWidgetItem,
+    QTableView,
     QTextEdit,
     QVBoxLayout,
     QWidget,
@@ -36,11 +38,12 @@ from ..core.queue_models import (
     QueueOperation,
 )
 from ..core.update_guidance import UpdateClassification
-from ..utils import config, format_file_size
-from .widgets import NotificationManager
+from ..utils import config, dir_size, format_file_size
+from .widgets import NotificationManager, console_line_html
 from .checker_logic import CheckerLogic
 from .checker_presenter import CheckerPresenter
 from .filter_sort_bar import FilterSortBar
+from .mod_table_model import ModTableModel
 from .queue_strip import QueueStrip
 from .update_queue_job import UpdateQueueJob
 
@@ -53,6 +56,7 @@ class ScanWorker(QThread):
     """Runs CheckerLogic.scan_mods() in a background thread."""
 
     mods_loaded = Signal(object)    # Dict[str, Mod] on success
+    mod_ready = Signal(object)      # each Mod as soon as the scan resolves it
     log_message = Signal(str, str)  # (message, level_name)
     error = Signal(str)
 
@@ -62,7 +66,7 @@ class ScanWorker(QThread):
 
     def run(self):
         try:
-            mods = self._logic.scan_mods()
+            mods = self._logic.scan_mods(on_mod_ready=self.mod_ready.emit)
             self.mods_loaded.emit(mods)
         except Exception as exc:
             self.error.emit(str(exc))
@@ -145,6 +149,16 @@ class ClassifyWorker(QThread):
 # SmartUpdateStrip
 # ---------------------------------------------------------------------------
 
+def _guidance_counts(names, guidance: dict) -> Counter:
+    """Count guidance classifications over *names* in one pass (unclassified skipped)."""
+    counts: Counter = Counter()
+    for n in names:
+        result = guidance.get(n)
+        if result:
+            counts[result.classification] += 1
+    return counts
+
+
 class SmartUpdateStrip(QWidget):
     """Full-width strip showing guidance counts and Queue Safe Updates CTA."""
 
@@ -190,18 +204,10 @@ class SmartUpdateStrip(QWidget):
 
     def update_guidance(self, scope_mods: list, guidance: dict) -> None:
         """Refresh strip counts for the given scope."""
-        safe = sum(
-            1 for n in scope_mods
-            if guidance.get(n) and guidance[n].classification == UpdateClassification.SAFE
-        )
-        review = sum(
-            1 for n in scope_mods
-            if guidance.get(n) and guidance[n].classification == UpdateClassification.REVIEW
-        )
-        risky = sum(
-            1 for n in scope_mods
-            if guidance.get(n) and guidance[n].classification == UpdateClassification.RISKY
-        )
+        counts = _guidance_counts(scope_mods, guidance)
+        safe = counts[UpdateClassification.SAFE]
+        review = counts[UpdateClassification.REVIEW]
+        risky = counts[UpdateClassification.RISKY]
         total = safe + review + risky
 
         self._safe_lbl.setText(f"{safe} Safe")
@@ -264,27 +270,20 @@ class _UpdateConfirmDialog(QDialog):
 # CheckerTab — main QWidget
 # ---------------------------------------------------------------------------
 
-_LEVEL_COLORS: Dict[str, str] = {
-    "DEBUG":    "#b0b0b0",
-    "INFO":     "#e0e0e0",
-    "WARNING":  "#ffad00",
-    "ERROR":    "#d13438",
-    "CRITICAL": "#d13438",
-    "SUCCESS":  "#4ec952",
-}
+# Lines kept in the operation log; older lines are dropped as new ones arrive
+_OP_LOG_MAX_LINES = 2000
 
-_STATUS_COLORS: Dict[ModStatus, tuple] = {
-    ModStatus.UP_TO_DATE: ("✓ Up to date",  "#4ec952"),
-    ModStatus.OUTDATED:   ("⬆️ Outdated",    "#ffad00"),
-    ModStatus.UNKNOWN:    ("❓ Unknown",     "#b0b0b0"),
-    ModStatus.ERROR:      ("✗ Error",       "#d13438"),
-}
+# Pixels scrolled per wheel notch in the mod table
+_WHEEL_STEP_PX = 20
+
+# The deferred first-show auto-scan is skipped if a scan finished this recently
+_AUTO_SCAN_FRESH_S = 300.0
 
 
 class CheckerTab(QWidget):
     """Qt UI for mod checker / updater."""
 
-    _log_signal = Signal(str, str)   # thread-safe bridge for op-log writes
+    _log_wakeup = Signal()           # arms the op-log pump from any thread
     mods_loaded = Signal(object)      # emits Dict[str, Mod] after each successful scan
 
     def __init__(self, logger=None, status_manager=None, parent=None):
@@ -301,13 +300,52 @@ class CheckerTab(QWidget):
         self._profile_store = ProfileStore()             # for snapshot undo
 
         self._first_show = True          # auto-scan guard
+        self._splitter_sized = False     # default splitter sizes applied once
+        self._last_scan_ts = 0.0         # time.monotonic() of the last completed scan
+        self._scan_pending: List[Mod] = []   # streamed scan results awaiting display
+        self._scan_streaming = False     # True once a scan's first rows replaced the table
         self._mods: Dict[str, Mod] = {}
         self._selected_mods: set = set()
         self._current_filter = "all"
         self._current_sort = "name"
         self._search_query = ""
+        self._filtered_rows: List[Tuple[str, Mod]] = []  # last filter_mods() result
+        self._ordered_names: List[str] = []             # mod names, case-insensitively sorted
+        self._filter_rows: List[tuple] = []             # see _on_mods_changed
+        self._stats_dirty = True                        # stat labels need recomputing
+        self._outdated_names: List[str] = []            # outdated mods, in name order
         self._active_worker = None       # prevents GC before signal delivery
+        self._mods_folder = ""           # cached folder_edit text, see _on_folder_text_changed
+        self._mods_folder_path = Path()
+        self._pending_backup_clean: Optional[Tuple[Path, int]] = None  # (folder, bytes) awaiting confirm
+        self._pending_delete: Optional[Tuple[str, ...]] = None  # selection shown in the delete prompt
+        self._btn_states: Dict[str, bool] = {}  # button attr → last applied enabled state
+        self._table_dirty = False        # set when a background op changed rendered data
+        self._check_snapshot: Dict[str, tuple] = {}  # render state before an update check
         self._classify_worker = None     # ClassifyWorker reference
+        self._details_dialog = None      # ModDetailsDialog, reused across opens
+
+        # Debounced changelog prefetch for single selections
+        self._prefetch_timer = QTimer(self)
+        self._prefetch_timer.setSingleShot(True)
+        self._prefetch_timer.setInterval(200)
+        self._prefetch_timer.timeout.connect(self._prefetch_selected_changelog)
+
+        # Op-log lines from any thread are queued and drained in one batch per
+        # ~30Hz tick, so a burst of worker messages costs one repaint per frame
+        self._log_queue: "queue.SimpleQueue[Tuple[str, str]]" = queue.SimpleQueue()
+        self._log_pump_lock = threading.Lock()
+        self._log_pump_armed = False
+        self._log_pump_timer = QTimer(self)
+        self._log_pump_timer.setSingleShot(True)
+        self._log_pump_timer.setInterval(33)
+        self._log_pump_timer.timeout.connect(self._drain_op_log)
+
+        # Mods streamed in by a running scan are shown in batches at the same rate
+        self._scan_flush_timer = QTimer(self)
+        self._scan_flush_timer.setSingleShot(True)
+        self._scan_flush_timer.setInterval(33)
+        self._scan_flush_timer.timeout.connect(self._flush_scanned_mods)
 
         self._guidance: dict = {}        # name → GuidanceResult
         self._guidance_filter = "any"    # "any" | "safe" | "review" | "risky"
@@ -318,7 +356,7 @@ class CheckerTab(QWidget):
 
         self._setup_ui()
         self._restore_config()
-        self._log_signal.connect(self._append_op_log)
+        self._log_wakeup.connect(self._log_pump_timer.start)
 
     # ------------------------------------------------------------------
     # NotificationManager interface
@@ -409,6 +447,7 @@ class CheckerTab(QWidget):
         self.folder_edit = QLineEdit()
         self.folder_edit.setReadOnly(True)
         self.folder_edit.setPlaceholderText("Mods folder…")
+        self.folder_edit.textChanged.connect(self._on_folder_text_changed)
         browse_btn = QPushButton("Browse")
         browse_btn.clicked.connect(self._on_browse)
         folder_row.addWidget(self.folder_edit, stretch=1)
@@ -450,14 +489,14 @@ class CheckerTab(QWidget):
         self.clean_btn.clicked.connect(self._on_clean_backups_clicked)
         self.details_btn.clicked.connect(self._on_view_details)
 
-        # ----- CENTER: QTableWidget -----
-        self.mod_table = QTableWidget()
-        self.mod_table.setColumnCount(8)
-        self.mod_table.setHorizontalHeaderLabels(
-            ["✔", "On", "Name", "Status", "Guidance", "Version", "Author", "Downloads"]
-        )
-        self.mod_table.setSelectionBehavior(QTableWidget.SelectionBehavior.SelectRows)
-        self.mod_table.setEditTriggers(QTableWidget.EditTrigger.NoEditTriggers)
+        # ----- CENTER: mod table (QTableView over ModTableModel) -----
+        self._table_model = ModTableModel(self._selected_mods, self._guidance, self)
+        self._table_model.select_toggled.connect(self._on_checkbox_changed)
+        self._table_model.enabled_toggled.connect(self._on_enabled_changed)
+        self.mod_table = QTableView()
+        self.mod_table.setModel(self._table_model)
+        self.mod_table.setSelectionBehavior(QTableView.SelectionBehavior.SelectRows)
+        self.mod_table.setEditTriggers(QTableView.EditTrigger.NoEditTriggers)
         header = self.mod_table.horizontalHeader()
         header.setSectionResizeMode(0, QHeaderView.ResizeMode.Fixed)
         self.mod_table.setColumnWidth(0, 30)
@@ -471,6 +510,11 @@ class CheckerTab(QWidget):
         header.setSectionResizeMode(7, QHeaderView.ResizeMode.ResizeToContents)
         self.mod_table.verticalHeader().setVisible(False)
         self.mod_table.setAlternatingRowColors(True)
+        # Wheel scrolling is configured once here; populate never needs to touch it.
+        # An explicit step also stops the view re-deriving it from row heights
+        # on every geometry update.
+        self.mod_table.setVerticalScrollMode(QTableView.ScrollMode.ScrollPerPixel)
+        self.mod_table.verticalScrollBar().setSingleStep(_WHEEL_STEP_PX)
 
         # ----- RIGHT SIDEBAR (280 px fixed) -----
         right_widget = QWidget()
@@ -560,6 +604,7 @@ class CheckerTab(QWidget):
         self.op_log.setFixedHeight(120)
         self.op_log.setFont(QFont("Cascadia Code", 9))
         self.op_log.setPlaceholderText("Operation log…")
+        self.op_log.document().setMaximumBlockCount(_OP_LOG_MAX_LINES)
         workspace_layout.addWidget(self.op_log)
 
         # Initial button state
@@ -570,6 +615,11 @@ class CheckerTab(QWidget):
         self.status_label.style().unpolish(self.status_label)
         self.status_label.style().polish(self.status_label)
 
+    def _on_folder_text_changed(self, text: str) -> None:
+        """Cache the mods folder so handlers don't re-read and re-parse the line edit."""
+        self._mods_folder = text.strip()
+        self._mods_folder_path = Path(self._mods_folder)
+
     def _restore_config(self):
         saved = config.get("mods_folder", "")
         if saved:
@@ -585,8 +635,9 @@ class CheckerTab(QWidget):
 
     def showEvent(self, event):
         super().showEvent(event)
-        # Defer splitter sizing until Qt has assigned real geometry
-        QTimer.singleShot(0, self._apply_splitter_sizes)
+        if not self._splitter_sized:
+            # Defer splitter sizing until Qt has assigned real geometry
+            QTimer.singleShot(0, self._apply_splitter_sizes)
         if self._first_show:
             self._first_show = False
             QTimer.singleShot(3000, self._auto_scan)
@@ -596,11 +647,15 @@ class CheckerTab(QWidget):
         if total > 0:
             center = max(100, total - 220 - 280)
             self._splitter.setSizes([220, center, 280])
+            self._splitter_sized = True
 
     def _auto_scan(self):
-        folder = self.folder_edit.text().strip()
-        if folder:
-            self._on_scan()
+        folder = self._mods_folder
+        if not folder or self._active_worker is not None:
+            return
+        if self._last_scan_ts and time.monotonic() - self._last_scan_ts < _AUTO_SCAN_FRESH_S:
+            return  # the user already scanned during the start-up delay
+        self._on_scan()
 
     # ------------------------------------------------------------------
     # Logic layer helpers
@@ -608,7 +663,7 @@ class CheckerTab(QWidget):
 
     def _ensure_logic(self) -> bool:
         """Create CheckerLogic if folder is set. Returns True if ready."""
-        folder = self.folder_edit.text().strip()
+        folder = self._mods_folder
         if not folder:
             self._notify("Please select a mods folder first.", "warning")
             return False
@@ -616,7 +671,7 @@ class CheckerTab(QWidget):
             self._checker = ModChecker(folder)
             self._logic = CheckerLogic(
                 self._checker,
-                lambda msg, level="INFO": self._log_signal.emit(msg, level),
+                lambda msg, level="INFO": self._append_op_log(msg, level),
             )
         return True
 
@@ -624,15 +679,17 @@ class CheckerTab(QWidget):
     # Table & statistics
     # ------------------------------------------------------------------
 
-    def _populate_table(self, mods: Dict[str, Mod]):
-        """Rebuild QTableWidget from current mods dict with active filter/sort."""
+    def _populate_table(self, mods: Dict[str, Mod], scroll_to_top: bool = True):
+        """Rebuild the mod table from current mods dict with active filter/sort."""
         filtered = self._presenter.filter_mods(
             mods,
             search_query=self._search_query,
             filter_mode=self._current_filter,
             selected_mods=self._selected_mods,
             sort_by=self._current_sort,
+            filter_rows=self._filter_rows,
         )
+        self._filtered_rows = filtered
 
         # Apply guidance filter
         if self._guidance_filter != "any":
@@ -642,107 +699,64 @@ class CheckerTab(QWidget):
                 and self._guidance[n].classification.value == self._guidance_filter
             ]
 
-        self.mod_table.setRowCount(0)
-        self.mod_table.setRowCount(len(filtered))
-
-        for row, (mod_name, mod) in enumerate(filtered):
-            # Col 0: bulk-select checkbox
-            chk = QCheckBox()
-            chk.setChecked(mod_name in self._selected_mods)
-            chk.stateChanged.connect(
-                lambda state, name=mod_name: self._on_checkbox_changed(name, state)
-            )
-            chk_cell = QWidget()
-            chk_layout = QHBoxLayout(chk_cell)
-            chk_layout.addWidget(chk)
-            chk_layout.setAlignment(Qt.AlignmentFlag.AlignCenter)
-            chk_layout.setContentsMargins(0, 0, 0, 0)
-            self.mod_table.setCellWidget(row, 0, chk_cell)
-
-            # Col 1: enabled toggle (D-14 — separate from bulk-select)
-            enabled_chk = QCheckBox()
-            enabled_chk.setChecked(getattr(mod, "enabled", True))
-            enabled_chk.setToolTip("Enable / disable this mod (keeps ZIP on disk)")
-            enabled_chk.stateChanged.connect(
-                lambda state, name=mod_name: self._on_enabled_changed(name, state)
-            )
-            en_cell = QWidget()
-            en_layout = QHBoxLayout(en_cell)
-            en_layout.addWidget(enabled_chk)
-            en_layout.setAlignment(Qt.AlignmentFlag.AlignCenter)
-            en_layout.setContentsMargins(0, 0, 0, 0)
-            self.mod_table.setCellWidget(row, 1, en_cell)
-
-            # Col 2: name
-            name_item = QTableWidgetItem(mod_name)
-            name_item.setData(Qt.ItemDataRole.UserRole, mod_name)
-            self.mod_table.setItem(row, 2, name_item)
-
-            # Col 3: status
-            status_text, color = _STATUS_COLORS.get(
-                mod.status, ("❓ Unknown", "#b0b0b0")
-            )
-            status_item = QTableWidgetItem(status_text)
-            status_item.setForeground(QColor(color))
-            self.mod_table.setItem(row, 3, status_item)
-
-            # Col 4: guidance chip (outdated mods only)
-            guidance_text = ""
-            guidance_color = ""
-            if mod.status == ModStatus.OUTDATED and mod_name in self._guidance:
-                g = self._guidance[mod_name]
-                if g.classification == UpdateClassification.SAFE:
-                    guidance_text, guidance_color = "Safe", "#4ec952"
-                elif g.classification == UpdateClassification.REVIEW:
-                    guidance_text, guidance_color = "Review", "#ffad00"
-                elif g.classification == UpdateClassification.RISKY:
-                    guidance_text, guidance_color = "Risky", "#d13438"
-            guidance_item = QTableWidgetItem(guidance_text)
-            if guidance_color:
-                guidance_item.setForeground(QColor(guidance_color))
-            self.mod_table.setItem(row, 4, guidance_item)
-
-            # Col 5: version
-            installed = mod.version or "?"
-            latest = mod.latest_version or "?"
-            version_text = f"{installed} → {latest}" if mod.status == ModStatus.OUTDATED else installed
-            self.mod_table.setItem(row, 5, QTableWidgetItem(version_text))
-
-            # Col 6: author
-            self.mod_table.setItem(row, 6, QTableWidgetItem(mod.author or ""))
-
-            # Col 7: downloads
-            self.mod_table.setItem(row, 7, QTableWidgetItem(str(mod.downloads or "")))
-
-            # Dim text columns for disabled mods (D-14 visual treatment)
-            if not getattr(mod, "enabled", True):
-                dim = QColor("#888888")
-                for col_idx in (2, 3, 4, 5, 6, 7):
-                    item = self.mod_table.item(row, col_idx)
-                    if item:
-                        item.setForeground(dim)
-
-        self.mod_table.scrollToTop()
+        # The view only asks the model for the rows it paints
+        self._table_model.set_rows(filtered)
+        if scroll_to_top:
+            self.mod_table.scrollToTop()
+
+    def _refresh_rows_in_place(self) -> bool:
+        """Redraw the current rows from self._mods, keeping row order and scroll.
+
+        Only possible while no active filter or sort depends on mod status,
+        version, downloads or date, since those are what checks and updates
+        change. Returns False, without touching the table, when a full
+        _populate_table() is needed instead.
+        """
+        if (
+            self._current_filter in ("outdated", "up_to_date")
+            or self._current_sort != "name"
+            or self._guidance_filter != "any"
+        ):
+            return False
+        mods = self._mods
+        if any(n not in mods for n, _ in self._filtered_rows):
+            return False
+        # Checks replace Mod objects, so re-resolve every row by name
+        self._filtered_rows = [(n, mods[n]) for n, _ in self._filtered_rows]
+        self._table_model.refresh_rows(self._filtered_rows)
+        return True
 
     def _update_statistics(self, mods: Dict[str, Mod]):
+        """Refresh the stat labels; a no-op until _on_mods_changed marks them stale."""
+        if not self._stats_dirty:
+            return
+        self._stats_dirty = False
         stats = self._presenter.get_statistics(mods)
         self.stat_total.setText(f"Total: {stats.get('total', 0)} mods")
         self.stat_uptodate.setText(f"Up to date: {stats.get('up_to_date', 0)}")
         self.stat_outdated.setText(f"Outdated: {stats.get('outdated', 0)}")
         self.stat_unknown.setText(f"Unknown: {stats.get('unknown', 0)}")
-        dl = sum(m.downloads for m in mods.values() if m.downloads)
-        self.stat_downloads.setText(f"Downloads: {dl:,}")
+        self.stat_downloads.setText(f"Downloads: {stats.get('downloads', 0):,}")
 
     def _update_button_states(self):
         has_mods = len(self._mods) > 0
         has_selection = len(self._selected_mods) > 0
         one_selected = len(self._selected_mods) == 1
-        self.update_sel_btn.setEnabled(has_selection)
-        self.delete_btn.setEnabled(has_selection)
-        self.backup_btn.setEnabled(has_selection)
-        self.details_btn.setEnabled(one_selected)
-        self.check_btn.setEnabled(has_mods)
-        self.update_all_btn.setEnabled(has_mods)
+        self._set_button_states(
+            update_sel_btn=has_selection,
+            delete_btn=has_selection,
+            backup_btn=has_selection,
+            details_btn=one_selected,
+            check_btn=has_mods,
+            update_all_btn=has_mods,
+        )
+
+    def _set_button_states(self, **states: bool) -> None:
+        """Apply enabled states, touching only buttons whose state actually changed."""
+        for attr, enabled in states.items():
+            if self._btn_states.get(attr) != enabled:
+                self._btn_states[attr] = enabled
+                getattr(self, attr).setEnabled(enabled)
 
     # ------------------------------------------------------------------
     # Filter / sort handlers
@@ -763,6 +777,17 @@ class CheckerTab(QWidget):
         self._update_button_states()
         self._update_smart_strip()
         self._update_guidance_panel()
+        if len(self._selected_mods) == 1:
+            self._prefetch_timer.start()
+        else:
+            self._prefetch_timer.stop()
+
+    def _prefetch_selected_changelog(self) -> None:
+        """Warm the changelog cache so View Details opens without a network wait."""
+        if len(self._selected_mods) != 1:
+            return
+        from .mod_details_dialog import prefetch_changelog
+        prefetch_changelog(next(iter(self._selected_mods)))
 
     def _on_enabled_changed(self, mod_name: str, state: int) -> None:
         """Rename mod ZIP to .zip.bak (disable) or back to .zip (enable)."""
@@ -781,16 +806,7 @@ class CheckerTab(QWidget):
             )
             return
         # Update row dim treatment
-        dim = QColor("#888888")
-        normal = QColor()  # default foreground
-        for row in range(self.mod_table.rowCount()):
-            name_item = self.mod_table.item(row, 2)
-            if name_item and name_item.data(Qt.ItemDataRole.UserRole) == mod_name:
-                for col_idx in (2, 3, 4, 5, 6, 7):
-                    item = self.mod_table.item(row, col_idx)
-                    if item:
-                        item.setForeground(dim if not enabled else normal)
-                break
+        self._table_model.refresh_mod(mod_name)
 
     def _on_open_queue_requested(self) -> None:
         """Forward queue-strip 'Open Queue' clicks to the main window."""
@@ -820,10 +836,28 @@ class CheckerTab(QWidget):
     # ------------------------------------------------------------------
 
     def _append_op_log(self, message: str, level: str = "INFO"):
-        """Append HTML-escaped, color-coded line to operation log."""
-        color = _LEVEL_COLORS.get(level.upper(), "#e0e0e0")
-        safe = html_lib.escape(message)
-        self.op_log.append(f'<span style="color:{color};">{safe}</span>')
+        """Queue a line for the operation log. Safe to call from any thread."""
+        self._log_queue.put((message, level))
+        with self._log_pump_lock:
+            if self._log_pump_armed:
+                return
+            self._log_pump_armed = True
+        self._log_wakeup.emit()
+
+    def _drain_op_log(self) -> None:
+        """Append every queued line as HTML-escaped, color-coded text in one update."""
+        with self._log_pump_lock:
+            self._log_pump_armed = False
+        lines = []
+        while True:
+            try:
+                message, level = self._log_queue.get_nowait()
+            except queue.Empty:
+                break
+            lines.append(console_line_html(message, level))
+        if not lines:
+            return
+        self.op_log.append("".join(lines))
         sb = self.op_log.verticalScrollBar()
         sb.setValue(sb.maximum())
 
@@ -834,7 +868,7 @@ class CheckerTab(QWidget):
     def _set_busy(self, label: str):
         self.status_label.setText(label)
         self._set_status_type("busy")
-        self.scan_btn.setEnabled(False)
+        self._set_button_states(scan_btn=False)
 
     def _set_idle(self, label: str = "Ready", color: str = "#4ec952"):
         self.status_label.setText(label)
@@ -846,15 +880,75 @@ class CheckerTab(QWidget):
             self._set_status_type("ready")
         else:
             self._set_status_type("neutral")
-        self.scan_btn.setEnabled(True)
+        self._set_button_states(scan_btn=True)
         self._active_worker = None
         self._update_button_states()
 
+    def _on_mods_changed(self) -> None:
+        """Rebuild per-mod caches derived from mod data (call before repopulating)."""
+        self._sync_ordered_names()
+        self._filter_rows = self._presenter.build_filter_rows(
+            self._mods, self._ordered_names
+        )
+        self._outdated_names = [
+            row[0] for row in self._filter_rows if row[2] == ModStatus.OUTDATED
+        ]
+        self._stats_dirty = True
+
+    def _sync_ordered_names(self) -> None:
+        """Bring _ordered_names in line with _mods without re-sorting every name."""
+        ordered = self._ordered_names
+        known = set(ordered)
+        removed = known.difference(self._mods)
+        added = [n for n in self._mods if n not in known]
+        if removed:
+            ordered[:] = [n for n in ordered if n not in removed]
+        if len(added) > len(ordered):
+            # First scan (or a new folder): one sort beats inserting each name
+            ordered.extend(added)
+            ordered.sort(key=str.lower)
+        else:
+            for name in added:
+                bisect.insort(ordered, name, key=str.lower)
+
+    @Slot(object)
+    def _on_mod_scanned(self, mod: Mod) -> None:
+        """Buffer a mod streamed from a running scan; shown on the next flush tick."""
+        self._scan_pending.append(mod)
+        if not self._scan_flush_timer.isActive():
+            self._scan_flush_timer.start()
+
+    def _flush_scanned_mods(self) -> None:
+        """Add every buffered scan result to the table without resetting the scroll."""
+        if not self._scan_pending:
+            return
+        if not self._scan_streaming:
+            # First rows of a new scan replace the previous scan's list
+            self._scan_streaming = True
+            self._mods = {}
+        for mod in self._scan_pending:
+            self._mods[mod.name] = mod
+        self._scan_pending.clear()
+        self._on_mods_changed()
+        self._populate_table(self._mods, scroll_to_top=False)
+        self._update_statistics(self._mods)
+
+    def _end_scan_stream(self) -> None:
+        """Drop streamed rows still buffered; the final scan result supersedes them."""
+        self._scan_flush_timer.stop()
+        self._scan_pending.clear()
+        self._scan_streaming = False
+
     @Slot(object)
     def _on_mods_loaded(self, mods: dict):
+        streamed = self._scan_streaming
+        self._end_scan_stream()
+        self._last_scan_ts = time.monotonic()
         self._mods = mods
+        self._on_mods_changed()
         self.mods_loaded.emit(mods)
-        self._populate_table(mods)
+        # Keep the scroll position the user may have moved to while rows streamed in
+        self._populate_table(mods, scroll_to_top=not streamed)
         self._update_statistics(mods)
         n_active = sum(1 for m in mods.values() if m.enabled)
         n_disabled = len(mods) - n_active
@@ -866,8 +960,31 @@ class CheckerTab(QWidget):
             self.status_manager.push_status(f"Scan complete — {label}", "success")
         self._start_classify(mods)
 
+    def _render_snapshot(self) -> Dict[str, tuple]:
+        """Capture the per-mod values the table renders, for change detection."""
+        return {
+            n: (m.status, m.version_str, m.downloads_str, m.enabled)
+            for n, m in self._mods.items()
+        }
+
+    def _maybe_repopulate(self) -> None:
+        """Rebuild table and statistics only if a background op changed mod data."""
+        if not self._table_dirty:
+            return
+        self._table_dirty = False
+        same_names = len(self._mods) == len(self._ordered_names) and all(
+            n in self._mods for n in self._ordered_names
+        )
+        self._on_mods_changed()
+        if not (same_names and self._refresh_rows_in_place()):
+            self._populate_table(self._mods)
+        self._update_statistics(self._mods)
+
     @Slot(str)
     def _on_worker_error(self, msg: str):
+        # A failed scan keeps whatever rows it managed to stream in
+        self._flush_scanned_mods()
+        self._end_scan_stream()
         self._notify(f"✗ Error: {msg}", "error")
         self._set_idle("Error", "#d13438")
         if self.status_manager:
@@ -876,8 +993,10 @@ class CheckerTab(QWidget):
     @Slot(object, bool)
     def _on_check_complete(self, outdated: dict, was_refreshed: bool):
         self._mods.update(outdated)
-        self._populate_table(self._mods)
-        self._update_statistics(self._mods)
+        if self._render_snapshot() != self._check_snapshot:
+            self._table_dirty = True
+        self._check_snapshot = {}
+        self._maybe_repopulate()
         n = len(outdated)
         label = f"{n} update(s) available" if n else "All up to date"
         self._set_idle(label, "#ffad00" if n else "#4ec952")
@@ -887,8 +1006,9 @@ class CheckerTab(QWidget):
 
     @Slot(list, list)
     def _on_update_complete(self, successful: list, failed: list):
-        self._populate_table(self._mods)
-        self._update_statistics(self._mods)
+        if successful:
+            self._table_dirty = True
+        self._maybe_repopulate()
         if failed:
             self._notify(f"✗ Failed to update: {', '.join(failed)}", "error")
             self._set_idle("Update errors", "#d13438")
@@ -904,7 +1024,7 @@ class CheckerTab(QWidget):
         """Open the profile library dialog from the Checker header."""
         from .profile_library_dialog import ProfileLibraryDialog
 
-        folder = self.folder_edit.text().strip()
+        folder = self._mods_folder
         if not folder or not self._mods:
             self._notify("Please scan mods first before using profiles.", "warning")
             return
@@ -923,7 +1043,7 @@ class CheckerTab(QWidget):
         from .profile_apply_dialog import ProfileApplyDialog
         from .profile_apply_job import ProfileApplyJob
 
-        folder = self.folder_edit.text().strip()
+        folder = self._mods_folder
         # Guard: pre-check in _on_open_profiles prevents reaching here without mods,
         # but keep as a safety net for direct callers.
         if not folder or not self._mods:
@@ -955,10 +1075,9 @@ class CheckerTab(QWidget):
 
         # --- Build diff ---
         # Use mod-list.json as the authoritative source for current enabled states.
-        from pathlib import Path as _Path
         from ..core.mod_list import ModListStore as _ModListStore
         installed_names = list(self._mods.keys())
-        current_enabled = _ModListStore(_Path(folder)).load()
+        current_enabled = _ModListStore(self._mods_folder_path).load()
         # Fall back to Mod.enabled for any mod not yet written to mod-list.json
         for mod_name, mod in self._mods.items():
             if mod_name not in current_enabled:
@@ -1043,7 +1162,7 @@ class CheckerTab(QWidget):
             self._notify("Queue controller not available for download.", "warning")
             return
         from .download_queue_job import DownloadQueueJob
-        folder = self.folder_edit.text().strip()
+        folder = self._mods_folder
         for mod_name in mod_names:
             dl_op = QueueOperation(
                 source=OperationSource.CHECKER,
@@ -1089,7 +1208,7 @@ class CheckerTab(QWidget):
             return
 
         # Restore mod-list.json from snapshot
-        ml = ModListStore(Path(self.folder_edit.text().strip()))
+        ml = ModListStore(self._mods_folder_path)
         for mod_name, was_enabled in snapshot.enabled_before.items():
             if was_enabled:
                 ml.enable(mod_name)
@@ -1110,8 +1229,10 @@ class CheckerTab(QWidget):
         if not self._ensure_logic():
             return
         self._set_busy("Scanning…")
+        self._end_scan_stream()
         worker = ScanWorker(self._logic, parent=self)
         self._active_worker = worker
+        worker.mod_ready.connect(self._on_mod_scanned)
         worker.mods_loaded.connect(self._on_mods_loaded)
         worker.log_message.connect(self._append_op_log)
         worker.error.connect(self._on_worker_error)
@@ -1121,6 +1242,7 @@ class CheckerTab(QWidget):
         if not self._ensure_logic():
             return
         self._set_busy("Checking updates…")
+        self._check_snapshot = self._render_snapshot()
         worker = UpdateCheckWorker(self._logic, force_refresh=True, parent=self)
         self._active_worker = worker
         worker.check_complete.connect(self._on_check_complete)
@@ -1151,8 +1273,8 @@ class CheckerTab(QWidget):
                 return
             # result == Accepted → proceed with queue
 
+        mod_names = self._selection_snapshot()
         if self._queue_controller is not None:
-            mod_names = list(self._selected_mods)
             label = f"Update {len(mod_names)} mod(s)"
             op = QueueOperation(
                 source=OperationSource.CHECKER,
@@ -1174,10 +1296,8 @@ class CheckerTab(QWidget):
             return
 
         # Legacy fallback
-        self._set_busy(f"Updating {len(self._selected_mods)} mod(s)…")
-        worker = UpdateSelectedWorker(
-            self._logic, list(self._selected_mods), parent=self
-        )
+        self._set_busy(f"Updating {len(mod_names)} mod(s)…")
+        worker = UpdateSelectedWorker(self._logic, mod_names, parent=self)
         self._active_worker = worker
         worker.update_complete.connect(self._on_update_complete)
         worker.log_message.connect(self._append_op_log)
@@ -1187,9 +1307,12 @@ class CheckerTab(QWidget):
     def _on_update_all(self):
         if not self._mods or not self._ensure_logic():
             return
+        if not self._outdated_names:
+            self._notify("All mods are up to date", "info")
+            return
 
         if self._queue_controller is not None:
-            mod_names = list(self._mods.keys())
+            mod_names = list(self._outdated_names)
             label = f"Update all {len(mod_names)} mod(s)"
             op = QueueOperation(
                 source=OperationSource.CHECKER,
@@ -1210,7 +1333,7 @@ class CheckerTab(QWidget):
             self._notify(f"Queued: {label}", "info")
             return
 
-        all_names = list(self._mods.keys())
+        all_names = list(self._outdated_names)
         self._set_busy(f"Updating all {len(all_names)} mod(s)…")
         worker = UpdateSelectedWorker(self._logic, all_names, parent=self)
         self._active_worker = worker
@@ -1233,16 +1356,30 @@ class CheckerTab(QWidget):
                 self._disconnect_queue_handler(op_id)
             elif op.state == OperationState.FAILED:
                 short = op.failure.short_description if op.failure else "Update failed"
+                # A partly failed batch still updated some Mod objects; rebuild
+                # the derived caches (sort keys, filter rows, outdated list,
+                # stats) so those mods leave the Outdated filter
+                self._table_dirty = True
+                self._maybe_repopulate()
                 self._notify(f"✗ {short}", "error")
                 self._active_jobs.pop(op_id, None)
                 self._disconnect_queue_handler(op_id)
             break
 
+    def _selection_snapshot(self) -> Tuple[str, ...]:
+        """The current selection, frozen in name order for a bulk operation.
+
+        Clicks made while the operation runs (or while its confirmation is
+        open) change _selected_mods but not the snapshot.
+        """
+        return tuple(sorted(self._selected_mods, key=str.lower))
+
     def _on_delete_clicked(self):
         if not self._selected_mods:
             return
-        names = ", ".join(sorted(self._selected_mods))
-        count = len(self._selected_mods)
+        self._pending_delete = self._selection_snapshot()
+        names = ", ".join(self._pending_delete)
+        count = len(self._pending_delete)
         self._notify(
             f"Delete {count} mod(s)? ({names})",
             notif_type="warning",
@@ -1251,16 +1388,16 @@ class CheckerTab(QWidget):
         )
 
     def _confirm_delete(self):
-        if not self._ensure_logic():
+        mod_names, self._pending_delete = self._pending_delete, None
+        if not mod_names or not self._ensure_logic():
             return
-        folder = self.folder_edit.text().strip()
+        folder = self._mods_folder
         try:
-            successful, failed = self._logic.delete_mods(
-                list(self._selected_mods), folder
-            )
+            successful, failed = self._logic.delete_mods(list(mod_names), folder)
             for name in successful:
                 self._mods.pop(name, None)
             self._selected_mods.difference_update(successful)
+            self._on_mods_changed()
             self._populate_table(self._mods)
             self._update_statistics(self._mods)
             if failed:
@@ -1274,10 +1411,10 @@ class CheckerTab(QWidget):
     def _on_backup(self):
         if not self._selected_mods or not self._ensure_logic():
             return
-        folder = self.folder_edit.text().strip()
+        folder = self._mods_folder
         try:
             successful, failed = self._logic.backup_mods(
-                list(self._selected_mods), folder
+                list(self._selection_snapshot()), folder
             )
             if failed:
                 self._notify(f"✗ Could not backup: {', '.join(failed)}", "error")
@@ -1287,18 +1424,17 @@ class CheckerTab(QWidget):
             self._notify(f"✗ Backup error: {exc}", "error")
 
     def _on_clean_backups_clicked(self):
-        folder = self.folder_edit.text().strip()
+        folder = self._mods_folder
         if not folder:
             self._notify("Please select a mods folder first.", "warning")
             return
-        backup_path = Path(folder) / "backup"
+        backup_path = self._mods_folder_path / "backup"
         if not backup_path.exists():
             self._notify("No backup folder found.", "info")
             return
-        size_bytes = sum(
-            f.stat().st_size for f in backup_path.rglob("*") if f.is_file()
-        )
-        size_str = format_file_size(size_bytes)
+        # Measured once here; the confirmed delete reuses it instead of re-walking
+        self._pending_backup_clean = (backup_path, dir_size(backup_path))
+        size_str = format_file_size(self._pending_backup_clean[1])
         self._notify(
             f"Delete backup folder? ({size_str}) This cannot be undone.",
             notif_type="warning",
@@ -1307,11 +1443,12 @@ class CheckerTab(QWidget):
         )
 
     def _confirm_clean_backups(self):
-        if not self._ensure_logic():
+        pending, self._pending_backup_clean = self._pending_backup_clean, None
+        if pending is None or not self._ensure_logic():
             return
-        folder = self.folder_edit.text().strip()
+        backup_path, size_bytes = pending
         try:
-            self._logic.clean_backups(folder)
+            self._logic.clean_backups(str(backup_path), folder_size=size_bytes)
             self._notify("✓ Backup folder removed.", "success")
         except Exception as exc:
             self._notify(f"✗ Clean backups error: {exc}", "error")
@@ -1323,10 +1460,7 @@ class CheckerTab(QWidget):
         mod = self._mods.get(mod_name)
         if not mod:
             return
-        from .mod_details_dialog import ModDetailsDialog
-        dlg = ModDetailsDialog(data=mod, source="installed", parent=self,
-                               installed_mods=self._mods)
-        dlg.exec()
+        self._show_details(mod)
 
     def _on_view_details_from_guidance(self) -> None:
         """View Details from the guidance panel — deep-links to Dependencies tab."""
@@ -1336,10 +1470,21 @@ class CheckerTab(QWidget):
         mod = self._mods.get(mod_name)
         if not mod:
             return
+        self._show_details(mod, initial_tab="dependencies")
+
+    def _show_details(self, mod, initial_tab: str = "overview") -> None:
+        """Show the details dialog for *mod*, reusing the dialog built on first open."""
         from .mod_details_dialog import ModDetailsDialog
-        dlg = ModDetailsDialog(data=mod, source="installed", parent=self,
-                               installed_mods=self._mods, initial_tab="dependencies")
-        dlg.exec()
+        if self._details_dialog is None:
+            self._details_dialog = ModDetailsDialog(
+                data=mod, source="installed", parent=self,
+                installed_mods=self._mods, initial_tab=initial_tab,
+            )
+        else:
+            self._details_dialog.load(
+                mod, "installed", installed_mods=self._mods, initial_tab=initial_tab,
+            )
+        self._details_dialog.exec()
 
     def _start_classify(self, mods: dict) -> None:
         """Kick off background guidance classification for all loaded mods."""
@@ -1360,28 +1505,26 @@ class CheckerTab(QWidget):
     @Slot(object)
     def _on_guidance_ready(self, results: dict) -> None:
         """Receive classified guidance dict from ClassifyWorker."""
-        self._guidance = results
+        self._guidance = self._table_model.guidance = results
         self._update_smart_strip()
         self._update_guidance_panel()
-        if self._mods:
+        if self._mods and not self._refresh_rows_in_place():
             self._populate_table(self._mods)
 
     def _update_smart_strip(self) -> None:
         """Recompute SmartUpdateStrip scope and refresh counts."""
         if not hasattr(self, "_smart_strip"):
             return
+        self._smart_strip.update_guidance(self._outdated_scope(), self._guidance)
+
+    def _outdated_scope(self) -> List[str]:
+        """Outdated mods in scope: the selection if any, else the filtered rows."""
         if self._selected_mods:
-            scope = [
-                n for n in self._selected_mods
-                if self._mods.get(n) and self._mods[n].status == ModStatus.OUTDATED
-            ]
-        else:
-            filtered = self._presenter.filter_mods(
-                self._mods, self._search_query, self._current_filter,
-                self._selected_mods, self._current_sort,
-            )
-            scope = [n for n, m in filtered if m.status == ModStatus.OUTDATED]
-        self._smart_strip.update_guidance(scope, self._guidance)
+            return [n for n in self._outdated_names if n in self._selected_mods]
+        if self._current_filter == "selected":
+            return []  # nothing passes the "selected" filter with an empty selection
+        # Reuse the rows _populate_table already filtered instead of filtering again
+        return [n for n, m in self._filtered_rows if m.status == ModStatus.OUTDATED]
 
     def _update_guidance_panel(self) -> None:
         """Refresh the Selected Update Guidance panel for current selection."""
@@ -1433,9 +1576,10 @@ class CheckerTab(QWidget):
             self._guidance_details_btn.setVisible(True)
 
         else:
-            safe_n   = sum(1 for n in self._selected_mods if self._guidance.get(n) and self._guidance[n].classification == UpdateClassification.SAFE)
-            review_n = sum(1 for n in self._selected_mods if self._guidance.get(n) and self._guidance[n].classification == UpdateClassification.REVIEW)
-            risky_n  = sum(1 for n in self._selected_mods if self._guidance.get(n) and self._guidance[n].classification == UpdateClassification.RISKY)
+            counts   = _guidance_counts(self._selected_mods, self._guidance)
+            safe_n   = counts[UpdateClassification.SAFE]
+            review_n = counts[UpdateClassification.REVIEW]
+            risky_n  = counts[UpdateClassification.RISKY]
             self._guidance_empty_lbl.setText(
                 f"{n_selected} mods selected\n\u2713 Safe: {safe_n}  \u26a0 Review: {review_n}  \u2717 Risky: {risky_n}\n\n"
                 "Only Safe items enter the one-click batch. Review and Risky items stay manual."
@@ -1449,19 +1593,8 @@ class CheckerTab(QWidget):
         """Queue only mods classified Safe in the current scope."""
         if not self._ensure_logic() or self._queue_controller is None:
             return
-        if self._selected_mods:
-            scope = [
-                n for n in self._selected_mods
-                if self._mods.get(n) and self._mods[n].status == ModStatus.OUTDATED
-            ]
-        else:
-            filtered = self._presenter.filter_mods(
-                self._mods, self._search_query, self._current_filter,
-                self._selected_mods, self._current_sort,
-            )
-            scope = [n for n, m in filtered if m.status == ModStatus.OUTDATED]
         safe_names = [
-            n for n in scope
+            n for n in self._outdated_scope()
             if n in self._guidance
             and self._guidance[n].classification == UpdateClassification.SAFE
         ]
@@ -60,6 +60,9 @@ class _CoordinatorThread(QThread):
         self._cancel_event = cancel_event
         self._pause_event = pause_event
         self._max_workers = max_workers
+        # Created in Phase A and shared by every Phase B worker, so all files
+        # of the session reuse one HTTP connection pool.
+        self._downloader = None
 
     # ------------------------------------------------------------------
     # Thread entry point
@@ -131,6 +134,8 @@ class _CoordinatorThread(QThread):
 
         downloader = ModDownloader(self._mods_folder)
         downloader.set_cancel_event(self._cancel_event)
+        downloader.set_pause_event(self._pause_event)
+        self._downloader = downloader
 
         if self._cancel_event.is_set():
             return None
@@ -156,8 +161,6 @@ class _CoordinatorThread(QThread):
 
     def _download_one(self, mod: Mod) -> bool:
         """Download a single mod file.  Runs inside the thread pool."""
-        from ..core.downloader import ModDownloader
-
         # Respect pause by blocking until unpaused (checked periodically)
         while self._pause_event.is_set() and not self._cancel_event.is_set():
             import time
@@ -167,10 +170,7 @@ class _CoordinatorThread(QThread):
             return False
 
         try:
-            downloader = ModDownloader(self._mods_folder, max_workers=1)
-            downloader.set_cancel_event(self._cancel_event)
-            downloader.set_pause_event(self._pause_event)
-            return bool(downloader.download_mod(mod))
+            return bool(self._downloader.download_mod(mod))
         except Exception:  # noqa: BLE001
             return False
 
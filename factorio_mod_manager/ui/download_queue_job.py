@@ -11,7 +11,6 @@ call resets the operation state so the tab can call ``job.start()`` again.
 """
 from __future__ import annotations
 
-import re as _re
 import threading
 from typing import Optional
 
@@ -22,6 +21,7 @@ from ..core.queue_models import (
     QueueFailure,
     QueueOperation,
 )
+from ..utils import mod_name_from_url
 
 
 # ---------------------------------------------------------------------------
@@ -78,8 +78,7 @@ class _DownloadThread(QThread):
                 lambda completed, total: self.progress.emit(completed, total)
             )
 
-            m = _re.search(r"/mod/([^/?&\s]+)", self._mod_url)
-            mod_name = m.group(1) if m else self._mod_url.strip()
+            mod_name = mod_name_from_url(self._mod_url)
 
             mod_list = [mod_name] + [m for m in self._extra_mods if m != mod_name]
             _downloaded, failed = downloader.download_mods(
@@ -1,9 +1,7 @@
 """Downloader tab UI — Qt implementation."""
 from __future__ import annotations
 
-import html as html_lib
 import logging
-import re
 from pathlib import Path
 from typing import Dict, Optional
 
@@ -28,17 +26,18 @@ from PySide6.QtWidgets import (
 )
 
 from ..core import ModDownloader, ModListStore
-from ..core.portal import FactorioPortalAPI, PortalAPIError
+from ..core.mod import DEP_STRING_RE, FACTORIO_EXPANSIONS
+from ..core.portal import PortalAPIError, get_portal
 from ..core.queue_models import (
     OperationKind,
     OperationSource,
     OperationState,
     QueueOperation,
 )
-from ..utils import config, is_online
+from ..utils import config, is_online, mod_name_from_url
 from .download_coordinator_job import DownloadCoordinatorJob
 from .queue_strip import QueueStrip
-from .widgets import NotificationManager
+from .widgets import NotificationManager, console_line_html, sender_property
 from .filter_sort_bar import CategoryChipsBar, VersionFilterBar
 
 
@@ -80,10 +79,7 @@ class DownloadWorker(QThread):
             downloader.set_mod_progress_callback(_on_mod_status)
             downloader.set_progress_callback(lambda msg: self.log_message.emit(msg, "INFO"))
 
-            # Extract mod name from URL or treat input as a bare mod name
-            import re as _re
-            m = _re.search(r'/mod/([^/?&\s]+)', self._mod_url)
-            mod_name = m.group(1) if m else self._mod_url.strip()
+            mod_name = mod_name_from_url(self._mod_url)
 
             mod_list = [mod_name] + [m for m in self._extra_mods if m != mod_name]
             _downloaded, failed = downloader.download_mods(
@@ -114,14 +110,15 @@ class ResolveWorker(QThread):
 
     def run(self):
         try:
-            portal = FactorioPortalAPI()
-            # Extract mod name from URL or treat input as a bare mod name
-            m = re.search(r'/mod/([^/?&\s]+)', self._mod_url)
-            mod_name = m.group(1) if m else self._mod_url.strip()
+            portal = get_portal()
+            mod_name = mod_name_from_url(self._mod_url)
             info = portal.get_mod(mod_name)
+            if self.isInterruptionRequested():
+                return
             self.resolved.emit(info)
         except Exception as exc:
-            self.error.emit(str(exc))
+            if not self.isInterruptionRequested():
+                self.error.emit(str(exc))
 
 
 # ---------------------------------------------------------------------------
@@ -147,7 +144,7 @@ class SearchWorker(QThread):
         if self.isInterruptionRequested():
             return
         try:
-            portal = FactorioPortalAPI()
+            portal = get_portal()
             if self.isInterruptionRequested():
                 return
             results, cur_page, total_pages = portal.search_mods(
@@ -185,7 +182,7 @@ class CategoryBrowseWorker(QThread):
         if self.isInterruptionRequested():
             return
         try:
-            portal = FactorioPortalAPI()
+            portal = get_portal()
             if self.isInterruptionRequested():
                 return
             results, cur_page, total_pages = portal.search_mods(
@@ -201,6 +198,20 @@ class CategoryBrowseWorker(QThread):
                 self.error.emit(str(exc))
 
 
+# ---------------------------------------------------------------------------
+# Worker: OnlineCheckWorker
+# ---------------------------------------------------------------------------
+
+class OnlineCheckWorker(QThread):
+    """QThread that runs the is_online() DNS probe before a download starts."""
+
+    checked = Signal(bool, str)   # (online, offline_reason)
+
+    def run(self):
+        online, reason = is_online()
+        self.checked.emit(online, reason or "")
+
+
 # ---------------------------------------------------------------------------
 # Version comparison helper
 # ---------------------------------------------------------------------------
@@ -238,7 +249,8 @@ class ModBrowseCard(QFrame):
         self.setObjectName("modBrowseCard")
         self.setAttribute(Qt.WidgetAttribute.WA_Hover, True)
         self.setCursor(Qt.CursorShape.PointingHandCursor)
-        self._mod_name = entry.get("name", "")
+        self._mod_name = ""
+        self._shown_key: tuple = ()  # inputs of the last set_entry() that changed labels
 
         layout = QVBoxLayout(self)
         layout.setContentsMargins(10, 8, 10, 8)
@@ -248,54 +260,85 @@ class ModBrowseCard(QFrame):
         title_row = QHBoxLayout()
         title_row.setSpacing(6)
 
-        title_lbl = QLabel(entry.get("title") or entry.get("name", ""))
-        title_lbl.setObjectName("modCardTitle")
-        title_lbl.setWordWrap(False)
-        title_lbl.setSizePolicy(QSizePolicy.Policy.Expanding, QSizePolicy.Policy.Preferred)
-        title_row.addWidget(title_lbl, stretch=1)
+        self._title_lbl = QLabel()
+        self._title_lbl.setObjectName("modCardTitle")
+        self._title_lbl.setWordWrap(False)
+        self._title_lbl.setSizePolicy(QSizePolicy.Policy.Expanding, QSizePolicy.Policy.Preferred)
+        title_row.addWidget(self._title_lbl, stretch=1)
 
-        cat = (entry.get("category") or "").replace("-", " ").title()
-        if cat:
-            cat_lbl = QLabel(cat)
-            cat_lbl.setObjectName("modCardCategory")
-            title_row.addWidget(cat_lbl)
+        self._cat_lbl = QLabel()
+        self._cat_lbl.setObjectName("modCardCategory")
+        title_row.addWidget(self._cat_lbl)
 
         # Inline status badge — placed after category chip to avoid overlap
-        if installed_versions is not None:
-            inst_ver = installed_versions.get(self._mod_name)
-            if inst_ver is not None:
-                releases = entry.get("releases") or []
-                portal_ver = releases[-1].get("version", "") if releases else ""
-                if portal_ver and _version_lt(inst_ver, portal_ver):
-                    badge_text, badge_name = "Update", "modCardUpdate"
-                else:
-                    badge_text, badge_name = "Installed", "modCardInstalled"
-                badge_lbl = QLabel(badge_text)
-                badge_lbl.setObjectName(badge_name)
-                title_row.addWidget(badge_lbl)
+        self._badge_lbl = QLabel()
+        title_row.addWidget(self._badge_lbl)
 
         layout.addLayout(title_row)
 
         # Meta row: author · N downloads
-        meta_parts = []
+        self._meta_lbl = QLabel()
+        self._meta_lbl.setObjectName("modCardMeta")
+        layout.addWidget(self._meta_lbl)
+
+        # Summary (2 lines max)
+        self._summ_lbl = QLabel()
+        self._summ_lbl.setObjectName("modCardSummary")
+        self._summ_lbl.setWordWrap(True)
+        self._summ_lbl.setMaximumHeight(40)
+        layout.addWidget(self._summ_lbl)
+
+        self.set_entry(entry, installed_versions)
+
+    def set_entry(self, entry: dict, installed_versions: dict | None = None) -> None:
+        """Show *entry* in this card; cards are recycled across browse pages."""
+        name = entry.get("name", "")
+        title = entry.get("title") or name
+        category = entry.get("category") or ""
         owner = entry.get("owner", "")
+        dl = entry.get("downloads_count", 0)
+        summary = (entry.get("summary") or "")[:160]
+        inst_ver = installed_versions.get(name) if installed_versions is not None else None
+        portal_ver = ""
+        if inst_ver is not None:
+            releases = entry.get("releases") or []
+            portal_ver = releases[-1].get("version", "") if releases else ""
+
+        # Re-showing the same page (refresh, folder change) leaves most cards as-is
+        key = (name, title, category, owner, dl, summary, inst_ver, portal_ver)
+        if key == self._shown_key:
+            return
+        self._shown_key = key
+        self._mod_name = name
+        self._title_lbl.setText(title)
+
+        cat = category.replace("-", " ").title()
+        self._cat_lbl.setText(cat)
+        self._cat_lbl.setVisible(bool(cat))
+
+        badge_name = ""
+        if inst_ver is not None:
+            if portal_ver and _version_lt(inst_ver, portal_ver):
+                badge_text, badge_name = "Update", "modCardUpdate"
+            else:
+                badge_text, badge_name = "Installed", "modCardInstalled"
+            self._badge_lbl.setText(badge_text)
+        if badge_name != self._badge_lbl.objectName():
+            # The badge colour comes from the stylesheet's object-name selector
+            self._badge_lbl.setObjectName(badge_name)
+            self._badge_lbl.style().unpolish(self._badge_lbl)
+            self._badge_lbl.style().polish(self._badge_lbl)
+        self._badge_lbl.setVisible(bool(badge_name))
+
+        meta_parts = []
         if owner:
             meta_parts.append(f"by {owner}")
-        dl = entry.get("downloads_count", 0)
         if dl:
             meta_parts.append(f"{dl:,}\u2193")
-        meta_lbl = QLabel("  \u00b7  ".join(meta_parts))
-        meta_lbl.setObjectName("modCardMeta")
-        layout.addWidget(meta_lbl)
+        self._meta_lbl.setText("  \u00b7  ".join(meta_parts))
 
-        # Summary (2 lines max)
-        summary = (entry.get("summary") or "")[:160]
-        if summary:
-            summ_lbl = QLabel(summary)
-            summ_lbl.setObjectName("modCardSummary")
-            summ_lbl.setWordWrap(True)
-            summ_lbl.setMaximumHeight(40)
-            layout.addWidget(summ_lbl)
+        self._summ_lbl.setText(summary)
+        self._summ_lbl.setVisible(bool(summary))
 
     def mousePressEvent(self, event) -> None:  # noqa: N802
         self.clicked.emit(self._mod_name)
@@ -306,15 +349,6 @@ class ModBrowseCard(QFrame):
 # DownloaderTab — main QWidget
 # ---------------------------------------------------------------------------
 
-_LEVEL_COLORS: Dict[str, str] = {
-    "DEBUG":    "#b0b0b0",
-    "INFO":     "#e0e0e0",
-    "WARNING":  "#ffad00",
-    "ERROR":    "#d13438",
-    "CRITICAL": "#d13438",
-    "SUCCESS":  "#4ec952",
-}
-
 _MOD_STATUS_COLORS: Dict[str, str] = {
     "Preparing...":   "#b0b0b0",
     "Downloading...": "#0078d4",
@@ -322,6 +356,9 @@ _MOD_STATUS_COLORS: Dict[str, str] = {
     "✗ Failed":       "#d13438",
 }
 
+# Lines kept in the progress console; older lines are dropped as new ones arrive
+_CONSOLE_MAX_LINES = 2000
+
 
 class DownloaderTab(QWidget):
     """Qt UI for mod downloader."""
@@ -337,6 +374,8 @@ class DownloaderTab(QWidget):
         self._search_worker  = None      # keeps SearchWorker alive until done
         self._resolve_worker = None      # keeps ResolveWorker alive until done
         self._active_worker  = None      # keeps DownloadWorker alive (legacy fallback)
+        self._online_worker  = None      # keeps OnlineCheckWorker alive until done
+        self._pending_download: Optional[tuple] = None  # (url, folder, optionals) awaiting the probe
         self._browse_worker  = None      # keeps CategoryBrowseWorker alive until done
         self._request_token  = 0         # incremented on every new search/browse request
         self._current_query    = ""
@@ -348,6 +387,9 @@ class DownloaderTab(QWidget):
         self._opt_dep_checkboxes: list = []  # per-load optional dep checkboxes
         self._installed_mod_names: dict = {}  # mod_name → installed version string
         self._last_results: list = []         # last grid results (for badge refresh)
+        self._card_pool: list = []            # ModBrowseCards reused across pages
+        self._grid_status_lbl: Optional[QLabel] = None  # reused "Loading…" / error label
+        self._grid_stretch_row = 0            # grid row holding the trailing stretch
         self._setup_ui()
         self._restore_config()
 
@@ -585,11 +627,8 @@ class DownloaderTab(QWidget):
         self.deps_hdr.setObjectName("depsHeader")
         card_vbox.addWidget(self.deps_hdr)
 
-        # Dynamic deps container — cleared and rebuilt each mod load
-        self._deps_widget = QWidget()
-        self._deps_layout = QVBoxLayout(self._deps_widget)
-        self._deps_layout.setContentsMargins(0, 2, 0, 0)
-        self._deps_layout.setSpacing(2)
+        # Dynamic deps container — replaced wholesale each mod load
+        self._deps_widget, self._deps_layout = self._new_deps_container()
         card_vbox.addWidget(self._deps_widget)
 
         # Conflict warning section (hidden until a loaded mod has installed conflicts)
@@ -650,6 +689,7 @@ class DownloaderTab(QWidget):
         self.console.setFont(QFont("Cascadia Code", 9))
         self.console.setFixedHeight(90)
         self.console.setPlaceholderText("Download progress will appear here…")
+        self.console.document().setMaximumBlockCount(_CONSOLE_MAX_LINES)
         prog_layout.addWidget(self.console)
 
         right_layout.addWidget(self._progress_widget)
@@ -665,6 +705,13 @@ class DownloaderTab(QWidget):
         self._search_timer.setInterval(500)
         self._search_timer.timeout.connect(self._perform_search)
 
+        # Console lines are buffered and appended in batches (see _append_console)
+        self._console_pending: list = []
+        self._console_timer = QTimer(self)
+        self._console_timer.setSingleShot(True)
+        self._console_timer.setInterval(50)
+        self._console_timer.timeout.connect(self._flush_console)
+
         # Refresh badges whenever the mods folder path changes
         self.folder_edit.textChanged.connect(self._on_folder_changed)
 
@@ -692,13 +739,26 @@ class DownloaderTab(QWidget):
     # ------------------------------------------------------------------
 
     def _append_console(self, message, level="INFO"):
-        """Append HTML-escaped, color-coded line to the progress console."""
-        color = _LEVEL_COLORS.get(level.upper(), "#e0e0e0")
-        safe = html_lib.escape(message)
-        self.console.append(f'<span style="color:{color};">{safe}</span>')
+        """Buffer an HTML-escaped, color-coded line for the progress console."""
+        self._console_pending.append(console_line_html(message, level))
+        if not self._console_timer.isActive():
+            self._console_timer.start()
+
+    def _flush_console(self) -> None:
+        """Append every buffered console line in one insert, then scroll once."""
+        if not self._console_pending:
+            return
+        html = "".join(self._console_pending)
+        self._console_pending.clear()
+        self.console.append(html)
         sb = self.console.verticalScrollBar()
         sb.setValue(sb.maximum())
 
+    def _clear_console(self) -> None:
+        """Empty the console, dropping any lines still waiting to be flushed."""
+        self._console_pending.clear()
+        self.console.clear()
+
     # ------------------------------------------------------------------
     # Category chip handler
     # ------------------------------------------------------------------
@@ -718,12 +778,17 @@ class DownloaderTab(QWidget):
     # ------------------------------------------------------------------
 
     def _fire_browse(self, query: str, category: str, version: str, page: int) -> None:
-        """Start a new browse/search worker, cancelling any running one."""
+        """Start a new browse/search worker, cancelling any running one.
+
+        A superseded worker is only asked to stop: its late result is dropped
+        by the interruption check and the request token, so the UI thread never
+        blocks waiting for an in-flight portal request.
+        """
         for w in (self._search_worker, self._browse_worker):
             if w is not None and w.isRunning():
                 w.requestInterruption()
-                w.quit()
-                w.wait()
+        self._search_worker = None
+        self._browse_worker = None
 
         self._current_query    = query
         self._current_category = category
@@ -752,51 +817,91 @@ class DownloaderTab(QWidget):
 
         worker.result.connect(self._on_search_result)
         worker.error.connect(lambda e: self._show_grid_status(f"Error: {e}"))
+        worker.finished.connect(self._on_browse_worker_finished)
         worker.start()
 
+    @Slot()
+    def _on_browse_worker_finished(self) -> None:
+        """Forget and free a browse/search worker once its thread has exited."""
+        worker = self.sender()
+        if worker is self._search_worker:
+            self._search_worker = None
+        if worker is self._browse_worker:
+            self._browse_worker = None
+        worker.deleteLater()
+
     # ------------------------------------------------------------------
     # Grid helpers
     # ------------------------------------------------------------------
 
     def _clear_grid(self) -> None:
-        """Remove all widgets from the browse grid."""
+        """Detach all widgets from the browse grid, hiding them for reuse."""
         while self._grid_layout.count():
             item = self._grid_layout.takeAt(0)
             if item.widget():
-                item.widget().deleteLater()
+                item.widget().hide()
+        self._grid_layout.setRowStretch(self._grid_stretch_row, 0)
+
+    def _set_grid_stretch_row(self, row: int) -> None:
+        """Give *row* the trailing stretch that keeps cards from growing vertically."""
+        self._grid_stretch_row = row
+        self._grid_layout.setRowStretch(row, 1)
 
     def _show_grid_status(self, msg: str) -> None:
         """Clear grid and show a centred status label spanning both columns."""
         self._clear_grid()
-        lbl = QLabel(msg)
-        lbl.setAlignment(Qt.AlignmentFlag.AlignCenter)
-        lbl.setObjectName("modMeta")
-        self._grid_layout.addWidget(lbl, 0, 0, 1, 2)
-        self._grid_layout.setRowStretch(0, 0)
-        self._grid_layout.setRowStretch(1, 1)
+        if self._grid_status_lbl is None:
+            self._grid_status_lbl = QLabel(parent=self._grid_container)
+            self._grid_status_lbl.setAlignment(Qt.AlignmentFlag.AlignCenter)
+            self._grid_status_lbl.setObjectName("modMeta")
+        self._grid_status_lbl.setText(msg)
+        self._grid_layout.addWidget(self._grid_status_lbl, 0, 0, 1, 2)
+        self._grid_status_lbl.show()
+        self._set_grid_stretch_row(1)
 
     def _populate_grid(self, results: list) -> None:
-        """Fill the browse grid with ModBrowseCard widgets."""
+        """Fill the browse grid with ModBrowseCard widgets, reusing pooled cards.
+
+        Card *i* always sits at the same grid cell, so pooled cards already in
+        the layout stay put and only surplus ones are hidden; the container is
+        repainted once after every card has been updated.
+        """
         self._last_results = results
         folder = self.folder_edit.text().strip()
         if folder:
             self._installed_mod_names = self._scan_installed_mod_names(folder)
-        self._clear_grid()
         if not results:
             self._show_grid_status("No mods found.")
             return
-        for i, entry in enumerate(results):
-            row, col = divmod(i, 2)
-            card = ModBrowseCard(
-                entry,
-                installed_versions=self._installed_mod_names if self._installed_mod_names else None,
-                parent=self._grid_container,
-            )
-            card.clicked.connect(self._on_card_clicked)
-            self._grid_layout.addWidget(card, row, col)
-        # Trailing stretch so cards don't expand vertically
-        last_row = (len(results) - 1) // 2 + 1
-        self._grid_layout.setRowStretch(last_row, 1)
+        installed = self._installed_mod_names if self._installed_mod_names else None
+        layout = self._grid_layout
+        pool = self._card_pool
+        self._grid_container.setUpdatesEnabled(False)
+        try:
+            if self._grid_status_lbl is not None and layout.indexOf(self._grid_status_lbl) >= 0:
+                self._clear_grid()
+            for i, entry in enumerate(results):
+                if i < len(pool):
+                    card = pool[i]
+                    card.set_entry(entry, installed_versions=installed)
+                else:
+                    card = ModBrowseCard(
+                        entry, installed_versions=installed, parent=self._grid_container,
+                    )
+                    card.clicked.connect(self._on_card_clicked)
+                    pool.append(card)
+                if layout.indexOf(card) < 0:
+                    row, col = divmod(i, 2)
+                    layout.addWidget(card, row, col)
+                if card.isHidden():
+                    card.show()
+            for card in pool[len(results):]:
+                card.hide()
+            # Trailing stretch so cards don't expand vertically
+            layout.setRowStretch(self._grid_stretch_row, 0)
+            self._set_grid_stretch_row((len(results) - 1) // 2 + 1)
+        finally:
+            self._grid_container.setUpdatesEnabled(True)
         self._grid_scroll.verticalScrollBar().setValue(0)
 
     def _update_pagination_ui(self) -> None:
@@ -897,13 +1002,30 @@ class DownloaderTab(QWidget):
             return
         self._notify("Resolving mod details...", event_key="mod_resolve")
         self.load_btn.setEnabled(False)
+        # Supersede a resolve still in flight (e.g. a second card click) so its
+        # slower reply can never overwrite the newer mod's details
+        stale = self._resolve_worker
+        if stale is not None and stale.isRunning():
+            stale.resolved.disconnect(self._advance_to_stage_2)
+            stale.error.disconnect(self._on_resolve_error)
+            stale.requestInterruption()
         worker = ResolveWorker(url, parent=self)
         self._resolve_worker = worker
         worker.resolved.connect(self._advance_to_stage_2)
         worker.error.connect(self._on_resolve_error)
-        worker.finished.connect(lambda: self.load_btn.setEnabled(True))
+        worker.finished.connect(self._on_resolve_worker_finished)
         worker.start()
 
+    @Slot()
+    def _on_resolve_worker_finished(self) -> None:
+        """Re-enable Load once no newer resolve is still running."""
+        worker = self.sender()
+        if worker is self._resolve_worker:
+            self._resolve_worker = None
+        if self._resolve_worker is None:
+            self.load_btn.setEnabled(True)
+        worker.deleteLater()
+
     @Slot(object)
     def _populate_mod_info(self, info):
         title   = info.get("title") or info.get("name", "")
@@ -937,11 +1059,11 @@ class DownloaderTab(QWidget):
         # Parse and display dependencies
         req, opt, base, incompat = self._parse_deps(info)
 
-        # Rebuild dep rows from scratch
-        while self._deps_layout.count():
-            item = self._deps_layout.takeAt(0)
-            if item.widget():
-                item.widget().deleteLater()
+        # Build the dep rows into a fresh, not-yet-shown container and swap it
+        # in: nothing is laid out or painted per row, and the old container
+        # takes all of its rows with it in a single deleteLater
+        old_deps = self._deps_widget
+        self._deps_widget, self._deps_layout = self._new_deps_container()
         self._opt_dep_checkboxes = []
 
         def _dep_section(section_title, names, prefix="\u2192", obj_name="depRow"):
@@ -972,6 +1094,10 @@ class DownloaderTab(QWidget):
         _dep_section("Base / Expansion", base, "\u25c6", "depRow")
         _dep_section("Incompatible", incompat, "\u2715", "depRowIncompat")
 
+        self._mod_card.layout().replaceWidget(old_deps, self._deps_widget)
+        old_deps.hide()
+        old_deps.deleteLater()
+
         any_deps = bool(req or opt or base or incompat)
         self.deps_hdr.setVisible(any_deps)
         self._dep_divider.setVisible(any_deps)
@@ -984,6 +1110,15 @@ class DownloaderTab(QWidget):
         self._no_mod_lbl.setVisible(False)
         self._resolve_worker = None
 
+    @staticmethod
+    def _new_deps_container():
+        """Empty (widget, layout) pair for the dependency rows."""
+        widget = QWidget()
+        layout = QVBoxLayout(widget)
+        layout.setContentsMargins(0, 2, 0, 0)
+        layout.setSpacing(2)
+        return widget, layout
+
     def _refresh_conflict_section(self, incompat_names: list) -> None:
         """Rebuild the inline conflict warning panel based on installed mods."""
         # Clear existing rows
@@ -1015,18 +1150,15 @@ class DownloaderTab(QWidget):
             disable_btn = QPushButton("Disable")
             disable_btn.setObjectName("conflictDisableBtn")
             disable_btn.setFlat(True)
-            # Capture name in default arg to avoid late-binding
-            disable_btn.clicked.connect(
-                lambda _checked=False, n=mod_name: self._on_conflict_disable(n)
-            )
+            disable_btn.setProperty("mod_name", mod_name)
+            disable_btn.clicked.connect(self._on_conflict_disable_clicked)
             row.addWidget(disable_btn)
 
             remove_btn = QPushButton("Remove")
             remove_btn.setObjectName("destructiveButton")
             remove_btn.setFlat(True)
-            remove_btn.clicked.connect(
-                lambda _checked=False, n=mod_name: self._on_conflict_remove(n)
-            )
+            remove_btn.setProperty("mod_name", mod_name)
+            remove_btn.clicked.connect(self._on_conflict_remove_clicked)
             row.addWidget(remove_btn)
 
             container = QWidget()
@@ -1035,6 +1167,16 @@ class DownloaderTab(QWidget):
 
         self._conflict_section.setVisible(True)
 
+    @Slot()
+    def _on_conflict_disable_clicked(self) -> None:
+        """Shared slot for every conflict row's Disable button."""
+        self._on_conflict_disable(sender_property(self, "mod_name"))
+
+    @Slot()
+    def _on_conflict_remove_clicked(self) -> None:
+        """Shared slot for every conflict row's Remove button."""
+        self._on_conflict_remove(sender_property(self, "mod_name"))
+
     def _on_conflict_disable(self, mod_name: str) -> None:
         """Disable a conflicting mod via mod-list.json (does not remove the file)."""
         folder = self.folder_edit.text().strip()
@@ -1148,33 +1290,23 @@ class DownloaderTab(QWidget):
     @staticmethod
     def _parse_deps(info):
         """Return (required, optional, base, incompatible) lists from raw portal dict."""
-        from ..core.mod import FACTORIO_EXPANSIONS
         releases = info.get("releases", [])
         if not releases:
             return [], [], [], []
         deps_raw = releases[-1].get("info_json", {}).get("dependencies", [])
         required, optional, base, incompatible = [], [], [], []
         for dep in deps_raw:
-            dep = dep.strip()
-            if not dep or dep == "base" or dep.startswith("base "):
+            prefix, name, _constraint = DEP_STRING_RE.match(dep.strip()).groups()
+            if not name or name == "base":
                 continue
-            if dep.startswith("!"):
-                name = re.split(r"[\s><=!]", dep[1:].strip())[0]
-                if name:
-                    incompatible.append(name)
-            elif dep.startswith("(?)") or dep.startswith("?"):
-                clean = dep.replace("(?)", "").replace("?", "").strip()
-                name  = re.split(r"[\s><=!]", clean)[0]
-                if name in FACTORIO_EXPANSIONS:
-                    base.append(name)
-                elif name:
-                    optional.append(name)
+            if prefix == "!":
+                incompatible.append(name)
+            elif name in FACTORIO_EXPANSIONS:
+                base.append(name)
+            elif prefix:
+                optional.append(name)
             else:
-                name = re.split(r"[\s><=!]", dep)[0]
-                if name in FACTORIO_EXPANSIONS:
-                    base.append(name)
-                elif name:
-                    required.append(name)
+                required.append(name)
         return required, optional, base, incompatible
 
     # ------------------------------------------------------------------
@@ -1197,18 +1329,36 @@ class DownloaderTab(QWidget):
         if not folder:
             self._notify("Please select a mods folder.", "error")
             return
-        online, _offline_reason = is_online()
+        if self._online_worker is not None:
+            return  # a probe for the previous click is still running
+
+        # The connectivity probe does a DNS lookup, so it runs off the UI thread;
+        # the download itself starts from _on_online_checked.
+        selected_optionals = [cb.text() for cb in self._opt_dep_checkboxes if cb.isChecked()]
+        self._pending_download = (url, folder, selected_optionals)
+        self.download_btn.setEnabled(False)
+        worker = OnlineCheckWorker(parent=self)
+        self._online_worker = worker
+        worker.checked.connect(self._on_online_checked)
+        worker.finished.connect(worker.deleteLater)
+        worker.start()
+
+    @Slot(bool, str)
+    def _on_online_checked(self, online: bool, _offline_reason: str) -> None:
+        self._online_worker = None
+        pending, self._pending_download = self._pending_download, None
+        self.download_btn.setEnabled(True)
+        if pending is None:
+            return
         if not online:
             self._notify("You appear to be offline.", "error")
             return
+        self._start_download(*pending)
 
-        selected_optionals = [cb.text() for cb in self._opt_dep_checkboxes if cb.isChecked()]
-
+    def _start_download(self, url: str, folder: str, selected_optionals: list) -> None:
         # ── Queue-backed path ──────────────────────────────────────────
         if self._queue_controller is not None:
-            import re as _re
-            m = _re.search(r"/mod/([^/?&\s]+)", url)
-            mod_name = m.group(1) if m else url.strip()
+            mod_name = mod_name_from_url(url)
             max_workers = config.get("max_workers", 4)
 
             op = QueueOperation(
@@ -1236,7 +1386,7 @@ class DownloaderTab(QWidget):
             self.progress_bar.setProperty("completed", "false")
             self.progress_bar.style().unpolish(self.progress_bar)
             self.progress_bar.style().polish(self.progress_bar)
-            self.console.clear()
+            self._clear_console()
 
             self._notify(f"Resolving {mod_name}\u2026", "info")
             return
@@ -1248,7 +1398,7 @@ class DownloaderTab(QWidget):
         self.progress_bar.setProperty("completed", "false")
         self.progress_bar.style().unpolish(self.progress_bar)
         self.progress_bar.style().polish(self.progress_bar)
-        self.console.clear()
+        self._clear_console()
 
         worker = DownloadWorker(url, folder, False, extra_mods=selected_optionals, parent=self)
         self._active_worker = worker
@@ -1,7 +1,7 @@
 """Shared filter/sort bar and category chip bar — Phase 3."""
 from __future__ import annotations
 
-from PySide6.QtCore import QTimer, Qt, Signal
+from PySide6.QtCore import QTimer, Qt, Signal, Slot
 from PySide6.QtWidgets import (
     QComboBox,
     QHBoxLayout,
@@ -15,7 +15,8 @@ from PySide6.QtWidgets import (
 class FilterSortBar(QWidget):
     """Horizontal filter/sort control bar.
 
-    Emits filter_changed(query, status, sort_by, priority) with 200 ms debounce.
+    Emits filter_changed(query, status, sort_by, priority) with 150 ms debounce,
+    and only when the resulting filter state differs from the last emission.
     status values: "all" | "up_to_date" | "outdated" | "selected"
     sort_by values: "name" | "version" | "downloads" | "date"
     priority: context-specific string injected by host page, or "" if no priority combo.
@@ -40,9 +41,10 @@ class FilterSortBar(QWidget):
     def __init__(self, parent=None):
         super().__init__(parent)
         self._priority_combo: QComboBox | None = None
+        self._last_emitted: tuple[str, str, str, str] | None = None
         self._debounce = QTimer(self)
         self._debounce.setSingleShot(True)
-        self._debounce.setInterval(200)
+        self._debounce.setInterval(150)
         self._debounce.timeout.connect(self._emit_changed)
         self._setup_ui()
 
@@ -110,7 +112,12 @@ class FilterSortBar(QWidget):
             if self._priority_combo is not None
             else ""
         )
-        self.filter_changed.emit(query, status, sort_by, priority)
+        state = (query, status, sort_by, priority)
+        # Whitespace edits or type-then-undo bursts land on the same state
+        if state == self._last_emitted:
+            return
+        self._last_emitted = state
+        self.filter_changed.emit(*state)
 
     def get_query(self) -> str:
         """Return current search text (for external callers)."""
@@ -188,9 +195,7 @@ class CategoryChipsBar(QWidget):
             btn = QPushButton(label)
             btn.setObjectName("categoryChip")
             btn.setProperty("category_value", value)
-            btn.clicked.connect(
-                lambda checked=False, v=value, b=btn: self._on_chip_clicked(v, b)
-            )
+            btn.clicked.connect(self._on_chip_clicked)
             # Insert before trailing stretch
             self._chips_layout.insertWidget(self._chips_layout.count() - 1, btn)
 
@@ -199,7 +204,10 @@ class CategoryChipsBar(QWidget):
         if first:
             self._set_active(first)
 
-    def _on_chip_clicked(self, value: str, btn: QPushButton) -> None:
+    @Slot()
+    def _on_chip_clicked(self) -> None:
+        btn = self.sender()
+        value = btn.property("category_value")
         self._set_active(btn)
         # "All" sentinel → emit empty string (no category filter)
         self.category_selected.emit("" if value == "All" else value)
@@ -279,9 +287,7 @@ class VersionFilterBar(QWidget):
             btn = QPushButton(label)
             btn.setObjectName("categoryChip")
             btn.setProperty("category_value", value)
-            btn.clicked.connect(
-                lambda checked=False, v=value, b=btn: self._on_chip_clicked(v, b)
-            )
+            btn.clicked.connect(self._on_chip_clicked)
             self._chips_layout.insertWidget(self._chips_layout.count() - 1, btn)
 
         # Activate "All Versions" by default
@@ -289,7 +295,10 @@ class VersionFilterBar(QWidget):
         if first:
             self._set_active(first)
 
-    def _on_chip_clicked(self, value: str, btn: QPushButton) -> None:
+    @Slot()
+    def _on_chip_clicked(self) -> None:
+        btn = self.sender()
+        value = btn.property("category_value")
         self._set_active(btn)
         self.version_selected.emit(value)
 
@@ -5,7 +5,7 @@ import html as html_lib
 from queue import Queue
 from typing import Optional, TYPE_CHECKING
 
-from PySide6.QtCore import Slot
+from PySide6.QtCore import QTimer, Slot
 from PySide6.QtWidgets import (
     QHBoxLayout,
     QLabel,
@@ -30,6 +30,9 @@ _LEVEL_COLORS: dict[str, str] = {
 }
 _DEFAULT_COLOR = "#e0e0e0"
 
+# Log entries kept on screen; the oldest are dropped as new ones arrive
+_LOG_MAX_ENTRIES = 5000
+
 
 class LoggerTab(QWidget):
     """Logs tab — real-time signal-driven log display."""
@@ -42,6 +45,11 @@ class LoggerTab(QWidget):
     ) -> None:
         super().__init__(parent)
         self._log_queue = log_queue  # kept for API compat; not polled
+        self._pending: list[str] = []  # formatted lines awaiting _flush_log
+        self._flush_timer = QTimer(self)
+        self._flush_timer.setSingleShot(True)
+        self._flush_timer.setInterval(50)
+        self._flush_timer.timeout.connect(self._flush_log)
         self._setup_ui()
         if log_bridge is not None:
             # Direct signal connection — thread-safe via AutoConnection
@@ -75,20 +83,34 @@ class LoggerTab(QWidget):
         mono_font = QFontDatabase.systemFont(QFontDatabase.SystemFont.FixedFont)
         mono_font.setPointSize(10)
         self.log_text.setFont(mono_font)
+        # Each <pre> entry is one block, so this caps the scroll-back in entries
+        self.log_text.document().setMaximumBlockCount(_LOG_MAX_ENTRIES)
         root.addWidget(self.log_text, stretch=1)
 
     @Slot(str, str)
     def _append_log(self, message: str, level_name: str) -> None:
-        """Append a color-coded log entry. Called on main thread via Signal."""
+        """Buffer a color-coded log entry. Called on main thread via Signal."""
         color = _LEVEL_COLORS.get(level_name.upper(), _DEFAULT_COLOR)
         # Escape HTML entities in the message to prevent injection via log content
         safe_message = html_lib.escape(message)
-        html_line = f'<pre style="color:{color};white-space:pre-wrap;margin:0;">{safe_message}</pre>'
-        self.log_text.append(html_line)
+        self._pending.append(
+            f'<pre style="color:{color};white-space:pre-wrap;margin:0;">{safe_message}</pre>'
+        )
+        if not self._flush_timer.isActive():
+            self._flush_timer.start()
+
+    def _flush_log(self) -> None:
+        """Append every buffered entry in one insert, then scroll once."""
+        if not self._pending:
+            return
+        html = "".join(self._pending)
+        self._pending.clear()
+        self.log_text.append(html)
         # Auto-scroll to latest entry
         sb = self.log_text.verticalScrollBar()
         sb.setValue(sb.maximum())
 
     def clear_logs(self) -> None:
         """Clear all log entries from the display (PREP-04 behavior)."""
+        self._pending.clear()
         self.log_text.clear()
@@ -38,6 +38,7 @@ class MainWindow(QMainWindow):
         self.log_queue = log_queue
         self.log_bridge = log_bridge
         self.logger = logging.getLogger("factorio_mod_manager")
+        self._details_dialog: Optional[ModDetailsDialog] = None  # reused across opens
 
         self.setWindowTitle("🏭 Factorio Mod Manager v1.1.0")
         self.setMinimumSize(1100, 750)
@@ -399,16 +400,21 @@ class MainWindow(QMainWindow):
                 return
         else:
             # Fetch full portal metadata for non-installed mods
-            from ..core.portal import FactorioPortalAPI
+            from ..core.portal import get_portal
             try:
-                portal = FactorioPortalAPI()
+                portal = get_portal()
                 data = portal.get_mod(mod_name)
             except Exception:
                 # Fall back to minimal data if portal fetch fails
                 data = {"name": mod_name}
 
-        dialog = ModDetailsDialog(data, source, parent=self, installed_mods=mods_dict)
-        dialog.exec()
+        if self._details_dialog is None:
+            self._details_dialog = ModDetailsDialog(
+                data, source, parent=self, installed_mods=mods_dict
+            )
+        else:
+            self._details_dialog.load(data, source, installed_mods=mods_dict)
+        self._details_dialog.exec()
 
     # ------------------------------------------------------------------
     # System theme auto-switch
@@ -1,16 +1,31 @@
 """Mod details popup dialog — Phase 5 (3-tab: Overview / Dependencies / Changelog)."""
 from __future__ import annotations
 
+import atexit
+import functools
+import json
+import os
+import re
+import tempfile
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import Future
+from pathlib import Path
 from typing import Union
 
 from PySide6.QtCore import Qt, QThread, Signal, Slot
-from PySide6.QtGui import QColor, QFont, QFontDatabase
+from PySide6.QtGui import QColor, QFont, QFontDatabase, QTextCharFormat, QTextCursor
 from PySide6.QtWidgets import (
+    QAbstractItemView,
+    QApplication,
     QButtonGroup,
     QDialog,
+    QGridLayout,
     QHBoxLayout,
     QHeaderView,
     QLabel,
+    QPlainTextEdit,
     QPushButton,
     QScrollArea,
     QSplitter,
@@ -24,7 +39,7 @@ from PySide6.QtWidgets import (
 
 from ..core import Mod, ModStatus
 from ..core.dependency_graph import DepType, DepState, DepNode, build_dep_graph
-from ..core.portal import FactorioPortalAPI
+from ..core.portal import get_portal
 
 
 # ---------------------------------------------------------------------------
@@ -39,15 +54,297 @@ _STATUS_DISPLAY = {
 }
 
 
+@functools.lru_cache(maxsize=None)
+def _shared_font(role: str) -> QFont:
+    """Return the shared QFont for *role* ("bold" | "italic" | "title" | "fixed").
+
+    Built once per process on first use (a QApplication must exist) so
+    labels and tree items reuse one font instead of deriving a copy each.
+    """
+    if role == "title":
+        return QFont("Segoe UI", 12, QFont.Weight.Bold)
+    if role == "fixed":
+        font = QFontDatabase.systemFont(QFontDatabase.SystemFont.FixedFont)
+        font.setPointSize(9)
+        return font
+    font = QFont(QApplication.font())
+    if role == "bold":
+        font.setBold(True)
+    elif role == "italic":
+        font.setItalic(True)
+    return font
+
+
+_MUTED_COLOR = QColor("#b0b0b0")
+
+# Dependency tree: state chip text and colour, parsed once per process
+_STATE_CHIP: dict[DepState, tuple[str, QColor]] = {
+    DepState.INSTALLED:   ("\u2713 Installed",        QColor("#4ec952")),
+    DepState.MISSING:     ("\u2717 Missing",         QColor("#d13438")),
+    DepState.PORTAL_ONLY: ("\u25cb Portal",          _MUTED_COLOR),
+    DepState.EXPANSION:   ("\U0001f512 Non-downloadable", _MUTED_COLOR),
+    DepState.CIRCULAR:    ("\u21ba Circular",         QColor("#ffad00")),
+}
+_NO_STATE_CHIP = ("", _MUTED_COLOR)
+
+# Dependency inspector: state colours and explanatory notes
+_INSPECTOR_STATE_COLOR: dict[DepState, str] = {
+    DepState.INSTALLED:   "#4ec952",
+    DepState.MISSING:     "#d13438",
+    DepState.PORTAL_ONLY: "#b0b0b0",
+    DepState.EXPANSION:   "#b0b0b0",
+    DepState.CIRCULAR:    "#ffad00",
+}
+_INSPECTOR_STATE_NOTE: dict[DepState, tuple[str, str]] = {
+    DepState.EXPANSION: (
+        "Requires official Factorio content. This requirement is informational "
+        "and cannot be queued as a mod download.",
+        "#b0b0b0",
+    ),
+    DepState.MISSING: (
+        "This mod is required but not installed. "
+        "Consider downloading it before updating.",
+        "#d13438",
+    ),
+    DepState.CIRCULAR: (
+        "Circular dependency detected — this node was already visited "
+        "in the current tree path.",
+        "#ffad00",
+    ),
+}
+
+_VER_RE = re.compile(r"\d+")
+
+
+def _version_key(v: str, _findall=_VER_RE.findall) -> tuple:
+    """Sortable tuple for a version string; tolerates suffixes like "1.2.3-rc1"."""
+    return tuple(map(int, _findall(v)))
+
+
+# Wheel scrolling is left to Qt's native scroll areas; views only set a
+# pixel step so each notch moves a fixed distance without Python handlers.
+_WHEEL_STEP_PX = 20
+
+
+@functools.lru_cache(maxsize=256)
+def _format_meta_line(author: str, version: str, downloads: "int | None") -> str:
+    """Build the "by X · vY · N downloads" header line (memoized per mod state)."""
+    meta_parts: list[str] = []
+    if author:
+        meta_parts.append(f"by {author}")
+    if version:
+        meta_parts.append(f"v{version}")
+    if downloads is not None:
+        meta_parts.append(f"{downloads:,} downloads")
+    return "  \u00b7  ".join(meta_parts)
+
+
+# ---------------------------------------------------------------------------
+# Changelog cache — changelogs change a few times a day at most, so repeat
+# opens of the same mod are served from cache instead of re-fetching the page.
+# Entries carry epoch timestamps and are persisted to the user config dir so
+# they survive restarts; disk writes are debounced to one flush per interval.
+# ---------------------------------------------------------------------------
+
+_CHANGELOG_TTL_S = 24 * 3600.0
+_CHANGELOG_CACHE_MAX = 64
+_CHANGELOG_CACHE_FILE = Path.home() / ".factorio_mod_manager" / "changelog_cache.json"
+_CHANGELOG_FLUSH_DELAY_S = 10.0
+_changelog_cache: "OrderedDict[str, tuple[float, dict]]" = OrderedDict()
+_changelog_inflight: "dict[str, Future]" = {}   # mod name → fetch in progress
+_changelog_lock = threading.RLock()
+_changelog_flush_timer: "threading.Timer | None" = None
+_changelog_cache_loaded = False
+
+
+def _ensure_changelog_cache_loaded() -> None:
+    """Read the disk cache on first use and only then arm the exit-time flush."""
+    global _changelog_cache_loaded
+    with _changelog_lock:
+        if _changelog_cache_loaded:
+            return
+        _changelog_cache_loaded = True
+        _load_changelog_cache()
+        atexit.register(_flush_pending_changelog_cache)
+
+
+def _get_cached_changelog(mod_name: str) -> "dict | None":
+    """Return the cached changelog for *mod_name*, or None if missing/expired."""
+    with _changelog_lock:
+        _ensure_changelog_cache_loaded()
+        entry = _changelog_cache.get(mod_name)
+        if entry is None:
+            return None
+        if time.time() - entry[0] >= _CHANGELOG_TTL_S:
+            del _changelog_cache[mod_name]
+            return None
+        _changelog_cache.move_to_end(mod_name)
+        return entry[1]
+
+
+def _store_changelog(mod_name: str, data: dict) -> None:
+    """Cache *data* for *mod_name*, evicting the least recently used entries."""
+    with _changelog_lock:
+        _ensure_changelog_cache_loaded()
+        _changelog_cache[mod_name] = (time.time(), data)
+        _changelog_cache.move_to_end(mod_name)
+        while len(_changelog_cache) > _CHANGELOG_CACHE_MAX:
+            _changelog_cache.popitem(last=False)
+        _schedule_changelog_flush()
+
+
+def prefetch_changelog(mod_name: str) -> None:
+    """Warm the changelog cache for *mod_name* on a daemon thread.
+
+    Failures are ignored; the details dialog retries and reports them when
+    it is actually opened.
+    """
+    if _get_cached_changelog(mod_name) is not None:
+        return
+
+    def _warm() -> None:
+        try:
+            _fetch_changelog(mod_name)
+        except Exception:
+            pass
+
+    threading.Thread(target=_warm, name=f"changelog-prefetch-{mod_name}", daemon=True).start()
+
+
+def _load_changelog_cache() -> None:
+    """Populate the in-memory cache from disk, skipping expired or malformed entries."""
+    try:
+        with open(_CHANGELOG_CACHE_FILE, "r", encoding="utf-8") as fh:
+            raw = json.load(fh)
+    except (OSError, ValueError):
+        return
+    if not isinstance(raw, dict):
+        return
+
+    now = time.time()
+    entries = []
+    for name, entry in raw.items():
+        try:
+            ts = float(entry["ts"])
+            data = entry["data"]
+        except (TypeError, KeyError, ValueError):
+            continue
+        if isinstance(data, dict) and now - ts < _CHANGELOG_TTL_S:
+            entries.append((ts, name, data))
+    entries.sort(key=lambda e: e[0])
+    with _changelog_lock:
+        for ts, name, data in entries[-_CHANGELOG_CACHE_MAX:]:
+            _changelog_cache[name] = (ts, data)
+
+
+def _schedule_changelog_flush() -> None:
+    """Arm a one-shot flush timer unless one is already pending."""
+    global _changelog_flush_timer
+    with _changelog_lock:
+        if _changelog_flush_timer is not None:
+            return
+        timer = threading.Timer(_CHANGELOG_FLUSH_DELAY_S, _flush_changelog_cache)
+        timer.daemon = True
+        _changelog_flush_timer = timer
+        timer.start()
+
+
+def _flush_changelog_cache() -> None:
+    """Write the cache to disk atomically (temp file + os.replace)."""
+    global _changelog_flush_timer
+    with _changelog_lock:
+        if _changelog_flush_timer is not None:
+            _changelog_flush_timer.cancel()
+            _changelog_flush_timer = None
+        payload = {
+            name: {"ts": ts, "data": data}
+            for name, (ts, data) in _changelog_cache.items()
+        }
+
+    path = _CHANGELOG_CACHE_FILE
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(
+            dir=path.parent,
+            prefix=".changelog-cache-tmp-",
+            suffix=".json",
+        )
+    except OSError:
+        return
+    try:
+        with os.fdopen(fd, "w", encoding="utf-8") as fh:
+            json.dump(payload, fh)
+        os.replace(tmp_path, path)
+    except (OSError, TypeError, ValueError):
+        try:
+            os.unlink(tmp_path)
+        except OSError:
+            pass
+
+
+def _flush_pending_changelog_cache() -> None:
+    """Flush at interpreter exit if a debounced write is still pending."""
+    if _changelog_flush_timer is not None:
+        _flush_changelog_cache()
+
+
+
+def _fetch_changelog(mod_name: str) -> dict:
+    """Return the changelog for *mod_name*, serving cache hits and sharing one
+    portal request between concurrent callers for the same mod.
+
+    Raises:
+        PortalAPIError: If the portal request fails (raised in every waiter).
+    """
+    with _changelog_lock:
+        cached = _get_cached_changelog(mod_name)
+        if cached is not None:
+            return cached
+        fut = _changelog_inflight.get(mod_name)
+        owner = fut is None
+        if owner:
+            fut = Future()
+            _changelog_inflight[mod_name] = fut
+    if not owner:
+        return fut.result()
+
+    try:
+        data = get_portal().get_mod_changelog(mod_name)
+    except BaseException as exc:
+        fut.set_exception(exc)
+        raise
+    else:
+        _store_changelog(mod_name, data)
+        fut.set_result(data)
+        return data
+    finally:
+        with _changelog_lock:
+            _changelog_inflight.pop(mod_name, None)
+
+
 # ---------------------------------------------------------------------------
 # Worker threads
 # ---------------------------------------------------------------------------
 
+# Stopped workers still blocked in a portal call, kept alive after their tab
+# is deleted until run() returns
+_detached_workers: "set[QThread]" = set()
+
+
+def _detach_worker(worker: "QThread | None") -> None:
+    """Unparent a still-running worker so deleting its owner cannot destroy it."""
+    if worker is None or not worker.isRunning():
+        return
+    worker.setParent(None)
+    _detached_workers.add(worker)
+    worker.finished.connect(lambda: _detached_workers.discard(worker))
+    worker.finished.connect(worker.deleteLater)
+
 
 class DepGraphWorker(QThread):
     """Runs build_dep_graph() in a background thread."""
 
-    graph_ready = Signal(list)   # list[DepNode]
+    graph_ready = Signal(list, int)   # (list[DepNode], request token)
     error = Signal(str)
 
     def __init__(
@@ -55,12 +352,14 @@ class DepGraphWorker(QThread):
         mod_name: str,
         installed_mods: dict,
         full: bool = False,
+        token: int = 0,
         parent=None,
     ):
         super().__init__(parent)
         self._mod_name = mod_name
         self._installed_mods = installed_mods
         self._full = full
+        self._token = token
         self._should_stop = False
 
     def stop(self) -> None:
@@ -71,12 +370,12 @@ class DepGraphWorker(QThread):
         try:
             if self._should_stop:
                 return
-            portal = FactorioPortalAPI()
+            portal = get_portal()
             nodes = build_dep_graph(
                 self._mod_name, self._installed_mods, portal, full=self._full
             )
             if not self._should_stop:
-                self.graph_ready.emit(nodes)
+                self.graph_ready.emit(nodes, self._token)
         except Exception as exc:
             if not self._should_stop:
                 self.error.emit(str(exc))
@@ -101,8 +400,7 @@ class ChangelogWorker(QThread):
         try:
             if self._should_stop:
                 return
-            portal = FactorioPortalAPI()
-            data = portal.get_mod_changelog(self._mod_name)
+            data = _fetch_changelog(self._mod_name)
             if not self._should_stop:
                 self.changelog_ready.emit(data)
         except Exception as exc:
@@ -220,17 +518,17 @@ class DependenciesWidget(QWidget):
         self._tree.header().setSectionResizeMode(1, QHeaderView.ResizeMode.ResizeToContents)
         self._tree.header().setSectionResizeMode(2, QHeaderView.ResizeMode.ResizeToContents)
         self._tree.setMinimumWidth(300)
+        self._tree.setVerticalScrollMode(QAbstractItemView.ScrollMode.ScrollPerPixel)
+        self._tree.verticalScrollBar().setSingleStep(_WHEEL_STEP_PX)
         self._tree.currentItemChanged.connect(self._update_inspector)
         splitter.addWidget(self._tree)
 
         inspector_scroll = QScrollArea()
         inspector_scroll.setWidgetResizable(True)
         inspector_scroll.setMinimumWidth(240)
+        inspector_scroll.verticalScrollBar().setSingleStep(_WHEEL_STEP_PX)
         self._inspector_widget = QWidget()
-        self._inspector_layout = QVBoxLayout(self._inspector_widget)
-        self._inspector_layout.setContentsMargins(8, 8, 8, 8)
-        self._inspector_layout.setSpacing(4)
-        self._inspector_layout.addStretch()
+        self._setup_inspector()
         inspector_scroll.setWidget(self._inspector_widget)
         splitter.addWidget(inspector_scroll)
 
@@ -285,15 +583,15 @@ class DependenciesWidget(QWidget):
         current_token = self._dep_graph_request_id
 
         self._worker = DepGraphWorker(
-            self._mod_name, self._installed_mods, self._full_mode, parent=self
-        )
-        self._worker.graph_ready.connect(
-            lambda nodes, _tok=current_token: self._on_graph_ready(nodes, _tok)
+            self._mod_name, self._installed_mods, self._full_mode,
+            token=current_token, parent=self,
         )
+        # Bound slots get a queued connection, so all widget work runs on the UI thread
+        self._worker.graph_ready.connect(self._on_graph_ready)
         self._worker.error.connect(self._on_load_error)
         self._worker.start()
 
-    @Slot(list)
+    @Slot(list, int)
     def _on_graph_ready(self, nodes: list, token: int = 0) -> None:
         # Discard results from a superseded request (stale worker)
         if token != self._dep_graph_request_id:
@@ -316,7 +614,10 @@ class DependenciesWidget(QWidget):
     # ------------------------------------------------------------------ tree
 
     def _populate_tree(self, nodes: list) -> None:
+        # Items are assembled detached and attached in one call so the tree and
+        # its ResizeToContents header columns lay out once, not once per item.
         self._tree.blockSignals(True)
+        self._tree.setUpdatesEnabled(False)
         self._tree.clear()
 
         groups: dict[DepType, tuple[str, list]] = {
@@ -328,128 +629,133 @@ class DependenciesWidget(QWidget):
         for node in nodes:
             groups[node.dep_type][1].append(node)
 
-        _STATE_CHIP: dict[DepState, tuple[str, str]] = {
-            DepState.INSTALLED:   ("\u2713 Installed",        "#4ec952"),
-            DepState.MISSING:     ("\u2717 Missing",         "#d13438"),
-            DepState.PORTAL_ONLY: ("\u25cb Portal",          "#b0b0b0"),
-            DepState.EXPANSION:   ("\U0001f512 Non-downloadable", "#b0b0b0"),
-            DepState.CIRCULAR:    ("\u21ba Circular",         "#ffad00"),
-        }
-
+        group_items: list[QTreeWidgetItem] = []
         for dep_type, (group_label, dep_nodes) in groups.items():
             group_item = QTreeWidgetItem([group_label])
-            f = group_item.font(0)
-            f.setBold(True)
-            group_item.setFont(0, f)
-            self._tree.addTopLevelItem(group_item)
+            group_item.setFont(0, _shared_font("bold"))
+            group_items.append(group_item)
 
             if not dep_nodes:
                 none_item = QTreeWidgetItem(["(none)", "", ""])
-                none_item.setForeground(0, QColor("#b0b0b0"))
-                fi = none_item.font(0)
-                fi.setItalic(True)
-                none_item.setFont(0, fi)
+                none_item.setForeground(0, _MUTED_COLOR)
+                none_item.setFont(0, _shared_font("italic"))
                 group_item.addChild(none_item)
             else:
                 for node in dep_nodes:
                     chip_text, chip_color = _STATE_CHIP.get(
-                        node.state, ("", "#b0b0b0")
+                        node.state, _NO_STATE_CHIP
                     )
                     item = QTreeWidgetItem([
                         node.name,
                         chip_text,
                         node.version_constraint,
                     ])
-                    item.setForeground(1, QColor(chip_color))
+                    item.setForeground(1, chip_color)
                     item.setData(0, Qt.ItemDataRole.UserRole, node)
 
                     if dep_type == DepType.OPTIONAL and not self._full_mode:
-                        item.setForeground(0, QColor("#b0b0b0"))
+                        item.setForeground(0, _MUTED_COLOR)
 
                     group_item.addChild(item)
 
                     for child in node.children:
-                        c_chip, c_color = _STATE_CHIP.get(child.state, ("", "#b0b0b0"))
+                        c_chip, c_color = _STATE_CHIP.get(child.state, _NO_STATE_CHIP)
                         child_item = QTreeWidgetItem([
                             f"  \u2514 {child.name}",
                             c_chip,
                             child.version_constraint,
                         ])
-                        child_item.setForeground(1, QColor(c_color))
+                        child_item.setForeground(1, c_color)
                         child_item.setData(0, Qt.ItemDataRole.UserRole, child)
                         item.addChild(child_item)
 
+        self._tree.addTopLevelItems(group_items)
+        for group_item in group_items:
             group_item.setExpanded(True)
 
+        self._tree.setUpdatesEnabled(True)
         self._tree.blockSignals(False)
 
     # ------------------------------------------------------------------ inspector
 
+    def _setup_inspector(self) -> None:
+        """Build the inspector once as a two-column grid; selections only update text."""
+        grid = QGridLayout(self._inspector_widget)
+        grid.setContentsMargins(8, 8, 8, 8)
+        grid.setHorizontalSpacing(10)
+        grid.setVerticalSpacing(4)
+        grid.setColumnStretch(1, 1)
+
+        def _value_lbl() -> QLabel:
+            lbl = QLabel()
+            lbl.setWordWrap(True)
+            lbl.setTextFormat(Qt.TextFormat.PlainText)
+            return lbl
+
+        self._insp_name_lbl = _value_lbl()
+        self._insp_name_lbl.setFont(_shared_font("bold"))
+        grid.addWidget(self._insp_name_lbl, 0, 0, 1, 2)
+
+        # (caption, value) label pairs for the Type / State / Installed / Requires rows
+        self._insp_rows: dict[str, tuple[QLabel, QLabel]] = {}
+        for row, key in enumerate(("Type", "State", "Installed", "Requires"), start=1):
+            caption = QLabel(f"{key}:")
+            value = _value_lbl()
+            grid.addWidget(caption, row, 0, Qt.AlignmentFlag.AlignTop)
+            grid.addWidget(value, row, 1)
+            self._insp_rows[key] = (caption, value)
+
+        self._insp_note_lbl = _value_lbl()
+        grid.addWidget(self._insp_note_lbl, 5, 0, 1, 2)
+        grid.setRowStretch(6, 1)
+
+        self._clear_inspector()
+
+    def _clear_inspector(self) -> None:
+        self._insp_name_lbl.setVisible(False)
+        for caption, value in self._insp_rows.values():
+            caption.setVisible(False)
+            value.setVisible(False)
+        self._insp_note_lbl.setVisible(False)
+
+    def _set_inspector_row(self, key: str, text: str, color: str = "") -> None:
+        caption, value = self._insp_rows[key]
+        visible = bool(text)
+        if visible:
+            value.setText(text)
+            value.setStyleSheet(f"color: {color};" if color else "")
+        caption.setVisible(visible)
+        value.setVisible(visible)
+
     def _update_inspector(
         self, current: "QTreeWidgetItem | None", _previous: "QTreeWidgetItem | None"
     ) -> None:
-        while self._inspector_layout.count() > 1:
-            item = self._inspector_layout.takeAt(0)
-            if item.widget():
-                item.widget().deleteLater()
-
-        if current is None:
-            return
-
-        node: "DepNode | None" = current.data(0, Qt.ItemDataRole.UserRole)
+        node: "DepNode | None" = (
+            current.data(0, Qt.ItemDataRole.UserRole) if current is not None else None
+        )
         if node is None:
+            self._clear_inspector()
             return
 
-        _STATE_COLOR: dict[DepState, str] = {
-            DepState.INSTALLED:   "#4ec952",
-            DepState.MISSING:     "#d13438",
-            DepState.PORTAL_ONLY: "#b0b0b0",
-            DepState.EXPANSION:   "#b0b0b0",
-            DepState.CIRCULAR:    "#ffad00",
-        }
-
-        def _add_lbl(text: str, bold: bool = False, color: str = "") -> None:
-            lbl = QLabel(text)
-            lbl.setWordWrap(True)
-            lbl.setTextFormat(Qt.TextFormat.PlainText)
-            if bold:
-                f = lbl.font()
-                f.setBold(True)
-                lbl.setFont(f)
-            if color:
-                lbl.setStyleSheet(f"color: {color};")
-            self._inspector_layout.insertWidget(
-                self._inspector_layout.count() - 1, lbl
-            )
+        self._insp_name_lbl.setText(node.name)
+        self._insp_name_lbl.setVisible(True)
+        self._set_inspector_row("Type", node.dep_type.value.title())
+        self._set_inspector_row(
+            "State",
+            node.state.value.replace("_", " ").title(),
+            _INSPECTOR_STATE_COLOR.get(node.state, ""),
+        )
+        self._set_inspector_row(
+            "Installed", f"v{node.installed_version}" if node.installed_version else ""
+        )
+        self._set_inspector_row("Requires", node.version_constraint or "")
 
-        _add_lbl(node.name, bold=True)
-        _add_lbl(f"Type: {node.dep_type.value.title()}")
-        color = _STATE_COLOR.get(node.state, "")
-        _add_lbl(f"State: {node.state.value.replace('_', ' ').title()}", color=color)
-
-        if node.installed_version:
-            _add_lbl(f"Installed: v{node.installed_version}")
-        if node.version_constraint:
-            _add_lbl(f"Requires: {node.version_constraint}")
-
-        if node.state == DepState.EXPANSION:
-            _add_lbl(
-                "Requires official Factorio content. This requirement is informational "
-                "and cannot be queued as a mod download.",
-                color="#b0b0b0",
-            )
-        elif node.state == DepState.MISSING:
-            _add_lbl(
-                "This mod is required but not installed. "
-                "Consider downloading it before updating.",
-                color="#d13438",
-            )
-        elif node.state == DepState.CIRCULAR:
-            _add_lbl(
-                "Circular dependency detected — this node was already visited "
-                "in the current tree path.",
-                color="#ffad00",
-            )
+        note = _INSPECTOR_STATE_NOTE.get(node.state)
+        if note is not None:
+            text, color = note
+            self._insp_note_lbl.setText(text)
+            self._insp_note_lbl.setStyleSheet(f"color: {color};")
+        self._insp_note_lbl.setVisible(note is not None)
 
 
 # ---------------------------------------------------------------------------
@@ -493,84 +799,68 @@ class ChangelogWidget(QWidget):
         self._empty_lbl.setVisible(False)
         root.addWidget(self._empty_lbl)
 
-        self._scroll_area = QScrollArea()
-        self._scroll_area.setWidgetResizable(True)
-        self._scroll_area.setVisible(False)
-
+        # Single read-only text view for every entry; headers are styled via
+        # char formats instead of one label + text edit per version. A plain
+        # text edit lays out blocks lazily, so only the versions scrolled into
+        # view are laid out no matter how long the history is.
         self._content_widget = QWidget()
-        self._content_layout = QVBoxLayout(self._content_widget)
-        self._content_layout.setContentsMargins(0, 0, 0, 0)
-        self._content_layout.setSpacing(12)
+        self._content_widget.setVisible(False)
+        content_layout = QVBoxLayout(self._content_widget)
+        content_layout.setContentsMargins(0, 0, 0, 0)
+        content_layout.setSpacing(8)
 
         self._delta_header_lbl = QLabel()
         self._delta_header_lbl.setVisible(False)
-        f = self._delta_header_lbl.font()
-        f.setBold(True)
-        self._delta_header_lbl.setFont(f)
-        self._content_layout.addWidget(self._delta_header_lbl)
+        self._delta_header_lbl.setFont(_shared_font("bold"))
+        content_layout.addWidget(self._delta_header_lbl)
+
+        self._text = QPlainTextEdit()
+        self._text.setReadOnly(True)
+        self._text.setLineWrapMode(QPlainTextEdit.LineWrapMode.WidgetWidth)
+        self._text.setFont(_shared_font("fixed"))
+        content_layout.addWidget(self._text, stretch=1)
+
+        self._history_btn = QPushButton()
+        self._history_btn.setCheckable(True)
+        self._history_btn.setVisible(False)
+        self._history_btn.toggled.connect(self._on_history_toggled)
+        content_layout.addWidget(self._history_btn)
 
-        self._scroll_area.setWidget(self._content_widget)
-        root.addWidget(self._scroll_area, stretch=1)
+        root.addWidget(self._content_widget, stretch=1)
+
+        self._header_fmt = QTextCharFormat()
+        self._header_fmt.setFontWeight(QFont.Weight.Bold)
+        self._body_fmt = QTextCharFormat()
+        self._muted_fmt = QTextCharFormat()
+        self._muted_fmt.setForeground(_MUTED_COLOR)
+
+        self._data: dict = {}
+        self._delta_versions: list = []
+        self._history_versions: list = []
 
     # ------------------------------------------------------------------ helpers
 
-    @staticmethod
-    def _sort_versions(versions: list) -> list:
-        def _key(v: str):
-            try:
-                return tuple(int(x) for x in v.split(".") if x.isdigit())
-            except Exception:
-                return (0,)
-
-        return sorted(versions, key=_key, reverse=True)
-
-    @staticmethod
-    def _is_newer(a: str, b: str) -> bool:
-        def _tup(v: str):
-            try:
-                return tuple(int(x) for x in v.split(".") if x.isdigit())
-            except Exception:
-                return (0,)
-
-        return _tup(a) > _tup(b)
-
-    def _make_entry_widget(self, version: str, text: str, expanded: bool) -> QWidget:
-        container = QWidget()
-        vbox = QVBoxLayout(container)
-        vbox.setContentsMargins(0, 0, 0, 0)
-        vbox.setSpacing(4)
-
-        hdr = QLabel(f"Version {version}")
-        hdr.setTextFormat(Qt.TextFormat.PlainText)
-        f = hdr.font()
-        f.setBold(True)
-        hdr.setFont(f)
-        vbox.addWidget(hdr)
-
-        te = QTextEdit()
-        te.setReadOnly(True)
-        te.setPlainText(text)
-        fixed_font = QFontDatabase.systemFont(QFontDatabase.SystemFont.FixedFont)
-        fixed_font.setPointSize(9)
-        te.setFont(fixed_font)
-        te.document().setTextWidth(te.viewport().width() or 400)
-        te.setFixedHeight(min(int(te.document().size().height()) + 12, 300))
-
-        if not expanded:
-            te.setVisible(False)
-            toggle_lbl = QLabel("\u25b6 Show")
-            toggle_lbl.setStyleSheet("color: #0078d4; cursor: pointer;")
-            toggle_lbl.setCursor(Qt.CursorShape.PointingHandCursor)
-
-            def _toggle(_e=None, _te=te, _lbl=toggle_lbl):
-                _te.setVisible(not _te.isVisible())
-                _lbl.setText("\u25bc Hide" if _te.isVisible() else "\u25b6 Show")
-
-            toggle_lbl.mousePressEvent = _toggle
-            vbox.addWidget(toggle_lbl)
-
-        vbox.addWidget(te)
-        return container
+    def _render(self) -> None:
+        """Write the delta entries (and older history if toggled) into the text view."""
+        self._text.clear()
+        cursor = self._text.textCursor()
+        for version in self._delta_versions:
+            cursor.insertText(f"Version {version}\n", self._header_fmt)
+            cursor.insertText(f"{self._data[version]}\n\n", self._body_fmt)
+        if self._history_versions and self._history_btn.isChecked():
+            cursor.insertText("Older history\n\n", self._muted_fmt)
+            for version in self._history_versions:
+                cursor.insertText(f"Version {version}\n", self._header_fmt)
+                cursor.insertText(f"{self._data[version]}\n\n", self._body_fmt)
+        self._text.moveCursor(QTextCursor.MoveOperation.Start)
+
+    def _on_history_toggled(self, checked: bool) -> None:
+        n = len(self._history_versions)
+        self._history_btn.setText(
+            "\u25bc Hide older history" if checked else f"\u25b6 Show older history ({n})"
+        )
+        if self._data:
+            self._render()
 
     # ------------------------------------------------------------------ public
 
@@ -581,7 +871,7 @@ class ChangelogWidget(QWidget):
         if self._worker is not None and self._worker.isRunning():
             return
         self._loading_lbl.setVisible(True)
-        self._scroll_area.setVisible(False)
+        self._content_widget.setVisible(False)
         self._empty_lbl.setVisible(False)
 
         self._worker = ChangelogWorker(self._mod_name, parent=self)
@@ -598,17 +888,21 @@ class ChangelogWidget(QWidget):
             self._empty_lbl.setVisible(True)
             return
 
-        sorted_versions = self._sort_versions(list(data.keys()))
+        # Parse each version once; the keyed list drives both the sort and the split
+        keyed = sorted(
+            ((_version_key(v), v) for v in data), reverse=True
+        )
+        sorted_versions = [v for _, v in keyed]
 
         if self._installed_version:
-            delta_versions = [
-                v for v in sorted_versions
-                if self._is_newer(v, self._installed_version)
-            ]
-            history_versions = [
-                v for v in sorted_versions
-                if not self._is_newer(v, self._installed_version)
-            ]
+            # Descending order: the delta is the prefix newer than the installed key
+            installed_key = _version_key(self._installed_version)
+            split = next(
+                (i for i, (k, _) in enumerate(keyed) if not k > installed_key),
+                len(keyed),
+            )
+            delta_versions = sorted_versions[:split]
+            history_versions = sorted_versions[split:]
         else:
             delta_versions = sorted_versions[:1]
             history_versions = sorted_versions[1:]
@@ -622,21 +916,12 @@ class ChangelogWidget(QWidget):
             )
             self._delta_header_lbl.setVisible(True)
 
-        for version in delta_versions:
-            widget = self._make_entry_widget(version, data[version], expanded=True)
-            self._content_layout.addWidget(widget)
-
-        if history_versions:
-            hist_lbl = QLabel("Older history")
-            hist_lbl.setTextFormat(Qt.TextFormat.PlainText)
-            hist_lbl.setStyleSheet("color: #b0b0b0;")
-            self._content_layout.addWidget(hist_lbl)
-            for version in history_versions:
-                widget = self._make_entry_widget(version, data[version], expanded=False)
-                self._content_layout.addWidget(widget)
-
-        self._content_layout.addStretch()
-        self._scroll_area.setVisible(True)
+        self._data = data
+        self._delta_versions = delta_versions
+        self._history_versions = history_versions
+        self._history_btn.setVisible(bool(history_versions))
+        self._on_history_toggled(self._history_btn.isChecked())  # renders the view
+        self._content_widget.setVisible(True)
 
     @Slot(str)
     def _on_load_error(self, _msg: str) -> None:
@@ -648,7 +933,7 @@ class ChangelogWidget(QWidget):
             "then reopen details or run Check for Updates again."
         )
         self._empty_lbl.setVisible(True)
-        self._scroll_area.setVisible(False)
+        self._content_widget.setVisible(False)
 
     def _stop_worker(self) -> None:
         """Stop the background worker thread if running."""
@@ -689,14 +974,40 @@ class ModDetailsDialog(QDialog):
     ):
         super().__init__(parent)
         self.setMinimumSize(860, 620)
+        # Final size is set before the widget tree exists so the first layout
+        # pass already runs at it; Qt centres the dialog over its parent on
+        # show, so no screen geometry is queried. Reopens keep this geometry.
+        self.resize(980, 700)
+        # Modality plus the parent keeps the dialog above the main window; no
+        # WindowStaysOnTopHint, which would pin it over every other app too.
         self.setModal(True)
 
+        self._deps_widget: "DependenciesWidget | None" = None
+        self._changelog_widget: "ChangelogWidget | None" = None
+        self._setup_ui()
+
+        self.load(data, source, initial_tab=initial_tab, installed_mods=installed_mods)
+
+    def load(
+        self,
+        data: Union[Mod, dict],
+        source: str,
+        *,
+        initial_tab: str = "overview",
+        installed_mods: "dict | None" = None,
+    ) -> None:
+        """Repopulate the dialog for another mod, reusing the existing widget tree.
+
+        Only the Dependencies and Changelog tabs are rebuilt, since they hold
+        per-mod worker state; labels, the overview and the footer are updated
+        in place.
+        """
         self._mod: "Mod | None" = data if isinstance(data, Mod) else None
         self._installed_mods: dict = installed_mods or {}
 
         if isinstance(data, Mod):
             self._name = data.name
-            self._title = data.title or data.name
+            self._title = data.display_title
             self._author = data.author or ""
             self._version = data.version or ""
             self._installed_version: "str | None" = data.version or None
@@ -721,52 +1032,40 @@ class ModDetailsDialog(QDialog):
         self._source = source
         self._initial_tab = initial_tab
         self.setWindowTitle(self._title)
-        self._setup_ui()
-
-        self.resize(980, 700)
+        self._populate_header()
+        self._rebuild_tabs()
 
         _tab_map = {"overview": 0, "dependencies": 1, "changelog": 2}
         _idx = _tab_map.get(initial_tab, 0)
+        self._tab_widget.blockSignals(True)
+        self._tab_widget.setCurrentIndex(_idx)
+        self._tab_widget.blockSignals(False)
         if _idx != 0:
-            self._tab_widget.setCurrentIndex(_idx)
+            self._on_tab_changed(_idx)
 
     def _setup_ui(self) -> None:
         root = QVBoxLayout(self)
         root.setContentsMargins(20, 16, 20, 12)
         root.setSpacing(8)
 
-        title_lbl = QLabel(self._title)
-        title_lbl.setFont(QFont("Segoe UI", 12, QFont.Weight.Bold))
-        title_lbl.setTextFormat(Qt.TextFormat.PlainText)
-        title_lbl.setWordWrap(True)
-        root.addWidget(title_lbl)
-
-        meta_parts: list[str] = []
-        if self._author:
-            meta_parts.append(f"by {self._author}")
-        if self._version:
-            meta_parts.append(f"v{self._version}")
-        if self._downloads is not None:
-            meta_parts.append(f"{self._downloads:,} downloads")
-        if meta_parts:
-            meta_lbl = QLabel("  \u00b7  ".join(meta_parts))
-            meta_lbl.setObjectName("searchResultMeta")
-            meta_lbl.setTextFormat(Qt.TextFormat.PlainText)
-            root.addWidget(meta_lbl)
+        self._title_lbl = QLabel()
+        self._title_lbl.setFont(_shared_font("title"))
+        self._title_lbl.setTextFormat(Qt.TextFormat.PlainText)
+        self._title_lbl.setWordWrap(True)
+        root.addWidget(self._title_lbl)
 
-        if self._status is not None:
-            status_text, color = _STATUS_DISPLAY.get(
-                self._status, ("? Unknown", "#b0b0b0")
-            )
-            status_lbl = QLabel(status_text)
-            status_lbl.setTextFormat(Qt.TextFormat.PlainText)
-            status_lbl.setStyleSheet(f"color: {color}; font-weight: bold;")
-            root.addWidget(status_lbl)
+        self._meta_lbl = QLabel()
+        self._meta_lbl.setObjectName("searchResultMeta")
+        self._meta_lbl.setTextFormat(Qt.TextFormat.PlainText)
+        root.addWidget(self._meta_lbl)
+
+        self._status_lbl = QLabel()
+        self._status_lbl.setTextFormat(Qt.TextFormat.PlainText)
+        root.addWidget(self._status_lbl)
 
-            if self._status == ModStatus.OUTDATED and self._latest_version:
-                latest_lbl = QLabel(f"Latest: v{self._latest_version}")
-                latest_lbl.setTextFormat(Qt.TextFormat.PlainText)
-                root.addWidget(latest_lbl)
+        self._latest_lbl = QLabel()
+        self._latest_lbl.setTextFormat(Qt.TextFormat.PlainText)
+        root.addWidget(self._latest_lbl)
 
         # Tab widget
         self._tab_widget = QTabWidget()
@@ -776,12 +1075,72 @@ class ModDetailsDialog(QDialog):
         overview_layout = QVBoxLayout(overview_tab)
         overview_layout.setContentsMargins(0, 8, 0, 0)
         overview_layout.setSpacing(0)
-        desc_edit = QTextEdit()
-        desc_edit.setReadOnly(True)
-        desc_edit.setPlainText(self._description or "No description available.")
-        overview_layout.addWidget(desc_edit)
+        self._desc_edit = QTextEdit()
+        self._desc_edit.setReadOnly(True)
+        overview_layout.addWidget(self._desc_edit)
         self._tab_widget.addTab(overview_tab, "Overview")
 
+        # Tabs 1 and 2 (Dependencies / Changelog) are created per mod in _rebuild_tabs()
+        self._tab_widget.currentChanged.connect(self._on_tab_changed)
+        root.addWidget(self._tab_widget, stretch=1)
+
+        # Footer
+        footer = QWidget()
+        footer_layout = QHBoxLayout(footer)
+        footer_layout.setContentsMargins(0, 4, 0, 0)
+        footer_layout.setSpacing(8)
+
+        self._cta_btn = QPushButton("View on Portal")
+        self._cta_btn.setObjectName("accentButton")
+        self._cta_btn.clicked.connect(self._on_cta)
+        footer_layout.addWidget(self._cta_btn)
+
+        close_btn = QPushButton("Close")
+        close_btn.clicked.connect(self.reject)
+
+        footer_layout.addStretch()
+        footer_layout.addWidget(close_btn)
+        root.addWidget(footer)
+
+    def _populate_header(self) -> None:
+        """Update the header labels, overview text and footer for the current mod."""
+        self._title_lbl.setText(self._title)
+
+        meta_text = _format_meta_line(self._author, self._version, self._downloads)
+        self._meta_lbl.setText(meta_text)
+        self._meta_lbl.setVisible(bool(meta_text))
+
+        if self._status is not None:
+            status_text, color = _STATUS_DISPLAY.get(
+                self._status, ("? Unknown", "#b0b0b0")
+            )
+            self._status_lbl.setText(status_text)
+            self._status_lbl.setStyleSheet(f"color: {color}; font-weight: bold;")
+            self._status_lbl.setVisible(True)
+        else:
+            self._status_lbl.setVisible(False)
+
+        show_latest = self._status == ModStatus.OUTDATED and bool(self._latest_version)
+        if show_latest:
+            self._latest_lbl.setText(f"Latest: v{self._latest_version}")
+        self._latest_lbl.setVisible(show_latest)
+
+        self._desc_edit.setPlainText(self._description or "No description available.")
+        self._cta_btn.setVisible(self._source == "portal")
+
+    def _rebuild_tabs(self) -> None:
+        """Replace the Dependencies and Changelog tabs with fresh per-mod widgets."""
+        self._tab_widget.blockSignals(True)
+        for old in (self._deps_widget, self._changelog_widget):
+            if old is not None:
+                worker = old._worker
+                old._stop_worker()
+                # A worker stuck in a slow portal call outlives wait(1000);
+                # destroying it with its tab would abort the process
+                _detach_worker(worker)
+                self._tab_widget.removeTab(self._tab_widget.indexOf(old))
+                old.deleteLater()
+
         # Tab 1: Dependencies
         self._deps_widget = DependenciesWidget(
             mod_name=self._name,
@@ -799,29 +1158,7 @@ class ModDetailsDialog(QDialog):
             parent=self,
         )
         self._tab_widget.addTab(self._changelog_widget, "Changelog")
-
-        self._tab_widget.currentChanged.connect(self._on_tab_changed)
-        root.addWidget(self._tab_widget, stretch=1)
-
-        # Footer
-        footer = QWidget()
-        footer_layout = QHBoxLayout(footer)
-        footer_layout.setContentsMargins(0, 4, 0, 0)
-        footer_layout.setSpacing(8)
-
-        if self._source == "portal":
-            cta_label = "View on Portal"
-            cta_btn = QPushButton(cta_label)
-            cta_btn.setObjectName("accentButton")
-            cta_btn.clicked.connect(self._on_cta)
-            footer_layout.addWidget(cta_btn)
-
-        close_btn = QPushButton("Close")
-        close_btn.clicked.connect(self.reject)
-
-        footer_layout.addStretch()
-        footer_layout.addWidget(close_btn)
-        root.addWidget(footer)
+        self._tab_widget.blockSignals(False)
 
     def _on_tab_changed(self, idx: int) -> None:
         if idx == 1:
@@ -0,0 +1,179 @@
+"""Table model backing the Checker tab's mod list.
+
+Rows are (mod_name, Mod) pairs held in Python; the view asks for cell data
+only for the rows it paints, so no per-cell objects exist at all.
+"""
+from __future__ import annotations
+
+from typing import Dict, List, Optional, Tuple
+
+from PySide6.QtCore import QAbstractTableModel, QModelIndex, Qt, Signal
+from PySide6.QtGui import QColor
+
+from ..core import Mod, ModStatus
+from ..core.update_guidance import UpdateClassification
+
+COLUMNS = ["✔", "On", "Name", "Status", "Guidance", "Version", "Author", "Downloads"]
+COL_SELECT, COL_ENABLED = 0, 1
+
+_STATUS_COLORS: Dict[ModStatus, tuple] = {
+    ModStatus.UP_TO_DATE: ("✓ Up to date",  "#4ec952"),
+    ModStatus.OUTDATED:   ("⬆️ Outdated",    "#ffad00"),
+    ModStatus.UNKNOWN:    ("❓ Unknown",     "#b0b0b0"),
+    ModStatus.ERROR:      ("✗ Error",       "#d13438"),
+}
+
+_GUIDANCE_CHIPS: Dict[UpdateClassification, tuple] = {
+    UpdateClassification.SAFE:   ("Safe",   "#4ec952"),
+    UpdateClassification.REVIEW: ("Review", "#ffad00"),
+    UpdateClassification.RISKY:  ("Risky",  "#d13438"),
+}
+
+_DIM_COLOR = "#888888"  # text colour for disabled mods (D-14)
+
+_ENABLED_TOOLTIP = "Enable / disable this mod (keeps ZIP on disk)"
+
+_CHECK_FLAGS = (
+    Qt.ItemFlag.ItemIsUserCheckable | Qt.ItemFlag.ItemIsEnabled | Qt.ItemFlag.ItemIsSelectable
+)
+_TEXT_FLAGS = Qt.ItemFlag.ItemIsEnabled | Qt.ItemFlag.ItemIsSelectable
+
+_colors: Dict[str, QColor] = {}
+
+
+def _color(hex_color: str) -> QColor:
+    """Shared QColor per hex string, so painting never allocates one."""
+    color = _colors.get(hex_color)
+    if color is None:
+        color = _colors[hex_color] = QColor(hex_color)
+    return color
+
+
+class ModTableModel(QAbstractTableModel):
+    """Mod rows for the checker table, with the two checkbox columns.
+
+    ``selected_mods`` and ``guidance`` are the owning tab's live collections;
+    the model only reads them. Checkbox clicks are reported through
+    :attr:`select_toggled` / :attr:`enabled_toggled` so the tab can apply
+    them, after which the cell is repainted from the updated state.
+    """
+
+    select_toggled = Signal(str, int)   # mod_name, Qt.CheckState value
+    enabled_toggled = Signal(str, int)  # mod_name, Qt.CheckState value
+
+    def __init__(self, selected_mods: set, guidance: dict, parent=None) -> None:
+        super().__init__(parent)
+        self.selected_mods = selected_mods
+        self.guidance = guidance
+        self._rows: List[Tuple[str, Mod]] = []
+
+    # ------------------------------------------------------------------
+    # Row management
+    # ------------------------------------------------------------------
+
+    def rows(self) -> List[Tuple[str, Mod]]:
+        """The (mod_name, mod) pairs currently shown, in display order."""
+        return self._rows
+
+    def set_rows(self, rows: List[Tuple[str, Mod]]) -> None:
+        """Replace every row."""
+        self.beginResetModel()
+        self._rows = rows
+        self.endResetModel()
+
+    def refresh_rows(self, rows: Optional[List[Tuple[str, Mod]]] = None) -> None:
+        """Repaint from current mod data, optionally swapping in same-length rows."""
+        if rows is not None:
+            self._rows = rows
+        if self._rows:
+            self.dataChanged.emit(
+                self.index(0, 0), self.index(len(self._rows) - 1, len(COLUMNS) - 1)
+            )
+
+    def refresh_mod(self, mod_name: str) -> None:
+        """Repaint the row showing *mod_name*, if it is shown."""
+        for row, (name, _mod) in enumerate(self._rows):
+            if name == mod_name:
+                self.dataChanged.emit(self.index(row, 0), self.index(row, len(COLUMNS) - 1))
+                break
+
+    # ------------------------------------------------------------------
+    # QAbstractTableModel
+    # ------------------------------------------------------------------
+
+    def rowCount(self, parent=QModelIndex()) -> int:  # noqa: N802
+        return 0 if parent.isValid() else len(self._rows)
+
+    def columnCount(self, parent=QModelIndex()) -> int:  # noqa: N802
+        return 0 if parent.isValid() else len(COLUMNS)
+
+    def headerData(self, section, orientation, role=Qt.ItemDataRole.DisplayRole):  # noqa: N802
+        if orientation == Qt.Orientation.Horizontal and role == Qt.ItemDataRole.DisplayRole:
+            return COLUMNS[section]
+        return None
+
+    def flags(self, index) -> Qt.ItemFlag:
+        return _CHECK_FLAGS if index.column() <= COL_ENABLED else _TEXT_FLAGS
+
+    def data(self, index, role=Qt.ItemDataRole.DisplayRole):
+        mod_name, mod = self._rows[index.row()]
+        col = index.column()
+        if role == Qt.ItemDataRole.UserRole:
+            return mod_name
+
+        if col == COL_SELECT:
+            if role == Qt.ItemDataRole.CheckStateRole:
+                return (
+                    Qt.CheckState.Checked if mod_name in self.selected_mods
+                    else Qt.CheckState.Unchecked
+                )
+            return None
+        if col == COL_ENABLED:
+            if role == Qt.ItemDataRole.CheckStateRole:
+                return Qt.CheckState.Checked if mod.enabled else Qt.CheckState.Unchecked
+            if role == Qt.ItemDataRole.ToolTipRole:
+                return _ENABLED_TOOLTIP
+            return None
+
+        if role == Qt.ItemDataRole.DisplayRole:
+            return self._cell(mod_name, mod, col)[0]
+        if role == Qt.ItemDataRole.ForegroundRole:
+            # Disabled mods dim every text column (D-14 visual treatment)
+            color = _DIM_COLOR if not mod.enabled else self._cell(mod_name, mod, col)[1]
+            return _color(color) if color else None
+        return None
+
+    def setData(self, index, value, role=Qt.ItemDataRole.EditRole) -> bool:  # noqa: N802
+        if role != Qt.ItemDataRole.CheckStateRole or index.column() > COL_ENABLED:
+            return False
+        mod_name = self._rows[index.row()][0]
+        state = Qt.CheckState(value).value
+        if index.column() == COL_SELECT:
+            self.select_toggled.emit(mod_name, state)
+            # Selection only affects its own checkbox; repaint just that cell
+            self.dataChanged.emit(index, index, [Qt.ItemDataRole.CheckStateRole])
+            return True
+        self.enabled_toggled.emit(mod_name, state)
+        # Enabling/disabling re-dims the whole row
+        self.dataChanged.emit(
+            self.index(index.row(), 0), self.index(index.row(), len(COLUMNS) - 1)
+        )
+        return True
+
+    def _cell(self, mod_name: str, mod: Mod, col: int) -> tuple:
+        """(text, colour) for text column *col*; colour "" means the default."""
+        if col == 2:
+            return mod_name, ""
+        if col == 3:
+            return _STATUS_COLORS.get(mod.status, ("❓ Unknown", "#b0b0b0"))
+        if col == 4:
+            # Guidance chip (outdated mods only)
+            result = self.guidance.get(mod_name)
+            if mod.status == ModStatus.OUTDATED and result is not None:
+                return _GUIDANCE_CHIPS.get(result.classification, ("", ""))
+            return "", ""
+        if col == 5:
+            return mod.version_str, ""
+        if col == 6:
+            return mod.author or "", ""
+        return mod.downloads_str, ""
@@ -15,7 +15,8 @@ from __future__ import annotations
 
 from typing import Dict, List, Optional
 
-from PySide6.QtCore import Qt, Signal
+from PySide6.QtCore import Qt, Signal, Slot
+from PySide6.QtGui import QColor
 from PySide6.QtWidgets import (
     QButtonGroup,
     QDialog,
@@ -32,6 +33,7 @@ from PySide6.QtWidgets import (
 )
 
 from ..core.profiles import DiffAction, ProfileDiff, ProfileDiffItem, Profile, ProfileStore
+from .widgets import download_chip_qss, sender_property
 
 # -------------------------------------------------------------------------
 # Colour map for diff-action chips
@@ -53,6 +55,12 @@ _ACTION_LABEL: dict[DiffAction, str] = {
     DiffAction.DOWNLOAD: "Download",
 }
 
+# Prebuilt once instead of per diff row
+_ACTION_QCOLOUR: dict[DiffAction, QColor] = {
+    action: QColor(colour) for action, colour in _ACTION_COLOUR.items()
+}
+_FALLBACK_QCOLOUR = QColor("#888")
+
 # Actions whose items can be toggled by the user (enable/add can be skipped)
 _TOGGLEABLE = {DiffAction.ENABLE, DiffAction.ADD}
 
@@ -209,6 +217,7 @@ class ProfileApplyDialog(QDialog):
         self._tree.setSizePolicy(QSizePolicy.Policy.Expanding, QSizePolicy.Policy.Expanding)
         self._tree.setRootIsDecorated(False)
         self._tree.setIndentation(0)
+        self._tree.setStyleSheet(download_chip_qss(_ACTION_COLOUR[DiffAction.DOWNLOAD]))
         self._tree.itemChanged.connect(self._on_item_toggled)
         right_layout.addWidget(self._tree)
 
@@ -252,7 +261,7 @@ class ProfileApplyDialog(QDialog):
             if filter_id == 2 and diff_item.action == DiffAction.DOWNLOAD:
                 continue
 
-            colour = _ACTION_COLOUR.get(diff_item.action, "#888")
+            colour = _ACTION_QCOLOUR.get(diff_item.action, _FALLBACK_QCOLOUR)
             action_text = _ACTION_LABEL.get(diff_item.action, diff_item.action.value)
 
             tree_item = QTreeWidgetItem()
@@ -273,8 +282,7 @@ class ProfileApplyDialog(QDialog):
                 tree_item.setText(0, diff_item.mod_name)
                 # Action chip as text in column 1
                 tree_item.setText(1, f"[{action_text}]")
-                from PySide6.QtGui import QColor
-                tree_item.setForeground(1, QColor(colour))
+                tree_item.setForeground(1, colour)
             elif diff_item.action == DiffAction.DOWNLOAD:
                 tree_item.setFlags(Qt.ItemFlag.ItemIsEnabled)
                 tree_item.setText(0, diff_item.mod_name)
@@ -282,12 +290,9 @@ class ProfileApplyDialog(QDialog):
                 dl_btn = QPushButton("Add to Queue")
                 dl_btn.setFixedHeight(22)
                 dl_btn.setObjectName("downloadChipButton")
-                dl_btn.setStyleSheet(
-                    f"background:{colour}; color:#fff; border-radius:3px; font-size:11px;"
-                    "padding:0 6px; border:none;"
-                )
                 mod_name = diff_item.mod_name
-                dl_btn.clicked.connect(lambda _=False, n=mod_name: self._on_download_click(n))
+                dl_btn.setProperty("mod_name", mod_name)
+                dl_btn.clicked.connect(self._on_download_btn_clicked)
                 self._tree.addTopLevelItem(tree_item)
                 self._tree.setItemWidget(tree_item, 1, dl_btn)
                 # Skip the generic addTopLevelItem below
@@ -297,8 +302,7 @@ class ProfileApplyDialog(QDialog):
                 tree_item.setFlags(Qt.ItemFlag.ItemIsEnabled)
                 tree_item.setText(0, diff_item.mod_name)
                 tree_item.setText(1, f"[{action_text}]")
-                from PySide6.QtGui import QColor
-                tree_item.setForeground(1, QColor(colour))
+                tree_item.setForeground(1, colour)
 
             self._tree.addTopLevelItem(tree_item)
 
@@ -332,6 +336,12 @@ class ProfileApplyDialog(QDialog):
     def _apply_filter(self, filter_id: int) -> None:
         self._populate_tree(filter_id)
 
+    @Slot()
+    def _on_download_btn_clicked(self) -> None:
+        mod_name = sender_property(self, "mod_name")
+        if mod_name:
+            self._on_download_click(mod_name)
+
     def _on_download_click(self, mod_name: str) -> None:
         reply = QMessageBox.question(
             self,
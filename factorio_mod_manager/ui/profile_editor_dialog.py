@@ -18,7 +18,8 @@ from __future__ import annotations
 import logging
 from typing import Any, Dict, List, Optional, Set, Tuple
 
-from PySide6.QtCore import QTimer, Qt, Signal
+from PySide6.QtCore import QTimer, Qt, Signal, Slot
+from PySide6.QtGui import QColor
 from PySide6.QtWidgets import (
     QAbstractItemView,
     QDialog,
@@ -36,11 +37,18 @@ from PySide6.QtWidgets import (
 )
 
 from ..core.profiles import Profile, ProfileStore
+from .widgets import download_chip_qss, sender_property
 
 logger = logging.getLogger(__name__)
 
 _PAGE_SIZE = 50
 
+# Row colours, prebuilt once instead of per tree row
+_MUTED_FG = QColor("#888")
+_NOT_DOWNLOADED_FG = QColor("#9c27b0")
+_DISABLED_FG = QColor("#ff9800")
+_ENABLED_FG = QColor("#4caf50")
+
 # ---------------------------------------------------------------------------
 # Pure helper functions (testable without Qt)
 # ---------------------------------------------------------------------------
@@ -277,6 +285,7 @@ class ProfileEditorDialog(QDialog):
         self._tree.setAlternatingRowColors(True)
         self._tree.setRootIsDecorated(False)
         self._tree.setIndentation(0)
+        self._tree.setStyleSheet(download_chip_qss("#9c27b0"))
         self._tree.setSelectionMode(QAbstractItemView.SelectionMode.SingleSelection)
         self._tree.setContextMenuPolicy(Qt.ContextMenuPolicy.CustomContextMenu)
         self._tree.customContextMenuRequested.connect(self._on_context_menu)
@@ -439,8 +448,7 @@ class ProfileEditorDialog(QDialog):
             # Mod name (col 1)
             tree_item.setText(1, row["title"])
             if not is_installed:
-                from PySide6.QtGui import QColor
-                tree_item.setForeground(1, QColor("#888"))
+                tree_item.setForeground(1, _MUTED_FG)
 
             # Version (col 2)
             tree_item.setText(2, row["version"])
@@ -448,16 +456,13 @@ class ProfileEditorDialog(QDialog):
             # Status chip (col 3)
             if not is_installed:
                 tree_item.setText(3, "Not Downloaded")
-                from PySide6.QtGui import QColor
-                tree_item.setForeground(3, QColor("#9c27b0"))
+                tree_item.setForeground(3, _NOT_DOWNLOADED_FG)
             elif not is_enabled:
                 tree_item.setText(3, "Disabled")
-                from PySide6.QtGui import QColor
-                tree_item.setForeground(3, QColor("#ff9800"))
+                tree_item.setForeground(3, _DISABLED_FG)
             else:
                 tree_item.setText(3, "Enabled")
-                from PySide6.QtGui import QColor
-                tree_item.setForeground(3, QColor("#4caf50"))
+                tree_item.setForeground(3, _ENABLED_FG)
 
             self._tree.addTopLevelItem(tree_item)
 
@@ -466,11 +471,8 @@ class ProfileEditorDialog(QDialog):
                 dl_btn = QPushButton("Download")
                 dl_btn.setFixedHeight(22)
                 dl_btn.setObjectName("downloadChipButton")
-                dl_btn.setStyleSheet(
-                    "background:#9c27b0; color:#fff; border-radius:3px;"
-                    "font-size:11px; padding:0 6px; border:none;"
-                )
-                dl_btn.clicked.connect(lambda _=False, n=mod_name: self._on_download_click(n))
+                dl_btn.setProperty("mod_name", mod_name)
+                dl_btn.clicked.connect(self._on_download_btn_clicked)
                 self._tree.setItemWidget(tree_item, 4, dl_btn)
 
         self._tree.itemChanged.connect(self._on_item_toggled)
@@ -548,6 +550,12 @@ class ProfileEditorDialog(QDialog):
             self._build_all_items()
             self._refresh_category_tabs()
 
+    @Slot()
+    def _on_download_btn_clicked(self) -> None:
+        mod_name = sender_property(self, "mod_name")
+        if mod_name:
+            self._on_download_click(mod_name)
+
     def _on_download_click(self, mod_name: str) -> None:
         reply = QMessageBox.question(
             self,
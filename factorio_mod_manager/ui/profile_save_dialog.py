@@ -213,14 +213,19 @@ class SaveProfileDialog(QDialog):
         if self._tree is None or self._search_edit is None:
             return
         query = self._search_edit.text().strip().lower()
-        for i in range(self._tree.topLevelItemCount()):
-            item = self._tree.topLevelItem(i)
-            if item is None:
-                continue
-            text = item.text(1).lower()
-            raw = (item.data(0, Qt.ItemDataRole.UserRole) or "").lower()
-            hidden = bool(query) and query not in text and query not in raw
-            item.setHidden(hidden)
+        self._tree.setUpdatesEnabled(False)
+        try:
+            for i in range(self._tree.topLevelItemCount()):
+                item = self._tree.topLevelItem(i)
+                if item is None:
+                    continue
+                text = item.text(1).lower()
+                raw = (item.data(0, Qt.ItemDataRole.UserRole) or "").lower()
+                hidden = bool(query) and query not in text and query not in raw
+                if item.isHidden() != hidden:
+                    item.setHidden(hidden)
+        finally:
+            self._tree.setUpdatesEnabled(True)
         self._update_count()
 
     # ------------------------------------------------------------------
@@ -231,12 +236,18 @@ class SaveProfileDialog(QDialog):
         if self._tree is None:
             return
         state = Qt.CheckState.Checked if checked else Qt.CheckState.Unchecked
+        # One repaint for the whole batch; rows already in the target state
+        # are skipped so they cost no model change at all.
         self._tree.blockSignals(True)
-        for i in range(self._tree.topLevelItemCount()):
-            item = self._tree.topLevelItem(i)
-            if item and not item.isHidden():
-                item.setCheckState(0, state)
-        self._tree.blockSignals(False)
+        self._tree.setUpdatesEnabled(False)
+        try:
+            for i in range(self._tree.topLevelItemCount()):
+                item = self._tree.topLevelItem(i)
+                if item and not item.isHidden() and item.checkState(0) != state:
+                    item.setCheckState(0, state)
+        finally:
+            self._tree.setUpdatesEnabled(True)
+            self._tree.blockSignals(False)
         self._update_count()
 
     # ------------------------------------------------------------------
@@ -10,7 +10,7 @@ from __future__ import annotations
 import logging
 from typing import List, Optional
 
-from PySide6.QtCore import QObject, Signal
+from PySide6.QtCore import QObject, QTimer, Signal
 
 from ..core.queue_models import (
     OperationState,
@@ -46,10 +46,18 @@ class QueueController(QObject):
     # items before oldest are pruned.
     _RETENTION_LIMIT = 50
 
+    # Progress-only updates are broadcast at most this often (~20 Hz)
+    _PROGRESS_INTERVAL_MS = 50
+
     def __init__(self, parent: Optional[QObject] = None) -> None:
         super().__init__(parent)
         # Ordered list: earlier == higher priority in queue
         self._operations: List[QueueOperation] = []
+        # Coalesces report_progress() bursts into one queue_changed per tick
+        self._progress_timer = QTimer(self)
+        self._progress_timer.setSingleShot(True)
+        self._progress_timer.setInterval(self._PROGRESS_INTERVAL_MS)
+        self._progress_timer.timeout.connect(self._emit_queue_changed)
 
     # ------------------------------------------------------------------
     # Enqueue
@@ -59,7 +67,7 @@ class QueueController(QObject):
         """Add *operation* to the end of the queue and return its id."""
         self._operations.append(operation)
         self._emit_badge()
-        self.queue_changed.emit(list(self._operations))
+        self._emit_queue_changed()
         return operation.id
 
     def batch_enqueue(self, operations: List[QueueOperation]) -> List[str]:
@@ -74,7 +82,7 @@ class QueueController(QObject):
             ids.append(op.id)
         if operations:
             self._emit_badge()
-            self.queue_changed.emit(list(self._operations))
+            self._emit_queue_changed()
         return ids
 
     def update_label(self, operation_id: str, new_label: str) -> None:
@@ -82,7 +90,7 @@ class QueueController(QObject):
         op = self._by_id(operation_id)
         if op is not None:
             op.label = new_label
-            self.queue_changed.emit(list(self._operations))
+            self._emit_queue_changed()
 
     # ------------------------------------------------------------------
     # Lifecycle transitions
@@ -111,11 +119,19 @@ class QueueController(QObject):
         return started
 
     def report_progress(self, operation_id: str, progress: int) -> None:
-        """Update progress (0-100) for a running operation."""
+        """Update progress (0-100) for a running operation.
+
+        The value is stored immediately; ``queue_changed`` follows on the next
+        progress tick, so a burst of reports costs one broadcast.
+        """
         op = self._by_id(operation_id)
         if op and op.state == OperationState.RUNNING:
-            op.progress = max(0, min(100, progress))
-            self.queue_changed.emit(list(self._operations))
+            progress = max(0, min(100, progress))
+            if op.progress == progress:
+                return
+            op.progress = progress
+            if not self._progress_timer.isActive():
+                self._progress_timer.start()
 
     def complete(self, operation_id: str, result: Optional[QueueResult] = None) -> None:
         """Mark operation as COMPLETED, optionally attaching undo metadata."""
@@ -344,6 +360,11 @@ class QueueController(QObject):
 
     def _notify(self) -> None:
         self._emit_badge()
+        self._emit_queue_changed()
+
+    def _emit_queue_changed(self) -> None:
+        # Every broadcast carries the latest progress, so a pending tick is moot
+        self._progress_timer.stop()
         self.queue_changed.emit(list(self._operations))
 
     def _emit_badge(self) -> None:
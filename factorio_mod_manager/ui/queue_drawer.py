@@ -9,7 +9,7 @@ from __future__ import annotations
 import logging
 from typing import Callable, Dict, List, Optional
 
-from PySide6.QtCore import Qt, QEvent, Signal
+from PySide6.QtCore import Qt, QEvent, Signal, Slot
 from PySide6.QtWidgets import (
     QFrame,
     QHBoxLayout,
@@ -104,14 +104,17 @@ class _QueueItemCard(QFrame):
         row2.setSpacing(4)
         row2.addStretch()
 
-        op_id = operation.id
+        # Every action button shares one slot; the callback is looked up by sender
+        self._op_id = operation.id
+        self._actions: Dict[QPushButton, Callable] = {}
 
         def _btn(text: str, cb: Callable, accessible: str) -> QPushButton:
             b = QPushButton(text)
             b.setFlat(True)
             b.setObjectName("cardActionBtn")
             b.setAccessibleName(accessible)
-            b.clicked.connect(lambda: cb(op_id))
+            self._actions[b] = cb
+            b.clicked.connect(self._on_action_clicked)
             row2.addWidget(b)
             return b
 
@@ -137,6 +140,12 @@ class _QueueItemCard(QFrame):
         if row2.count() > 1:  # >1 means at least one action button
             layout.addLayout(row2)
 
+    @Slot()
+    def _on_action_clicked(self) -> None:
+        cb = self._actions.get(self.sender())
+        if cb is not None:
+            cb(self._op_id)
+
 
 class QueueDrawer(QFrame):
     """Non-modal right-edge queue drawer managed by :class:`QueueController`.
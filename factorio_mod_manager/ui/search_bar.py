@@ -18,7 +18,7 @@ from PySide6.QtWidgets import (
 )
 
 from ..core import Mod
-from ..core.portal import FactorioPortalAPI, PortalAPIError
+from ..core.portal import PortalAPIError, get_portal
 
 logger = logging.getLogger(__name__)
 
@@ -42,7 +42,7 @@ class PortalSearchWorker(QThread):
             # Check for interruption before starting blocking call
             if self.isInterruptionRequested():
                 return
-            portal = FactorioPortalAPI()
+            portal = get_portal()
             results, _, _ = portal.search_mods(self._query, limit=8)
             # Check for interruption immediately after blocking call returns
             if self.isInterruptionRequested():
@@ -61,12 +61,13 @@ class PortalSearchWorker(QThread):
 # ---------------------------------------------------------------------------
 
 class _ResultRow(QWidget):
-    """Clickable result row widget emitting activated() signal."""
+    """Clickable result row widget emitting activated(mod_name, source)."""
 
-    activated = Signal()
+    activated = Signal(str, str)
 
     def __init__(self, mod_name: str, meta: str, source: str, parent=None):
         super().__init__(parent)
+        self._mod_name = mod_name
         self._source = source
         layout = QHBoxLayout(self)
         layout.setContentsMargins(12, 6, 12, 6)
@@ -81,10 +82,10 @@ class _ResultRow(QWidget):
         self.setCursor(Qt.CursorShape.PointingHandCursor)
 
     def mousePressEvent(self, event) -> None:  # type: ignore[override]
-        self.activated.emit()
+        self.activate()
 
     def activate(self) -> None:
-        self.activated.emit()
+        self.activated.emit(self._mod_name, self._source)
 
     def set_focused(self, focused: bool) -> None:
         self.setProperty("focused", focused)
@@ -201,13 +202,12 @@ class SearchResultsPopup(QFrame):
 
     def _add_result_row(self, mod_name: str, meta: str, source: str) -> None:
         row = _ResultRow(mod_name, meta, source)
-        row.activated.connect(
-            lambda n=mod_name, s=source: self._on_result_activated(n, s)
-        )
+        row.activated.connect(self._on_result_activated)
         insert_at = self._content_layout.count() - 1  # before stretch
         self._content_layout.insertWidget(insert_at, row)
         self._rows.append(row)
 
+    @Slot(str, str)
     def _on_result_activated(self, mod_name: str, source: str) -> None:
         self.result_selected.emit(mod_name, source)
         self.close()
@@ -1,9 +1,10 @@
 """Custom UI widgets — Qt implementation."""
 from __future__ import annotations
 
-from typing import Callable, Optional
+import html as html_lib
+from typing import Any, Callable, Optional
 
-from PySide6.QtCore import QPropertyAnimation, QTimer, Signal, Qt
+from PySide6.QtCore import QObject, QPropertyAnimation, QTimer, Signal, Qt
 from PySide6.QtWidgets import (
     QFrame,
     QGraphicsOpacityEffect,
@@ -35,6 +36,42 @@ _ICON_COLORS: dict[str, str] = {
     "info": "#0078d4",
 }
 
+# Operation-console line colours per log level (Checker op log, Downloader console)
+_LEVEL_COLORS: dict[str, str] = {
+    "DEBUG":    "#b0b0b0",
+    "INFO":     "#e0e0e0",
+    "WARNING":  "#ffad00",
+    "ERROR":    "#d13438",
+    "CRITICAL": "#d13438",
+    "SUCCESS":  "#4ec952",
+}
+
+# Opening tag per level, built once; one <div> per line keeps each line its
+# own block for the consoles' line caps
+_LEVEL_DIVS: dict[str, str] = {
+    level: f'<div style="color:{color};">' for level, color in _LEVEL_COLORS.items()
+}
+_DEFAULT_DIV = _LEVEL_DIVS["INFO"]
+
+
+def console_line_html(message: str, level: str) -> str:
+    """One escaped, level-coloured console line as a <div> block."""
+    return f"{_LEVEL_DIVS.get(level.upper(), _DEFAULT_DIV)}{html_lib.escape(message)}</div>"
+
+
+def download_chip_qss(colour: str) -> str:
+    """Style for every ``downloadChipButton`` row button, set once on the parent view."""
+    return (
+        "QPushButton#downloadChipButton {"
+        f" background:{colour}; color:#fff; border-radius:3px;"
+        " font-size:11px; padding:0 6px; border:none; }"
+    )
+
+
+def sender_property(receiver: QObject, name: str) -> Any:
+    """Property *name* of the button behind a shared per-row slot on *receiver*."""
+    return receiver.sender().property(name)
+
 
 class Notification(QFrame):
     """Toast-style notification overlay widget with optional auto-dismiss fade.
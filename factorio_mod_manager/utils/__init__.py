@@ -5,7 +5,9 @@ from .helpers import (
     parse_mod_info,
     extract_version_from_filename,
     format_file_size,
+    dir_size,
     validate_mod_url,
+    mod_name_from_url,
     is_online,
     check_factorio_portal_status,
 )
@@ -17,7 +19,9 @@ __all__ = [
     "parse_mod_info",
     "extract_version_from_filename",
     "format_file_size",
+    "dir_size",
     "validate_mod_url",
+    "mod_name_from_url",
     "is_online",
     "check_factorio_portal_status",
 ]
@@ -1,11 +1,16 @@
 """Helper utilities for Factorio Mod Manager."""
 import json
+import os
+import re
 import zipfile
 import socket
 from pathlib import Path
 from typing import Dict, Optional, Any
 import requests # type: ignore
 
+# Mod name segment of a portal URL ("…/mod/<name>", up to "/", "?", "&" or space)
+_MOD_URL_RE = re.compile(r"/mod/([^/?&\s]+)")
+
 
 def parse_mod_info(mod_zip_path: Path) -> Optional[Dict[str, Any]]:
     """
@@ -68,6 +73,31 @@ def format_file_size(bytes_size: float) -> str:
     return f"{bytes_size:.2f} TB"
 
 
+def dir_size(path: Path) -> int:
+    """
+    Total size in bytes of every file under a directory.
+    
+    Walks with os.scandir, whose entries answer is_dir() from the directory
+    listing and cache their stat, instead of a stat() per rglob() Path.
+    
+    Args:
+        path: Directory to measure
+        
+    Returns:
+        Sum of file sizes (symlinks are not followed)
+    """
+    total = 0
+    stack = [os.fspath(path)]
+    while stack:
+        with os.scandir(stack.pop()) as entries:
+            for entry in entries:
+                if entry.is_dir(follow_symlinks=False):
+                    stack.append(entry.path)
+                else:
+                    total += entry.stat(follow_symlinks=False).st_size
+    return total
+
+
 def validate_mod_url(url: str) -> bool:
     """
     Validate if URL is a valid Factorio Mod Portal URL.
@@ -81,6 +111,20 @@ def validate_mod_url(url: str) -> bool:
     return url.startswith("https://mods.factorio.com/mod/")
 
 
+def mod_name_from_url(url: str) -> str:
+    """
+    Extract the mod name from a portal URL, or treat the input as a bare name.
+
+    Args:
+        url: A mod portal URL (e.g. https://mods.factorio.com/mod/<name>) or a mod name
+
+    Returns:
+        The mod name
+    """
+    m = _MOD_URL_RE.search(url)
+    return m.group(1) if m else url.strip()
+
+
 def is_online() -> tuple[bool, Optional[str]]:
     """
     Check if device has internet connectivity.
@@ -72,6 +72,18 @@ class TestScanEnabledState:
             mods = checker.scan_mods()
         assert mods["mod_c"].file_path.endswith(".zip.bak")
 
+    def test_mod_ready_callback_streams_each_scanned_mod(self, tmp_path):
+        _make_zip(tmp_path, "mod_a", "1.0.0")
+        _make_zip(tmp_path, "mod_b", "2.0.0", disabled=True)
+        checker = ModChecker(str(tmp_path))
+        streamed = []
+        checker.set_mod_ready_callback(streamed.append)
+        with patch.object(checker.portal, "get_mod", return_value=None):
+            mods = checker.scan_mods()
+        assert sorted(m.name for m in streamed) == ["mod_a", "mod_b"]
+        assert {m.name: m.enabled for m in streamed} == {"mod_a": True, "mod_b": False}
+        assert all(mods[m.name] is m for m in streamed)
+
 
 # ---------------------------------------------------------------------------
 # disable_mod() — renames .zip -> .zip.bak, ZIP content preserved
@@ -0,0 +1,92 @@
+"""Tests for FactorioPortalAPI: the get_mod response cache and changelog parsing."""
+from unittest.mock import MagicMock
+
+import pytest
+
+from factorio_mod_manager.core import portal as portal_mod
+from factorio_mod_manager.core.portal import FactorioPortalAPI, PortalAPIError
+
+
+def _response(status_code: int, payload: dict | None = None) -> MagicMock:
+    response = MagicMock()
+    response.status_code = status_code
+    response.json.return_value = payload
+    return response
+
+
+@pytest.fixture
+def api():
+    client = FactorioPortalAPI()
+    client.session = MagicMock()
+    return client
+
+
+class TestGetModCache:
+    def test_repeat_lookup_skips_network(self, api):
+        api.session.get.return_value = _response(200, {"name": "mod_a"})
+        assert api.get_mod("mod_a") == {"name": "mod_a"}
+        assert api.get_mod("mod_a") == {"name": "mod_a"}
+        assert api.session.get.call_count == 1
+
+    def test_expired_entry_is_refetched(self, api, monkeypatch):
+        api.session.get.return_value = _response(200, {"name": "mod_a"})
+        api.get_mod("mod_a")
+        now = portal_mod._monotonic()
+        monkeypatch.setattr(
+            portal_mod, "_monotonic", lambda: now + portal_mod._MOD_CACHE_TTL_S + 1
+        )
+        api.get_mod("mod_a")
+        assert api.session.get.call_count == 2
+
+    def test_clear_forces_refetch(self, api):
+        api.session.get.return_value = _response(200, {"name": "mod_a"})
+        api.get_mod("mod_a")
+        api.clear_mod_cache()
+        api.get_mod("mod_a")
+        assert api.session.get.call_count == 2
+
+    def test_errors_are_not_cached(self, api):
+        api.session.get.return_value = _response(404)
+        with pytest.raises(PortalAPIError):
+            api.get_mod("missing")
+        with pytest.raises(PortalAPIError):
+            api.get_mod("missing")
+        assert api.session.get.call_count == 2
+
+    def test_oldest_entry_evicted_past_max(self, api, monkeypatch):
+        monkeypatch.setattr(portal_mod, "_MOD_CACHE_MAX", 2)
+        api.session.get.side_effect = lambda url, timeout: _response(200, {"url": url})
+        for name in ("mod_a", "mod_b", "mod_c"):
+            api.get_mod(name)
+        assert list(api._mod_cache) == ["mod_b", "mod_c"]
+
+
+class TestGetModChangelog:
+    def test_multi_class_pre_blocks_are_parsed(self, api):
+        api.session.get.return_value = MagicMock(
+            status_code=200,
+            text=(
+                "<html><body><h1>Changelog</h1>"
+                '<pre class="panel-hole-combined">Version: 1.0.0\nFirst</pre>'
+                '<pre class="panel-hole-combined wide">Version: 1.1.0\nSecond</pre>'
+                '<pre class="dark panel-hole-combined">Version: 1.2.0\nThird</pre>'
+                '<pre class="other">Version: 9.9.9\nNot a changelog block</pre>'
+                "</body></html>"
+            ),
+        )
+        data = api.get_mod_changelog("mod_a")
+        assert sorted(data) == ["1.0.0", "1.1.0", "1.2.0"]
+        assert data["1.1.0"] == "Version: 1.1.0\nSecond"
+
+
+class TestGetModDependencies:
+    def test_dependency_strings_are_split_by_prefix(self, api):
+        api.session.get.return_value = _response(200, {
+            "releases": [{"info_json": {"dependencies": [
+                "base >= 2.0", "base>=2.0", "lib >= 1.0", "core>=0.5",
+                "? opt", "(?) opt2 >= 1", "! bad < 2", "space-age",
+            ]}}],
+        })
+        assert api.get_mod_dependencies("mod_a") == (
+            ["lib", "core"], ["opt", "opt2"], ["bad"], ["space-age"],
+        )
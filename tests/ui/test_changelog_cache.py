@@ -0,0 +1,165 @@
+"""Tests for the changelog cache used by ChangelogWorker."""
+import json
+import time
+
+import pytest
+
+from factorio_mod_manager.core.portal import FactorioPortalAPI
+from factorio_mod_manager.ui import mod_details_dialog as mdd
+
+
+@pytest.fixture(autouse=True)
+def clear_cache(tmp_path, monkeypatch):
+    monkeypatch.setattr(mdd, "_CHANGELOG_CACHE_FILE", tmp_path / "changelog_cache.json")
+    monkeypatch.setattr(mdd, "_changelog_cache_loaded", True)
+    mdd._changelog_cache.clear()
+    yield
+    if mdd._changelog_flush_timer is not None:
+        mdd._changelog_flush_timer.cancel()
+        mdd._changelog_flush_timer = None
+    mdd._changelog_cache.clear()
+
+
+class TestChangelogCache:
+    def test_miss_returns_none(self):
+        assert mdd._get_cached_changelog("unknown-mod") is None
+
+    def test_fresh_entry_is_returned(self):
+        data = {"1.0.0": "Version: 1.0.0"}
+        mdd._store_changelog("mod_a", data)
+        assert mdd._get_cached_changelog("mod_a") == data
+
+    def test_expired_entry_is_dropped(self, monkeypatch):
+        mdd._store_changelog("mod_a", {"1.0.0": "x"})
+        now = mdd.time.time()
+        monkeypatch.setattr(
+            mdd.time, "time", lambda: now + mdd._CHANGELOG_TTL_S + 1
+        )
+        assert mdd._get_cached_changelog("mod_a") is None
+        assert "mod_a" not in mdd._changelog_cache
+
+    def test_oldest_entry_evicted_past_max(self):
+        for i in range(mdd._CHANGELOG_CACHE_MAX + 1):
+            mdd._store_changelog(f"mod_{i}", {})
+        assert len(mdd._changelog_cache) == mdd._CHANGELOG_CACHE_MAX
+        assert mdd._get_cached_changelog("mod_0") is None
+        assert mdd._get_cached_changelog(f"mod_{mdd._CHANGELOG_CACHE_MAX}") == {}
+
+
+class TestChangelogPersistence:
+    def test_store_arms_single_flush_timer(self):
+        mdd._store_changelog("mod_a", {})
+        timer = mdd._changelog_flush_timer
+        assert timer is not None
+        mdd._store_changelog("mod_b", {})
+        assert mdd._changelog_flush_timer is timer
+
+    def test_flush_then_load_round_trips(self):
+        data = {"1.0.0": "Version: 1.0.0"}
+        mdd._store_changelog("mod_a", data)
+        mdd._flush_changelog_cache()
+        assert mdd._changelog_flush_timer is None
+
+        mdd._changelog_cache.clear()
+        mdd._load_changelog_cache()
+        assert mdd._get_cached_changelog("mod_a") == data
+
+    def test_load_skips_expired_and_malformed_entries(self):
+        now = mdd.time.time()
+        mdd._CHANGELOG_CACHE_FILE.write_text(json.dumps({
+            "fresh": {"ts": now, "data": {"1.0.0": "x"}},
+            "stale": {"ts": now - mdd._CHANGELOG_TTL_S - 1, "data": {}},
+            "broken": {"data": {}},
+        }))
+        mdd._load_changelog_cache()
+        assert list(mdd._changelog_cache) == ["fresh"]
+
+    def test_disk_cache_is_loaded_on_first_access(self, monkeypatch):
+        mdd._CHANGELOG_CACHE_FILE.write_text(json.dumps({
+            "mod_a": {"ts": mdd.time.time(), "data": {"1.0.0": "x"}},
+        }))
+        registered = []
+        monkeypatch.setattr(mdd.atexit, "register", registered.append)
+        monkeypatch.setattr(mdd, "_changelog_cache_loaded", False)
+
+        assert mdd._get_cached_changelog("mod_a") == {"1.0.0": "x"}
+        assert registered == [mdd._flush_pending_changelog_cache]
+        mdd._get_cached_changelog("mod_a")
+        assert len(registered) == 1
+
+    def test_corrupt_file_is_ignored(self):
+        mdd._CHANGELOG_CACHE_FILE.write_text("{not json")
+        mdd._load_changelog_cache()
+        assert len(mdd._changelog_cache) == 0
+
+
+class TestChangelogInflightDedup:
+    def test_concurrent_fetches_share_one_request(self, monkeypatch):
+        import threading
+
+        started = threading.Event()
+        release = threading.Event()
+        calls = []
+
+        def fake_changelog(self, mod_name):
+            calls.append(mod_name)
+            started.set()
+            release.wait(5)
+            return {"1.0.0": "Version: 1.0.0"}
+
+        monkeypatch.setattr(
+            FactorioPortalAPI, "get_mod_changelog", fake_changelog
+        )
+        results = []
+        first = threading.Thread(target=lambda: results.append(mdd._fetch_changelog("mod_a")))
+        first.start()
+        assert started.wait(5)
+        second = threading.Thread(target=lambda: results.append(mdd._fetch_changelog("mod_a")))
+        second.start()
+        release.set()
+        first.join(5)
+        second.join(5)
+
+        assert calls == ["mod_a"]
+        assert results == [{"1.0.0": "Version: 1.0.0"}] * 2
+        assert mdd._changelog_inflight == {}
+
+    def test_failure_is_not_cached(self, monkeypatch):
+        def boom(self, mod_name):
+            raise RuntimeError("offline")
+
+        monkeypatch.setattr(FactorioPortalAPI, "get_mod_changelog", boom)
+        with pytest.raises(RuntimeError):
+            mdd._fetch_changelog("mod_a")
+        assert mdd._get_cached_changelog("mod_a") is None
+        assert mdd._changelog_inflight == {}
+
+
+class TestChangelogPrefetch:
+    def test_prefetch_warms_cache(self, monkeypatch):
+        import threading
+
+        done = threading.Event()
+
+        def fake_changelog(self, mod_name):
+            done.set()
+            return {"1.0.0": "x"}
+
+        monkeypatch.setattr(FactorioPortalAPI, "get_mod_changelog", fake_changelog)
+        mdd.prefetch_changelog("mod_a")
+        assert done.wait(5)
+        for _ in range(50):
+            if mdd._get_cached_changelog("mod_a") is not None:
+                break
+            time.sleep(0.01)
+        assert mdd._get_cached_changelog("mod_a") == {"1.0.0": "x"}
+
+    def test_prefetch_skips_cached_mod(self, monkeypatch):
+        calls = []
+        monkeypatch.setattr(
+            FactorioPortalAPI, "get_mod_changelog",
+            lambda self, name: calls.append(name) or {},
+        )
+        mdd._store_changelog("mod_a", {"1.0.0": "x"})
+        mdd.prefetch_changelog("mod_a")
+        assert calls == []
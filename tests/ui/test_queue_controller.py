@@ -183,4 +183,32 @@ def test_has_failed_reflects_failed_items(controller) -> None:
     controller.fail(op.id, QueueFailure(short_description="err"))
     assert controller.has_failed() is True
     controller.skip(op.id)
-    assert controller.has_failed() is False
\ No newline at end of file
+    assert controller.has_failed() is False
+
+# ---------------------------------------------------------------------------
+# Progress reports are coalesced into one queue_changed per tick
+# ---------------------------------------------------------------------------
+
+def test_progress_reports_are_coalesced(controller, qapp) -> None:
+    op = make_op(label="Progress")
+    controller.enqueue(op)
+    controller.start_next()
+    emitted = []
+    controller.queue_changed.connect(lambda ops: emitted.append(op.progress))
+    for pct in range(1, 51):
+        controller.report_progress(op.id, pct)
+    assert emitted == []
+    assert controller.get_operation(op.id).progress == 50
+
+    controller._progress_timer.timeout.emit()
+    assert emitted == [50]
+
+
+def test_state_change_flushes_pending_progress(controller) -> None:
+    op = make_op(label="ProgressDone")
+    controller.enqueue(op)
+    controller.start_next()
+    controller.report_progress(op.id, 40)
+    assert controller._progress_timer.isActive()
+    controller.complete(op.id)
+    assert not controller._progress_timer.isActive()